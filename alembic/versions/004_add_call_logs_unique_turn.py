@@ -0,0 +1,49 @@
+"""
+Add unique (call_id, turn_index) constraint to call_logs.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16
+
+Позволяет писать call_logs через INSERT ... ON CONFLICT DO NOTHING,
+чтобы повторная запись тех же turns не создавала дубликаты.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Миграция call_logs:
+    1. Удалить дубликаты (call_id, turn_index), оставив самую раннюю запись
+       (created_at = NULL считается самой ранней, при равенстве решает id)
+    2. Заменить индекс idx_call_logs_call_turn уникальным ограничением
+    """
+    op.execute("""
+        DELETE FROM call_logs a
+        USING call_logs b
+        WHERE a.call_id = b.call_id
+          AND a.turn_index = b.turn_index
+          AND (COALESCE(a.created_at, '-infinity'), a.id)
+            > (COALESCE(b.created_at, '-infinity'), b.id)
+    """)
+    
+    # Уникальное ограничение создаёт свой индекс по (call_id, turn_index)
+    op.drop_index('idx_call_logs_call_turn', table_name='call_logs')
+    op.create_unique_constraint(
+        'uq_call_logs_call_turn',
+        'call_logs',
+        ['call_id', 'turn_index']
+    )
+
+
+def downgrade() -> None:
+    """Откат миграции"""
+    op.drop_constraint('uq_call_logs_call_turn', 'call_logs', type_='unique')
+    op.create_index('idx_call_logs_call_turn', 'call_logs', ['call_id', 'turn_index'])
@@ -0,0 +1,51 @@
+"""
+Notify CampaignWorker about new call tasks via LISTEN/NOTIFY.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16
+
+После INSERT в call_tasks отправляется NOTIFY call_tasks_ready с
+campaign_id в payload — воркер просыпается сразу, а не по таймеру.
+Триггер уровня statement: загрузка CSV на тысячи строк даёт по одному
+уведомлению на кампанию.
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """
+    Миграция call_tasks:
+    1. Функция notify_call_tasks_ready() — pg_notify по каждой кампании
+    2. Триггер AFTER INSERT ... FOR EACH STATEMENT
+    """
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_call_tasks_ready() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('call_tasks_ready', campaign_id::text)
+            FROM (SELECT DISTINCT campaign_id FROM new_tasks) AS campaigns;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE TRIGGER call_tasks_ready_notify
+        AFTER INSERT ON call_tasks
+        REFERENCING NEW TABLE AS new_tasks
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION notify_call_tasks_ready()
+    """)
+
+
+def downgrade() -> None:
+    """Откат миграции"""
+    op.execute("DROP TRIGGER IF EXISTS call_tasks_ready_notify ON call_tasks")
+    op.execute("DROP FUNCTION IF EXISTS notify_call_tasks_ready()")
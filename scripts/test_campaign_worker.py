@@ -1,8 +1,10 @@
 """
 Тестовый скрипт для CampaignWorker.
 
-Этот скрипт демонстрирует работу CampaignWorker в упрощённом режиме
-(без реальных звонков, только симуляция).
+Этот скрипт проверяет пакетные операции CampaignService, которыми
+пользуется worker (выборка и захват задач, создание звонка, пакетное
+завершение с откатом на поштучную запись), и демонстрирует работу
+CampaignWorker в упрощённом режиме (без реальных звонков, только симуляция).
 
 Запуск:
     python scripts/test_campaign_worker.py
@@ -11,14 +13,17 @@
 import asyncio
 import sys
 import os
+from datetime import datetime, timedelta
 from pathlib import Path
 from uuid import uuid4
 
+from sqlalchemy import select
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from database.connection import get_async_session
-from database.models import Company, Skillbase, Campaign, CallTask
+from database.connection import get_async_session, get_async_session_factory
+from database.models import Company, Skillbase, Campaign, CallTask, Call
 from services.campaign_service import CampaignService
 from workers.campaign_worker import CampaignWorker
 
@@ -33,6 +38,9 @@ async def cleanup_test_data(session):
     await session.execute(
         delete(CallTask).where(CallTask.phone_number.like("+7999%"))
     )
+    await session.execute(
+        delete(Call).where(Call.callee_number.like("+7999%"))
+    )
     await session.execute(
         delete(Campaign).where(Campaign.name.like("Test Worker%"))
     )
@@ -129,6 +137,283 @@ async def create_test_campaign(session):
     return campaign.id
 
 
+def build_worker(**kwargs):
+    """Создать CampaignWorker без SIP и VoiceAgent (симуляция звонков)."""
+    return CampaignWorker(
+        session_factory=get_async_session_factory(),
+        livekit_url=os.getenv("LIVEKIT_URL", "wss://test.livekit.cloud"),
+        livekit_api_key=os.getenv("LIVEKIT_API_KEY", "test-key"),
+        livekit_api_secret=os.getenv("LIVEKIT_API_SECRET", "test-secret"),
+        sip_trunk_id=None,  # No SIP for testing
+        voice_agent_factory=None,  # No VoiceAgent for testing
+        allow_simulation=True,
+        **kwargs
+    )
+
+
+async def close_worker(worker):
+    """Закрыть ресурсы worker'а, который не запускался через start()."""
+    await worker._poll_session.close()
+    await worker.livekit_api.aclose()
+    await worker._http_session.close()
+
+
+async def load_tasks(session, campaign_id):
+    """Перечитать задачи кампании из БД, по номеру телефона."""
+    result = await session.execute(
+        select(CallTask)
+        .where(CallTask.campaign_id == campaign_id)
+        .execution_options(populate_existing=True)
+    )
+    return {task.phone_number: task for task in result.scalars().all()}
+
+
+async def load_campaign(session, campaign_id):
+    """Перечитать кампанию из БД (счётчики меняются в SQL)."""
+    result = await session.execute(
+        select(Campaign)
+        .where(Campaign.id == campaign_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+async def mark_all_in_progress(session, campaign_id):
+    """Перевести все задачи кампании в in_progress (как после захвата)."""
+    tasks = await load_tasks(session, campaign_id)
+    for task in tasks.values():
+        task.status = "in_progress"
+        task.attempt_count = 1
+    await session.commit()
+    return tasks
+
+
+def call_values(campaign, task):
+    """Значения строки calls, как их передаёт worker в start_call."""
+    return dict(
+        id=uuid4(),
+        company_id=campaign.company_id,
+        skillbase_id=campaign.skillbase_id,
+        campaign_id=campaign.id,
+        callee_number=task.phone_number,
+        direction="outbound",
+        status="initiated"
+    )
+
+
+async def test_claim_and_start_call(session):
+    """get_next_tasks_bulk + mark_in_progress_bulk + start_call."""
+    print("\n🧪 ТЕСТ 1: get_next_tasks_bulk / mark_in_progress_bulk / start_call")
+    print("-" * 70)
+    
+    await cleanup_test_data(session)
+    campaign_id = await create_test_campaign(session)
+    
+    # Retry task with the highest priority, but its time has not come yet
+    session.add(CallTask(
+        campaign_id=campaign_id,
+        phone_number="+79994444444",
+        contact_name="Повтор Позже",
+        contact_data={"test": True},
+        status="retry",
+        attempt_count=1,
+        priority=10,
+        next_attempt_at=datetime.utcnow() + timedelta(hours=1)
+    ))
+    await session.commit()
+    
+    service = CampaignService(session)
+    campaign = await load_campaign(session, campaign_id)
+    
+    tasks = await service.get_next_tasks_bulk([campaign])
+    assert len(tasks) == 1, f"Ожидалась 1 задача на кампанию, получено {len(tasks)}"
+    claimed = tasks[0]
+    assert claimed.status == "pending", (
+        "Выбрана retry-задача с next_attempt_at в будущем"
+    )
+    print(f"✅ Выбрана одна задача: {claimed.phone_number}")
+    
+    await service.mark_in_progress_bulk(tasks)
+    
+    rows = await load_tasks(session, campaign_id)
+    task = rows[claimed.phone_number]
+    assert task.status == "in_progress", f"Статус: {task.status}"
+    assert task.attempt_count == 1, f"Попыток: {task.attempt_count}"
+    assert task.last_attempt_at is not None
+    in_progress = [t for t in rows.values() if t.status == "in_progress"]
+    assert len(in_progress) == 1, f"В работе {len(in_progress)} задач"
+    assert rows["+79994444444"].status == "retry"
+    print("✅ Задача захвачена, остальные не тронуты")
+    
+    call_id = await service.start_call(task.id, call_values(campaign, task))
+    
+    rows = await load_tasks(session, campaign_id)
+    assert rows[task.phone_number].call_id == call_id, "Звонок не привязан к задаче"
+    call = await session.get(Call, call_id, populate_existing=True)
+    assert call is not None, "Строка calls не создана"
+    assert call.campaign_id == campaign_id
+    assert call.status == "initiated"
+    print(f"✅ Звонок создан и привязан: {call_id}")
+    
+    return True
+
+
+async def test_mark_completed_bulk(session):
+    """mark_completed_bulk: UPDATE ... FROM (VALUES ...) и счётчики кампании."""
+    print("\n🧪 ТЕСТ 2: mark_completed_bulk")
+    print("-" * 70)
+    
+    await cleanup_test_data(session)
+    campaign_id = await create_test_campaign(session)
+    campaign = await load_campaign(session, campaign_id)
+    t1, t2, t3 = (await mark_all_in_progress(session, campaign_id)).values()
+    
+    service = CampaignService(session)
+    c1 = await service.start_call(t1.id, call_values(campaign, t1))
+    c2 = await service.start_call(t2.id, call_values(campaign, t2))
+    
+    # t1: call_id=None keeps the linked call; t2: explicit call_id
+    await service.mark_completed_bulk([
+        (t1.id, None, "lead"),
+        (t2.id, c2, "callback"),
+    ])
+    
+    rows = await load_tasks(session, campaign_id)
+    assert rows[t1.phone_number].status == "completed"
+    assert rows[t1.phone_number].outcome == "lead"
+    assert rows[t1.phone_number].call_id == c1, "call_id=None затёр привязанный звонок"
+    assert rows[t2.phone_number].status == "completed"
+    assert rows[t2.phone_number].outcome == "callback"
+    assert rows[t2.phone_number].call_id == c2
+    assert rows[t3.phone_number].status == "in_progress", "Задача вне пакета изменена"
+    print("✅ Статусы, исходы и call_id записаны")
+    
+    campaign = await load_campaign(session, campaign_id)
+    assert campaign.completed_tasks == 2, f"completed_tasks={campaign.completed_tasks}"
+    assert campaign.failed_tasks == 0, f"failed_tasks={campaign.failed_tasks}"
+    print("✅ completed_tasks увеличен на размер пакета")
+    
+    return True
+
+
+async def test_write_completions_fallback(session):
+    """Worker пишет задачи по одной, если пакетная запись упала."""
+    print("\n🧪 ТЕСТ 3: откат на поштучную запись завершений")
+    print("-" * 70)
+    
+    await cleanup_test_data(session)
+    campaign_id = await create_test_campaign(session)
+    t1, t2, t3 = (await mark_all_in_progress(session, campaign_id)).values()
+    
+    worker = build_worker()
+    try:
+        # Outcome longer than VARCHAR(50) fails the whole bulk UPDATE
+        await worker._write_completions([
+            (t1.id, None, "lead"),
+            (t2.id, None, "x" * 60),
+            (t3.id, None, "callback"),
+        ])
+    finally:
+        await close_worker(worker)
+    
+    rows = await load_tasks(session, campaign_id)
+    assert rows[t1.phone_number].status == "completed"
+    assert rows[t1.phone_number].outcome == "lead"
+    assert rows[t2.phone_number].status == "in_progress", "Ошибочная задача записана"
+    assert rows[t3.phone_number].status == "completed"
+    assert rows[t3.phone_number].outcome == "callback"
+    print("✅ Исправные задачи записаны, ошибочная пропущена")
+    
+    campaign = await load_campaign(session, campaign_id)
+    assert campaign.completed_tasks == 2, f"completed_tasks={campaign.completed_tasks}"
+    print("✅ completed_tasks учитывает только записанные задачи")
+    
+    return True
+
+
+async def test_flush_completions_sentinel(session):
+    """Flusher записывает всё до None и останавливается на нём."""
+    print("\n🧪 ТЕСТ 4: flusher и sentinel None")
+    print("-" * 70)
+    
+    await cleanup_test_data(session)
+    campaign_id = await create_test_campaign(session)
+    t1, t2, t3 = (await mark_all_in_progress(session, campaign_id)).values()
+    
+    # Batches of 2: the sentinel arrives inside the second batch
+    worker = build_worker(completion_batch_size=2, completion_flush_interval=1.0)
+    try:
+        for task in (t1, t2, t3):
+            worker._completions.put_nowait((task.id, None, "lead"))
+        worker._completions.put_nowait(None)
+        # Anything after the sentinel is not consumed
+        worker._completions.put_nowait((uuid4(), None, "lead"))
+        
+        await asyncio.wait_for(worker._flush_completions(), timeout=10.0)
+        
+        assert worker._completions.qsize() == 1, (
+            f"В очереди осталось {worker._completions.qsize()} элементов"
+        )
+    finally:
+        await close_worker(worker)
+    
+    rows = await load_tasks(session, campaign_id)
+    statuses = [rows[t.phone_number].status for t in (t1, t2, t3)]
+    assert statuses == ["completed"] * 3, f"Статусы: {statuses}"
+    print("✅ Все завершения до sentinel записаны, flusher остановился")
+    
+    campaign = await load_campaign(session, campaign_id)
+    assert campaign.completed_tasks == 3, f"completed_tasks={campaign.completed_tasks}"
+    print("✅ completed_tasks = 3")
+    
+    return True
+
+
+async def run_bulk_tests():
+    """Запустить проверки пакетных операций."""
+    print("=" * 70)
+    print("🚀 ТЕСТИРОВАНИЕ ПАКЕТНЫХ ОПЕРАЦИЙ")
+    print("=" * 70)
+    
+    tests = [
+        ("get_next_tasks_bulk / start_call", test_claim_and_start_call),
+        ("mark_completed_bulk", test_mark_completed_bulk),
+        ("_write_completions fallback", test_write_completions_fallback),
+        ("_flush_completions sentinel", test_flush_completions_sentinel),
+    ]
+    
+    results = []
+    session = await get_async_session()
+    try:
+        for test_name, test_func in tests:
+            try:
+                success = await test_func(session)
+            except Exception as e:
+                print(f"❌ ОШИБКА: {e}")
+                import traceback
+                traceback.print_exc()
+                await session.rollback()
+                success = False
+            results.append((test_name, success))
+        
+        await cleanup_test_data(session)
+    finally:
+        await session.close()
+    
+    print("\n" + "=" * 70)
+    print("📊 ИТОГОВЫЙ ОТЧЕТ")
+    print("=" * 70)
+    
+    for test_name, success in results:
+        status = "✅ PASSED" if success else "❌ FAILED"
+        print(f"{status} - {test_name}")
+    
+    passed = sum(1 for _, success in results if success)
+    print(f"\nРезультат: {passed}/{len(results)} тестов пройдено")
+    
+    return passed == len(results)
+
+
 async def test_campaign_worker():
     """Тестировать CampaignWorker."""
     print("=" * 70)
@@ -147,18 +432,8 @@ async def test_campaign_worker():
         # Initialize CampaignWorker (without LiveKit for testing)
         print("\n🤖 Инициализация CampaignWorker...")
         
-        # Get environment variables (or use dummy values for testing)
-        livekit_url = os.getenv("LIVEKIT_URL", "wss://test.livekit.cloud")
-        livekit_api_key = os.getenv("LIVEKIT_API_KEY", "test-key")
-        livekit_api_secret = os.getenv("LIVEKIT_API_SECRET", "test-secret")
-        
-        worker = CampaignWorker(
-            db_session=session,
-            livekit_url=livekit_url,
-            livekit_api_key=livekit_api_key,
-            livekit_api_secret=livekit_api_secret,
-            sip_trunk_id=None,  # No SIP for testing
-            voice_agent_factory=None,  # No VoiceAgent for testing
+        worker = build_worker(
+            simulation_duration=5.0,  # Имитация длительности звонка
             poll_interval=2.0  # Poll every 2 seconds
         )
         
@@ -200,7 +475,6 @@ async def test_campaign_worker():
         print(f"  Провалено: {campaign.failed_tasks}")
         
         # Get tasks
-        from sqlalchemy import select
         result = await session.execute(
             select(CallTask).where(CallTask.campaign_id == campaign_id)
         )
@@ -236,5 +510,12 @@ async def test_campaign_worker():
         await session.close()
 
 
+async def main():
+    """Пакетные операции, затем симуляция worker'а."""
+    ok = await run_bulk_tests()
+    await test_campaign_worker()
+    return 0 if ok else 1
+
+
 if __name__ == "__main__":
-    asyncio.run(test_campaign_worker())
+    sys.exit(asyncio.run(main()))
@@ -63,19 +63,23 @@ def test_tables_exist():
             'call_logs'
         ]
         
+        # Один запрос на все таблицы, дальше — сравнение множеств
         with get_db() as db:
-            for table in expected_tables:
-                result = db.execute(text(
-                    f"SELECT EXISTS (SELECT FROM information_schema.tables "
-                    f"WHERE table_name = '{table}')"
-                ))
-                exists = result.scalar()
-                
-                if exists:
-                    print(f"✅ Таблица '{table}' существует")
-                else:
-                    print(f"❌ Таблица '{table}' не найдена")
-                    return False
+            result = db.execute(
+                text(
+                    "SELECT table_name FROM information_schema.tables "
+                    "WHERE table_name = ANY(:tables)"
+                ),
+                {"tables": expected_tables}
+            )
+            found = set(result.scalars())
+        
+        for table in expected_tables:
+            if table in found:
+                print(f"✅ Таблица '{table}' существует")
+            else:
+                print(f"❌ Таблица '{table}' не найдена")
+                return False
         
         print("\n✅ Все таблицы Enterprise Platform существуют")
         return True
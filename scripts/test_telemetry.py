@@ -46,7 +46,7 @@ async def test_telemetry_service():
             async def rollback(self):
                 pass
             
-            async def execute(self, query):
+            async def execute(self, query, params=None):
                 class MockResult:
                     def scalar_one_or_none(self):
                         return None
@@ -142,10 +142,70 @@ async def test_telemetry_service():
         return False
 
 
+async def test_flush_isolates_failures():
+    """Тест: ошибка одной строки не теряет метрики остальных звонков батча."""
+    print("\n" + "=" * 70)
+    print("🧪 ТЕСТ 2: TelemetryService - сбой одного звонка при flush")
+    print("=" * 70)
+    
+    try:
+        from uuid import uuid4
+        from telemetry import TelemetryService, TurnMetrics
+        
+        bad_call = uuid4()
+        
+        # Mock session: строки видны только после commit, rollback их отбрасывает
+        class FailingSession:
+            def __init__(self):
+                self.pending = []
+                self.metrics = []
+                self.logs = []
+            
+            async def execute(self, query, params=None):
+                rows = params or []
+                if any(r.get("call_id") == bad_call and "outcome" in r for r in rows):
+                    raise RuntimeError("FK violation: calls.id")
+                self.pending.extend(rows)
+            
+            async def commit(self):
+                for r in self.pending:
+                    (self.metrics if "outcome" in r else self.logs).append(r)
+                self.pending = []
+            
+            async def rollback(self):
+                self.pending = []
+        
+        session = FailingSession()
+        telemetry = TelemetryService(session)
+        
+        call_ids = [uuid4(), bad_call, uuid4()]
+        for call_id in call_ids:
+            await telemetry.record_turn(
+                call_id, TurnMetrics(turn_number=1, role="user", content="Алло")
+            )
+            metrics = await telemetry.finalize_call(call_id, "success", 0.9)
+            assert metrics is not None
+        
+        await telemetry.shutdown()
+        
+        persisted = {r["call_id"] for r in session.metrics}
+        assert persisted == {call_ids[0], call_ids[2]}, f"Persisted: {persisted}"
+        assert {r["call_id"] for r in session.logs} == persisted
+        print("✅ Метрики 2 из 3 звонков сохранены, сбойный звонок изолирован")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ Ошибка: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def test_metric_collector():
     """Тест MetricCollector."""
     print("\n" + "=" * 70)
-    print("🧪 ТЕСТ 2: MetricCollector")
+    print("🧪 ТЕСТ 3: MetricCollector")
     print("=" * 70)
     
     try:
@@ -225,7 +285,7 @@ def test_metric_collector():
 def test_cost_calculator():
     """Тест CostCalculator."""
     print("\n" + "=" * 70)
-    print("🧪 ТЕСТ 3: CostCalculator")
+    print("🧪 ТЕСТ 4: CostCalculator")
     print("=" * 70)
     
     try:
@@ -269,8 +329,17 @@ def test_cost_calculator():
         expected_livekit = Decimal("0.0080")
         assert breakdown.cost_livekit == expected_livekit, f"Expected {expected_livekit}, got {breakdown.cost_livekit}"
         
+        # Дробные длительности не усекаются до миллисекунд:
+        # 458.220597 * 0.0043 = 1.97034856..., 2870.24 / 60 * 0.004 = 0.19134933...
+        breakdown = calculator.calculate(
+            stt_duration_sec=458.220597,
+            livekit_duration_sec=2870.24
+        )
+        assert breakdown.cost_stt == Decimal("1.9703"), f"Expected 1.9703, got {breakdown.cost_stt}"
+        assert breakdown.cost_livekit == Decimal("0.1913"), f"Expected 0.1913, got {breakdown.cost_livekit}"
+
         print("✅ Все расчёты корректны")
-        
+
         # Тест 2: Оценка стоимости за минуту
         cost_per_minute = calculator.estimate_cost_per_minute(
             turns_per_minute=10,
@@ -290,10 +359,10 @@ def test_cost_calculator():
         return False
 
 
-def test_quality_metrics():
+async def test_quality_metrics():
     """Тест Quality Metrics."""
     print("\n" + "=" * 70)
-    print("🧪 ТЕСТ 4: Quality Metrics")
+    print("🧪 ТЕСТ 5: Quality Metrics")
     print("=" * 70)
     
     try:
@@ -362,6 +431,20 @@ def test_quality_metrics():
         result = classifier.classify_from_keywords(transcript)
         print(f"✅ Keyword outcome: {result.outcome} (confidence: {result.confidence:.2f})")
         
+        # Transcript classification is cached per transcript and final state
+        turns = [
+            {"role": "user", "content": "Здравствуйте"},
+            {"role": "assistant", "content": "Хотите записаться?"},
+        ]
+        first = await classifier.classify_from_transcript(turns, "booking_success")
+        again = await classifier.classify_from_transcript(list(turns), "booking_success")
+        other = await classifier.classify_from_transcript(turns, "booking_failed")
+        
+        assert again is first, "Repeated transcript should hit the cache"
+        assert first.outcome == CallOutcome.SUCCESS
+        assert other.outcome == CallOutcome.FAIL, "Cache key must include final state"
+        print(f"✅ Transcript outcome cached: {first.outcome}")
+        
         # Тест 3: QualityMetricsCollector
         print("\n📊 Тест: QualityMetricsCollector")
         collector = QualityMetricsCollector()
@@ -392,6 +475,7 @@ async def main():
     
     tests = [
         ("TelemetryService", test_telemetry_service),
+        ("TelemetryService flush", test_flush_isolates_failures),
         ("MetricCollector", test_metric_collector),
         ("CostCalculator", test_cost_calculator),
         ("QualityMetrics", test_quality_metrics),
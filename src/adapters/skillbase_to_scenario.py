@@ -31,7 +31,7 @@ class SkillbaseToScenarioAdapter:
     Конвертирует Skillbase конфигурацию в ScenarioEngine конфигурацию.
     
     Usage:
-        skillbase_config = SkillbaseConfig(**skillbase.config)
+        skillbase_config = SkillbaseConfig.model_validate(skillbase.config)
         adapter = SkillbaseToScenarioAdapter()
         scenario_config = adapter.convert(skillbase_config, skillbase.id)
     """
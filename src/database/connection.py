@@ -117,8 +117,9 @@ def get_async_engine():
     if _async_engine is None:
         _async_engine = create_async_engine(
             get_database_url(async_mode=True),
-            pool_size=5,
+            pool_size=20,
             max_overflow=10,
+            pool_pre_ping=True,  # Проверка соединения перед использованием
             echo=os.getenv("DB_ECHO", "false").lower() == "true",
         )
     return _async_engine
@@ -691,6 +691,11 @@ class CallLog(Base):
     # Timestamp
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     
+    __table_args__ = (
+        # Один turn на звонок: повторная запись (retry) игнорируется
+        UniqueConstraint("call_id", "turn_index", name="uq_call_logs_call_turn"),
+    )
+    
     # Relationships
     call = relationship("Call", backref="logs")
     
@@ -102,7 +102,10 @@ class ContextManager:
     
     def set_field(self, field_id: str, value: Any) -> None:
         """Установить значение поля."""
-        self.get_context().collected_data[field_id] = value
+        ctx = self.get_context()
+        ctx.collected_data[field_id] = value
+        if not field_id.startswith("_"):
+            ctx.public_data[field_id] = value
     
     def get_field(self, field_id: str, default: Any = None) -> Any:
         """Получить значение поля."""
@@ -203,7 +206,7 @@ class ContextManager:
         ctx = self.get_context()
         ctx.callback_requested = True
         if reason:
-            ctx.collected_data["callback_reason"] = reason
+            self.set_field("callback_reason", reason)
     
     def mark_not_target(self, reason: str) -> None:
         """Отметить как нецелевой звонок."""
@@ -215,7 +218,7 @@ class ContextManager:
         ctx = self.get_context()
         ctx.escalation_triggered = True
         if reason:
-            ctx.collected_data["escalation_reason"] = reason
+            self.set_field("escalation_reason", reason)
     
     def set_language(self, lang: str) -> None:
         """Установить язык."""
@@ -223,7 +226,7 @@ class ContextManager:
     
     def set_detected_intent(self, intent: str) -> None:
         """Установить определённый intent (для проверки переходов)."""
-        self.get_context().collected_data["_detected_intent"] = intent
+        self.set_field("_detected_intent", intent)
     
     # =========================================================================
     # Проверки лимитов
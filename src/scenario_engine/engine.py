@@ -302,11 +302,12 @@ class ScenarioEngine:
         lang = context.language
         
         # Строим системный промпт
-        system_prompt = self._build_system_prompt(state)
-        system_prompt += f"\n\nRESPOND: Generate a greeting in {'Russian' if lang == 'ru' else 'English'}."
-        system_prompt += f"\nBot name: {self.config.personality.name}"
-        system_prompt += f"\nCompany: {self.config.personality.company}"
-        system_prompt += f"\nRole: {self.config.personality.role}"
+        parts = self._system_prompt_parts(state)
+        parts.append(f"\n\nRESPOND: Generate a greeting in {'Russian' if lang == 'ru' else 'English'}.")
+        parts.append(f"\nBot name: {self.config.personality.name}")
+        parts.append(f"\nCompany: {self.config.personality.company}")
+        parts.append(f"\nRole: {self.config.personality.role}")
+        system_prompt = "".join(parts)
         
         # Генерируем через LLM
         response = self._llm.generate(
@@ -340,19 +341,21 @@ class ScenarioEngine:
         )
         
         # Строим промпт
-        system_prompt = self._build_system_prompt(state)
+        parts = self._system_prompt_parts(state)
         
         if missing_fields:
             field = missing_fields[0]
-            system_prompt += f"\n\nRESPOND: Ask for {field.id} ({field.description})"
-            system_prompt += f"\nField type: {field.type}"
+            parts.append(f"\n\nRESPOND: Ask for {field.id} ({field.description})")
+            parts.append(f"\nField type: {field.type}")
             if field.examples:
-                system_prompt += f"\nExamples: {', '.join(field.examples)}"
+                parts.append(f"\nExamples: {', '.join(field.examples)}")
         elif collected:
             # Подтвердить собранные данные
-            system_prompt += f"\n\nRESPOND: Confirm collected data: {collected}"
+            parts.append(f"\n\nRESPOND: Confirm collected data: {collected}")
         else:
-            system_prompt += f"\n\nRESPOND: Continue conversation naturally based on goal: {state.goal}"
+            parts.append(f"\n\nRESPOND: Continue conversation naturally based on goal: {state.goal}")
+        
+        system_prompt = "".join(parts)
         
         # История сообщений для LLM
         messages = self._format_messages_for_llm()
@@ -376,24 +379,34 @@ class ScenarioEngine:
         
         return response
     
-    def _build_system_prompt(self, state: StateConfig) -> str:
-        """Построить системный промпт для LLM."""
+    def _system_prompt_parts(self, state: StateConfig) -> list[str]:
+        """
+        Части системного промпта для LLM.
+        
+        Вызывающий добавляет свои части и склеивает один раз через "".join.
+        """
         personality = self.config.personality
         
-        prompt = personality.base_system_prompt or ""
-        prompt += f"\n\nYou are {personality.name}, {personality.role} at {personality.company}."
-        prompt += f"\nTone: {personality.tone}"
+        parts = [
+            personality.base_system_prompt or "",
+            f"\n\nYou are {personality.name}, {personality.role} at {personality.company}.",
+            f"\nTone: {personality.tone}",
+        ]
         
         if personality.language_style:
-            prompt += f"\nStyle: {personality.language_style}"
+            parts.append(f"\nStyle: {personality.language_style}")
         
-        prompt += f"\n\nCurrent stage: {state.name.ru}"
-        prompt += f"\nGoal: {state.goal}"
+        parts.append(f"\n\nCurrent stage: {state.name.ru}")
+        parts.append(f"\nGoal: {state.goal}")
         
         if state.system_prompt_addition:
-            prompt += f"\n\n{state.system_prompt_addition}"
+            parts.append(f"\n\n{state.system_prompt_addition}")
         
-        return prompt
+        return parts
+    
+    def _build_system_prompt(self, state: StateConfig) -> str:
+        """Построить системный промпт для LLM."""
+        return "".join(self._system_prompt_parts(state))
     
     def _format_messages_for_llm(self, limit: int = 10) -> list[dict]:
         """Форматировать историю для LLM."""
@@ -284,6 +284,9 @@ class CallContext(BaseModel):
     
     # Собранные данные
     collected_data: dict[str, Any] = Field(default_factory=dict)
+    # Те же данные без служебных полей ("_..."), для промпта.
+    # Обновляется ContextManager.set_field вместе с collected_data.
+    public_data: dict[str, Any] = Field(default_factory=dict)
     
     # Флаги
     callback_requested: bool = False
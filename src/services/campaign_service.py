@@ -10,18 +10,21 @@ This service:
 """
 
 import asyncio
+import copy
 import logging
-from typing import List, Optional, Dict, Any
+from collections import Counter
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
 from io import BytesIO
 
 import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import select, insert, update, values, column, cast, and_, or_, func, Integer, String
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import selectinload
 
-from src.database.models import Campaign, CallTask, Skillbase, Company
+from src.database.models import Campaign, CallTask, Call, Skillbase, Company
 
 logger = logging.getLogger(__name__)
 
@@ -68,8 +71,27 @@ class CampaignService:
         self.db_session = db_session
         self._rate_limit_cache: Dict[UUID, Dict[str, Any]] = {}
         self._cache_lock = asyncio.Lock()
+        # Campaigns skipped by rate limits in the last get_next_tasks_bulk call
+        self.last_rate_limited = 0
         logger.info("CampaignService initialized")
 
+    def with_session(self, db_session: AsyncSession) -> "CampaignService":
+        """
+        Get a service bound to another session.
+
+        The returned service shares rate-limit state with this one, so
+        per-task sessions still update the same concurrency counters.
+
+        Args:
+            db_session: Async database session
+
+        Returns:
+            CampaignService using db_session
+        """
+        service = copy.copy(self)
+        service.db_session = db_session
+        return service
+
     async def create(
         self,
         company_id: UUID,
@@ -609,6 +631,7 @@ class CampaignService:
                 )
                 .order_by(CallTask.priority.desc(), CallTask.created_at)
                 .limit(1)
+                .options(selectinload(CallTask.campaign))
             )
 
             task = result.scalar_one_or_none()
@@ -627,6 +650,84 @@ class CampaignService:
             )
             return None
 
+    async def get_next_tasks_bulk(self, campaigns: List[Campaign]) -> List[CallTask]:
+        """
+        Get the next pending task for each campaign in a single query.
+
+        Schedule and rate-limit checks are applied per campaign in memory,
+        then one ``DISTINCT ON (campaign_id)`` query picks the top task of
+        every eligible campaign. Rows are locked with ``SKIP LOCKED`` so
+        several workers can poll the same campaigns safely.
+
+        Args:
+            campaigns: Active campaigns (e.g. from get_active_campaigns)
+
+        Returns:
+            List of CallTask objects, at most one per campaign. The number
+            of campaigns skipped by rate limits is left in last_rate_limited.
+        """
+        eligible_ids = []
+        rate_limited = 0
+        for campaign in campaigns:
+            if not await self._is_within_schedule(campaign):
+                continue
+            if not await self._check_rate_limits(campaign):
+                rate_limited += 1
+                continue
+            eligible_ids.append(campaign.id)
+        self.last_rate_limited = rate_limited
+
+        if not eligible_ids:
+            return []
+
+        try:
+            now = datetime.utcnow()
+            is_ready = or_(
+                CallTask.status == "pending",
+                and_(
+                    CallTask.status == "retry",
+                    CallTask.next_attempt_at <= now,
+                ),
+            )
+
+            # PostgreSQL forbids FOR UPDATE together with DISTINCT,
+            # so pick ids in a subquery and lock in the outer query
+            next_ids = (
+                select(CallTask.id)
+                .where(
+                    and_(
+                        CallTask.campaign_id.in_(eligible_ids),
+                        is_ready,
+                    )
+                )
+                .distinct(CallTask.campaign_id)
+                .order_by(
+                    CallTask.campaign_id,
+                    CallTask.priority.desc(),
+                    CallTask.created_at,
+                )
+            )
+
+            result = await self.db_session.execute(
+                select(CallTask)
+                # The status check is repeated here: FOR UPDATE re-evaluates
+                # the outer WHERE on the locked row, so a task another worker
+                # claimed after the subquery snapshot is skipped
+                .where(and_(CallTask.id.in_(next_ids), is_ready))
+                .options(selectinload(CallTask.campaign))
+                .with_for_update(skip_locked=True)
+            )
+            tasks = list(result.scalars().all())
+
+            for task in tasks:
+                await self._update_rate_limit_cache(task.campaign_id)
+
+            return tasks
+
+        except Exception as e:
+            logger.error(f"Failed to get next tasks: {e}", exc_info=True)
+            return []
+
     async def _is_within_schedule(self, campaign: Campaign) -> bool:
         """Check if current time is within campaign schedule."""
         now = datetime.utcnow()
@@ -713,6 +814,144 @@ class CampaignService:
             logger.error(f"Failed to mark task in progress: {e}", exc_info=True)
             raise
 
+    async def mark_in_progress_bulk(self, tasks: List[CallTask]) -> None:
+        """
+        Mark tasks as in progress in one commit.
+
+        Use on tasks returned by get_next_tasks_bulk: the commit releases
+        their row locks only after the status change is persisted. The
+        commit is issued even for an empty list to end the transaction.
+
+        Args:
+            tasks: Tasks loaded in this service's session
+        """
+        try:
+            now = datetime.utcnow()
+            for task in tasks:
+                task.status = "in_progress"
+                task.attempt_count += 1
+                task.last_attempt_at = now
+
+            await self.db_session.commit()
+
+        except Exception as e:
+            try:
+                await self.db_session.rollback()
+            except Exception:
+                pass  # Ignore rollback errors (session may be in invalid state)
+            logger.error(f"Failed to mark tasks in progress: {e}", exc_info=True)
+
+            # Tasks stay pending - release the slots reserved for them
+            for task in tasks:
+                await self._decrement_concurrent(task.campaign_id)
+            raise
+
+    async def start_call(self, task_id: UUID, call_values: Dict[str, Any]) -> UUID:
+        """
+        Create the Call record for a task and link it in one statement.
+
+        Runs ``WITH new_call AS (INSERT INTO calls ... RETURNING id)
+        UPDATE call_tasks SET call_id = ...`` and commits.
+
+        Args:
+            task_id: CallTask ID (already marked in progress)
+            call_values: Column values for the calls row
+
+        Returns:
+            ID of the created Call
+        """
+        try:
+            new_call = insert(Call).values(**call_values).returning(Call.id).cte("new_call")
+
+            result = await self.db_session.execute(
+                update(CallTask)
+                .where(CallTask.id == task_id)
+                .values(call_id=select(new_call.c.id).scalar_subquery())
+                .add_cte(new_call)
+                .returning(CallTask.call_id)
+            )
+            call_id = result.scalar_one()
+
+            await self.db_session.commit()
+
+            return call_id
+
+        except Exception as e:
+            try:
+                await self.db_session.rollback()
+            except Exception:
+                pass  # Ignore rollback errors (session may be in invalid state)
+            logger.error(f"Failed to start call: {e}", exc_info=True)
+            raise
+
+    async def mark_completed_bulk(
+        self, completions: List[Tuple[UUID, Optional[UUID], str]]
+    ) -> None:
+        """
+        Mark several tasks as completed in one commit.
+
+        Issues one ``UPDATE ... FROM (VALUES ...)`` for the tasks and one
+        for the per-campaign completed_tasks counters.
+
+        Args:
+            completions: (task_id, call_id, outcome) tuples
+        """
+        if not completions:
+            return
+
+        try:
+            completed = values(
+                column("id", PG_UUID(as_uuid=True)),
+                column("call_id", PG_UUID(as_uuid=True)),
+                column("outcome", String),
+                name="completed",
+            ).data(completions)
+
+            result = await self.db_session.execute(
+                update(CallTask)
+                .where(CallTask.id == completed.c.id)
+                .values(
+                    status="completed",
+                    call_id=func.coalesce(
+                        cast(completed.c.call_id, PG_UUID(as_uuid=True)),
+                        CallTask.call_id,
+                    ),
+                    outcome=completed.c.outcome,
+                )
+                .returning(CallTask.campaign_id)
+                .execution_options(synchronize_session=False)
+            )
+            campaign_ids = list(result.scalars().all())
+
+            # Update campaign stats
+            if campaign_ids:
+                counts = values(
+                    column("id", PG_UUID(as_uuid=True)),
+                    column("n", Integer),
+                    name="counts",
+                ).data(list(Counter(campaign_ids).items()))
+
+                await self.db_session.execute(
+                    update(Campaign)
+                    .where(Campaign.id == counts.c.id)
+                    .values(completed_tasks=Campaign.completed_tasks + counts.c.n)
+                    .execution_options(synchronize_session=False)
+                )
+
+            await self.db_session.commit()
+
+        except Exception as e:
+            try:
+                await self.db_session.rollback()
+            except Exception:
+                pass  # Ignore rollback errors (session may be in invalid state)
+            logger.error(f"Failed to mark tasks completed: {e}", exc_info=True)
+            raise
+
+        # Decrement concurrent counters
+        for campaign_id in campaign_ids:
+            await self._decrement_concurrent(campaign_id)
+
     async def mark_completed(
         self, task_id: UUID, call_id: Optional[UUID], outcome: str
     ) -> CallTask:
@@ -731,10 +970,12 @@ class CampaignService:
                 task.call_id = call_id
             task.outcome = outcome
 
-            # Update campaign stats
-            campaign = await self.get_by_id(task.campaign_id)
-            if campaign:
-                campaign.completed_tasks += 1
+            # Update campaign stats (in SQL - concurrent sessions update the same row)
+            await self.db_session.execute(
+                update(Campaign)
+                .where(Campaign.id == task.campaign_id)
+                .values(completed_tasks=Campaign.completed_tasks + 1)
+            )
 
             await self.db_session.commit()
             await self.db_session.refresh(task)
@@ -778,8 +1019,11 @@ class CampaignService:
             else:
                 # Mark as failed
                 task.status = "failed"
-                if campaign:
-                    campaign.failed_tasks += 1
+                await self.db_session.execute(
+                    update(Campaign)
+                    .where(Campaign.id == task.campaign_id)
+                    .values(failed_tasks=Campaign.failed_tasks + 1)
+                )
 
             task.error_message = error_message
 
@@ -118,7 +118,7 @@ class SkillbaseService:
         try:
             # Validate configuration using Pydantic
             try:
-                validated_config = SkillbaseConfig(**config)
+                validated_config = SkillbaseConfig.model_validate(config)
                 config_dict = validated_config.dict()
             except ValidationError as e:
                 logger.error(
@@ -249,6 +249,32 @@ class SkillbaseService:
             )
             raise SkillbaseServiceError(f"Failed to fetch Skillbase: {e}")
     
+    async def get_version(self, skillbase_id: UUID) -> Optional[int]:
+        """
+        Get only the current version of a Skillbase.
+        
+        Cheap single-column read used to validate cached configs.
+        
+        Args:
+            skillbase_id: Skillbase UUID
+        
+        Returns:
+            Version number or None if not found
+        """
+        try:
+            result = await self.db.execute(
+                select(Skillbase.version).where(Skillbase.id == skillbase_id)
+            )
+            return result.scalar_one_or_none()
+            
+        except Exception as e:
+            logger.error(
+                "Failed to fetch Skillbase version",
+                extra={"skillbase_id": str(skillbase_id), "error": str(e)},
+                exc_info=True
+            )
+            raise SkillbaseServiceError(f"Failed to fetch Skillbase version: {e}")
+    
     async def get_by_slug(
         self,
         company_id: UUID,
@@ -405,7 +431,7 @@ class SkillbaseService:
             # Validate new config if provided
             if config is not None:
                 try:
-                    validated_config = SkillbaseConfig(**config)
+                    validated_config = SkillbaseConfig.model_validate(config)
                     skillbase.config = validated_config.dict()
                     # Increment version when config changes
                     skillbase.increment_version()
@@ -583,6 +609,6 @@ class SkillbaseService:
         **USE CASE:** Pre-validation before creating/updating
         """
         try:
-            return SkillbaseConfig(**config)
+            return SkillbaseConfig.model_validate(config)
         except ValidationError as e:
             raise SkillbaseValidationError(f"Invalid configuration: {e}")
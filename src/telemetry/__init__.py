@@ -2,7 +2,7 @@
 Telemetry module for call metrics collection and aggregation.
 """
 
-from .telemetry_service import TelemetryService, TurnMetrics
+from .telemetry_service import TelemetryService, TurnMetrics, CallTelemetrySession
 from .metric_collector import MetricCollector
 from .cost_calculator import CostCalculator, PricingConfig, CostBreakdown
 from .quality_metrics import (
@@ -17,6 +17,7 @@ from .quality_metrics import (
 __all__ = [
     "TelemetryService",
     "TurnMetrics",
+    "CallTelemetrySession",
     "MetricCollector",
     "CostCalculator",
     "PricingConfig",
@@ -8,15 +8,36 @@ This calculator:
 4. Supports different pricing tiers
 """
 
+import decimal
+import functools
 import logging
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Costs are rounded half-up to 4 decimal places (1/100 of a cent)
+_QUANT = Decimal("0.0001")
+_ROUND = ROUND_HALF_UP
+_ZERO = Decimal("0").quantize(_QUANT)
+
+# Costs are rounded to 1/_QUANT_SCALE USD
+_QUANT_SCALE = 10000
+
+# Dedicated arithmetic context; its methods dispatch straight into libmpdec
+_CTX = decimal.Context(prec=28, rounding=_ROUND)
 
-@dataclass
+if not hasattr(decimal, "__libmpdec_version__"):
+    logger.warning(
+        "C-accelerated decimal module is not available; cost calculation "
+        "will use the slow pure-Python implementation"
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class PricingConfig:
     """
     Provider pricing rates configuration.
@@ -36,8 +57,13 @@ class PricingConfig:
     # LiveKit: per minute of session
     livekit_per_minute: Decimal = Decimal("0.004")
     
-    def __post_init__(self):
-        """Validate pricing configuration."""
+    def validate(self) -> None:
+        """
+        Validate pricing configuration.
+        
+        Raises:
+            ValueError: If any rate is negative
+        """
         if self.stt_per_second < 0:
             raise ValueError("STT price cannot be negative")
         if self.llm_input_per_million < 0 or self.llm_output_per_million < 0:
@@ -48,7 +74,11 @@ class PricingConfig:
             raise ValueError("LiveKit price cannot be negative")
 
 
-@dataclass
+# Shared default pricing; built once since PricingConfig is immutable
+DEFAULT_PRICING = PricingConfig()
+
+
+@dataclass(frozen=True, slots=True)
 class CostBreakdown:
     """
     Detailed cost breakdown for a call.
@@ -61,14 +91,30 @@ class CostBreakdown:
     cost_livekit: Decimal
     cost_total: Decimal
     
+    def as_floats(self) -> tuple[float, float, float, float, float]:
+        """
+        Convert to a tuple of float values.
+        
+        Order: (stt, llm, tts, livekit, total). Cheaper than to_dict()
+        for telemetry producers that don't need the keys.
+        """
+        return (
+            float(self.cost_stt),
+            float(self.cost_llm),
+            float(self.cost_tts),
+            float(self.cost_livekit),
+            float(self.cost_total),
+        )
+    
     def to_dict(self) -> dict:
         """Convert to dictionary with float values."""
+        stt, llm, tts, livekit, total = self.as_floats()
         return {
-            "cost_stt": float(self.cost_stt),
-            "cost_llm": float(self.cost_llm),
-            "cost_tts": float(self.cost_tts),
-            "cost_livekit": float(self.cost_livekit),
-            "cost_total": float(self.cost_total),
+            "cost_stt": stt,
+            "cost_llm": llm,
+            "cost_tts": tts,
+            "cost_livekit": livekit,
+            "cost_total": total,
         }
     
     def to_cents_dict(self) -> dict:
@@ -82,6 +128,85 @@ class CostBreakdown:
         }
 
 
+def _to_cost(numerator: int, denominator: int) -> Decimal:
+    """Round an exact non-negative USD amount numerator/denominator half-up to 4 places."""
+    units = (numerator * 2 * _QUANT_SCALE + denominator) // (2 * denominator)
+    return Decimal(units).scaleb(-4)
+
+
+def _per_minute_to_per_second(rate: Decimal) -> Tuple[int, int]:
+    """Exact ratio of a per-minute USD rate expressed per second."""
+    numerator, denominator = rate.as_integer_ratio()
+    return numerator, denominator * 60
+
+
+def _duration_ratio(duration_sec: float) -> Tuple[int, int]:
+    """Exact ratio of a duration's shortest decimal repr (same value as Decimal(str(x)))."""
+    return Decimal(str(duration_sec)).as_integer_ratio()
+
+
+@functools.lru_cache(maxsize=4096)
+def _calculate_breakdown(
+    stt_duration_sec: float,
+    llm_input_tokens: int,
+    llm_output_tokens: int,
+    tts_characters: int,
+    livekit_duration_sec: float,
+    rates: Tuple[Tuple[int, int], ...]
+) -> CostBreakdown:
+    """
+    Compute a cost breakdown from usage and exact per-unit rates.
+    
+    Rates and durations are exact integer ratios, so every component is
+    computed without truncation on Python ints; Decimal is only built at the
+    end to round it. Memoized on the full argument tuple; safe because
+    CostBreakdown is frozen.
+    Rates order ((numerator, denominator) USD): (stt/sec, llm input/token,
+    llm output/token, tts/char, livekit/sec).
+    """
+    (
+        (stt_num, stt_den),
+        (llm_in_num, llm_in_den),
+        (llm_out_num, llm_out_den),
+        (tts_num, tts_den),
+        (livekit_num, livekit_den),
+    ) = rates
+    
+    # Zero usage skips the multiply and Decimal conversion entirely
+    if stt_duration_sec:
+        sec_num, sec_den = _duration_ratio(stt_duration_sec)
+        cost_stt = _to_cost(stt_num * sec_num, stt_den * sec_den)
+    else:
+        cost_stt = _ZERO
+    
+    cost_llm_input = (
+        _to_cost(llm_in_num * llm_input_tokens, llm_in_den) if llm_input_tokens else _ZERO
+    )
+    cost_llm_output = (
+        _to_cost(llm_out_num * llm_output_tokens, llm_out_den) if llm_output_tokens else _ZERO
+    )
+    cost_llm = cost_llm_input + cost_llm_output
+    
+    cost_tts = _to_cost(tts_num * tts_characters, tts_den) if tts_characters else _ZERO
+    
+    if livekit_duration_sec:
+        sec_num, sec_den = _duration_ratio(livekit_duration_sec)
+        cost_livekit = _to_cost(livekit_num * sec_num, livekit_den * sec_den)
+    else:
+        cost_livekit = _ZERO
+    
+    # Total cost
+    cost_total = cost_stt + cost_llm + cost_tts + cost_livekit
+    
+    return CostBreakdown(
+        cost_stt=cost_stt,
+        cost_llm=cost_llm,
+        cost_tts=cost_tts,
+        cost_livekit=cost_livekit,
+        cost_total=cost_total
+    )
+
+
 class CostCalculator:
     """
     Calculates call costs based on usage metrics.
@@ -93,6 +218,8 @@ class CostCalculator:
     - LiveKit (Session infrastructure)
     """
     
+    _init_logged = False
+    
     def __init__(self, pricing: Optional[PricingConfig] = None):
         """
         Initialize CostCalculator.
@@ -100,18 +227,44 @@ class CostCalculator:
         Args:
             pricing: Optional custom pricing configuration.
                     If None, uses default rates.
+        
+        Raises:
+            ValueError: If custom pricing contains negative rates
         """
-        self.pricing = pricing or PricingConfig()
-        logger.info(
-            "CostCalculator initialized",
-            extra={
-                "stt_per_second": float(self.pricing.stt_per_second),
-                "llm_input_per_million": float(self.pricing.llm_input_per_million),
-                "llm_output_per_million": float(self.pricing.llm_output_per_million),
-                "tts_per_thousand_chars": float(self.pricing.tts_per_thousand_chars),
-                "livekit_per_minute": float(self.pricing.livekit_per_minute),
-            }
+        if pricing is not None:
+            pricing.validate()
+        self.pricing = pricing or DEFAULT_PRICING
+        
+        # Per-unit rates, folded once so calculate() only multiplies
+        self._stt_per_sec = self.pricing.stt_per_second
+        self._llm_in_per_token = self.pricing.llm_input_per_million.scaleb(-6)
+        self._llm_out_per_token = self.pricing.llm_output_per_million.scaleb(-6)
+        self._tts_per_char = self.pricing.tts_per_thousand_chars.scaleb(-3)
+        self._livekit_per_sec = _CTX.divide(self.pricing.livekit_per_minute, Decimal("60"))
+        
+        # Exact integer ratios of the rates for the calculate() hot path;
+        # livekit/sec keeps the per-minute price over 60 rather than the
+        # rounded Decimal quotient
+        self._rates = (
+            self._stt_per_sec.as_integer_ratio(),
+            self._llm_in_per_token.as_integer_ratio(),
+            self._llm_out_per_token.as_integer_ratio(),
+            self._tts_per_char.as_integer_ratio(),
+            _per_minute_to_per_second(self.pricing.livekit_per_minute),
         )
+        
+        # Log pricing once per process; calculators may be created per request
+        if not CostCalculator._init_logged and logger.isEnabledFor(logging.INFO):
+            CostCalculator._init_logged = True
+            logger.info(
+                "CostCalculator initialized: stt=%s/sec, llm_input=%s/1M, "
+                "llm_output=%s/1M, tts=%s/1K chars, livekit=%s/min",
+                self.pricing.stt_per_second,
+                self.pricing.llm_input_per_million,
+                self.pricing.llm_output_per_million,
+                self.pricing.tts_per_thousand_chars,
+                self.pricing.livekit_per_minute,
+            )
     
     def calculate(
         self,
@@ -133,63 +286,54 @@ class CostCalculator:
         
         Returns:
             CostBreakdown with per-component and total costs
+        
+        Raises:
+            ValueError: If any usage value is negative
+        """
+        if (
+            stt_duration_sec < 0
+            or llm_input_tokens < 0
+            or llm_output_tokens < 0
+            or tts_characters < 0
+            or livekit_duration_sec < 0
+        ):
+            raise ValueError("Usage metrics cannot be negative")
+        
+        breakdown = _calculate_breakdown(
+            stt_duration_sec,
+            llm_input_tokens,
+            llm_output_tokens,
+            tts_characters,
+            livekit_duration_sec,
+            self._rates
+        )
+        
+        logger.debug(
+            "Cost calculated",
+            extra={
+                "stt_duration_sec": stt_duration_sec,
+                "llm_input_tokens": llm_input_tokens,
+                "llm_output_tokens": llm_output_tokens,
+                "tts_characters": tts_characters,
+                "livekit_duration_sec": livekit_duration_sec,
+                "cost_total": float(breakdown.cost_total)
+            }
+        )
+        
+        return breakdown
+    
+    def safe_calculate(self, **kwargs) -> CostBreakdown:
+        """
+        Calculate cost breakdown, returning zero costs on error.
+        
+        Args:
+            **kwargs: Same arguments as calculate()
+        
+        Returns:
+            CostBreakdown with calculated costs, or all zeros on failure
         """
         try:
-            # STT cost: duration * rate per second
-            cost_stt = (
-                self.pricing.stt_per_second * Decimal(str(stt_duration_sec))
-            ).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-            
-            # LLM cost: (input_tokens / 1M * input_rate) + (output_tokens / 1M * output_rate)
-            cost_llm_input = (
-                self.pricing.llm_input_per_million * 
-                Decimal(str(llm_input_tokens)) / Decimal("1000000")
-            ).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-            
-            cost_llm_output = (
-                self.pricing.llm_output_per_million * 
-                Decimal(str(llm_output_tokens)) / Decimal("1000000")
-            ).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-            
-            cost_llm = cost_llm_input + cost_llm_output
-            
-            # TTS cost: characters / 1000 * rate per thousand
-            cost_tts = (
-                self.pricing.tts_per_thousand_chars * 
-                Decimal(str(tts_characters)) / Decimal("1000")
-            ).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-            
-            # LiveKit cost: duration / 60 * rate per minute
-            cost_livekit = (
-                self.pricing.livekit_per_minute * 
-                Decimal(str(livekit_duration_sec)) / Decimal("60")
-            ).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
-            
-            # Total cost
-            cost_total = cost_stt + cost_llm + cost_tts + cost_livekit
-            
-            breakdown = CostBreakdown(
-                cost_stt=cost_stt,
-                cost_llm=cost_llm,
-                cost_tts=cost_tts,
-                cost_livekit=cost_livekit,
-                cost_total=cost_total
-            )
-            
-            logger.debug(
-                "Cost calculated",
-                extra={
-                    "stt_duration_sec": stt_duration_sec,
-                    "llm_input_tokens": llm_input_tokens,
-                    "llm_output_tokens": llm_output_tokens,
-                    "tts_characters": tts_characters,
-                    "livekit_duration_sec": livekit_duration_sec,
-                    "cost_total": float(cost_total)
-                }
-            )
-            
-            return breakdown
-            
+            return self.calculate(**kwargs)
         except Exception as e:
             logger.error(f"Failed to calculate costs: {e}", exc_info=True)
             # Return zero costs on error
@@ -211,7 +355,7 @@ class CostCalculator:
         Returns:
             CostBreakdown with calculated costs
         """
-        return self.calculate(
+        return self.safe_calculate(
             stt_duration_sec=metrics.get("stt_duration_sec", 0.0),
             llm_input_tokens=metrics.get("llm_input_tokens", 0),
             llm_output_tokens=metrics.get("llm_output_tokens", 0),
@@ -219,6 +363,107 @@ class CostCalculator:
             livekit_duration_sec=metrics.get("livekit_duration_sec", 0.0)
         )
     
+    def calculate_batch(
+        self,
+        stt_duration_sec: np.ndarray,
+        llm_input_tokens: np.ndarray,
+        llm_output_tokens: np.ndarray,
+        tts_characters: np.ndarray,
+        livekit_duration_sec: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate cost breakdowns for many calls in one vectorized pass.
+        
+        Intended for reporting and billing reconciliation. Uses float64
+        arithmetic, so results may differ from calculate() in the last
+        rounded digit; convert to Decimal only for rows being persisted.
+        
+        Args:
+            stt_duration_sec: STT durations in seconds, one per call
+            llm_input_tokens: LLM input tokens, one per call
+            llm_output_tokens: LLM output tokens, one per call
+            tts_characters: TTS characters, one per call
+            livekit_duration_sec: LiveKit session durations in seconds, one per call
+        
+        Returns:
+            Dictionary of float64 arrays keyed like CostBreakdown.to_dict()
+        """
+        def _round(values: np.ndarray) -> np.ndarray:
+            # Half-up to 4 decimals, matching ROUND_HALF_UP for non-negative costs
+            return np.floor(values * 10000 + 0.5) / 10000
+        
+        cost_stt = _round(
+            np.asarray(stt_duration_sec, dtype=np.float64) * float(self._stt_per_sec)
+        )
+        cost_llm = _round(
+            np.asarray(llm_input_tokens, dtype=np.float64) * float(self._llm_in_per_token)
+        ) + _round(
+            np.asarray(llm_output_tokens, dtype=np.float64) * float(self._llm_out_per_token)
+        )
+        cost_tts = _round(
+            np.asarray(tts_characters, dtype=np.float64) * float(self._tts_per_char)
+        )
+        cost_livekit = _round(
+            np.asarray(livekit_duration_sec, dtype=np.float64) * float(self._livekit_per_sec)
+        )
+        
+        return {
+            "cost_stt": cost_stt,
+            "cost_llm": cost_llm,
+            "cost_tts": cost_tts,
+            "cost_livekit": cost_livekit,
+            "cost_total": cost_stt + cost_llm + cost_tts + cost_livekit,
+        }
+    
+    def sum_many(
+        self,
+        stt_duration_sec: np.ndarray,
+        llm_input_tokens: np.ndarray,
+        llm_output_tokens: np.ndarray,
+        tts_characters: np.ndarray,
+        livekit_duration_sec: np.ndarray
+    ) -> Dict[str, float]:
+        """
+        Sum costs across many calls for reporting.
+        
+        Uses the JIT-compiled kernel from cost_kernels when numba is
+        installed. Sums are unrounded float64, so rounding error is
+        bounded but not zero; use calculate() for per-call precision.
+        
+        Args:
+            stt_duration_sec: STT durations in seconds, one per call
+            llm_input_tokens: LLM input tokens, one per call
+            llm_output_tokens: LLM output tokens, one per call
+            tts_characters: TTS characters, one per call
+            livekit_duration_sec: LiveKit session durations in seconds, one per call
+        
+        Returns:
+            Dictionary of aggregated costs keyed like CostBreakdown.to_dict()
+        """
+        # Imported on first use: cost_kernels pulls in numba, which per-call
+        # cost calculation never needs
+        from .cost_kernels import sum_costs
+        
+        stt, llm, tts, livekit, total = sum_costs(
+            np.ascontiguousarray(stt_duration_sec, dtype=np.float64),
+            np.ascontiguousarray(llm_input_tokens, dtype=np.float64),
+            np.ascontiguousarray(llm_output_tokens, dtype=np.float64),
+            np.ascontiguousarray(tts_characters, dtype=np.float64),
+            np.ascontiguousarray(livekit_duration_sec, dtype=np.float64),
+            float(self._stt_per_sec),
+            float(self._llm_in_per_token),
+            float(self._llm_out_per_token),
+            float(self._tts_per_char),
+            float(self._livekit_per_sec),
+        )
+        return {
+            "cost_stt": stt,
+            "cost_llm": llm,
+            "cost_tts": tts,
+            "cost_livekit": livekit,
+            "cost_total": total,
+        }
+    
     def estimate_cost_per_minute(
         self,
         turns_per_minute: int = 10,
@@ -239,25 +484,15 @@ class CostCalculator:
             Estimated cost per minute in USD
         """
         # Calculate per-turn costs
-        stt_per_turn = self.pricing.stt_per_second * Decimal(str(avg_user_speech_sec))
-        
-        llm_per_turn = (
-            self.pricing.llm_input_per_million * 
-            Decimal(str(avg_llm_tokens_per_turn)) / Decimal("1000000")
-        )
-        
-        tts_per_turn = (
-            self.pricing.tts_per_thousand_chars * 
-            Decimal(str(avg_bot_response_chars)) / Decimal("1000")
-        )
-        
-        livekit_per_minute = self.pricing.livekit_per_minute
+        stt_per_turn = self._stt_per_sec * Decimal(str(avg_user_speech_sec))
+        llm_per_turn = self._llm_in_per_token * Decimal(avg_llm_tokens_per_turn)
+        tts_per_turn = self._tts_per_char * Decimal(avg_bot_response_chars)
         
         # Total per minute
         cost_per_minute = (
-            (stt_per_turn + llm_per_turn + tts_per_turn) * Decimal(str(turns_per_minute)) +
-            livekit_per_minute
-        ).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+            (stt_per_turn + llm_per_turn + tts_per_turn) * Decimal(turns_per_minute) +
+            self.pricing.livekit_per_minute
+        ).quantize(_QUANT, rounding=_ROUND)
         
         logger.info(
             f"Estimated cost per minute: ${float(cost_per_minute):.4f}",
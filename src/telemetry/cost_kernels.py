@@ -0,0 +1,75 @@
+"""
+Cost kernels - Fast float64 cost aggregation for billing reports.
+
+This module:
+1. Sums per-component costs over many calls in one pass
+2. Uses a Numba JIT-compiled parallel loop when numba is installed
+3. Falls back to vectorized NumPy otherwise
+
+Results are unrounded float64 sums. Use CostCalculator.calculate() when
+per-call Decimal precision is required.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    numba = None
+
+
+def _sum_costs_numpy(
+    stt: np.ndarray,
+    llm_in: np.ndarray,
+    llm_out: np.ndarray,
+    tts: np.ndarray,
+    lk: np.ndarray,
+    r_stt: float,
+    r_li: float,
+    r_lo: float,
+    r_tts: float,
+    r_lk: float
+) -> Tuple[float, float, float, float, float]:
+    """Sum costs with NumPy. Returns (stt, llm, tts, livekit, total)."""
+    # Rates are constant per column, so sum first and multiply once
+    cost_stt = float(np.sum(stt)) * r_stt
+    cost_llm = float(np.sum(llm_in)) * r_li + float(np.sum(llm_out)) * r_lo
+    cost_tts = float(np.sum(tts)) * r_tts
+    cost_livekit = float(np.sum(lk)) * r_lk
+    return (
+        cost_stt,
+        cost_llm,
+        cost_tts,
+        cost_livekit,
+        cost_stt + cost_llm + cost_tts + cost_livekit,
+    )
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(fastmath=True, cache=True, parallel=True)
+    def _sum_costs_jit(stt, llm_in, llm_out, tts, lk, r_stt, r_li, r_lo, r_tts, r_lk):
+        """Sum costs with a parallel JIT loop. Returns (stt, llm, tts, livekit, total)."""
+        cost_stt = 0.0
+        cost_llm = 0.0
+        cost_tts = 0.0
+        cost_livekit = 0.0
+        for i in numba.prange(stt.shape[0]):
+            cost_stt += stt[i] * r_stt
+            cost_llm += llm_in[i] * r_li + llm_out[i] * r_lo
+            cost_tts += tts[i] * r_tts
+            cost_livekit += lk[i] * r_lk
+        return (
+            cost_stt,
+            cost_llm,
+            cost_tts,
+            cost_livekit,
+            cost_stt + cost_llm + cost_tts + cost_livekit,
+        )
+
+    sum_costs = _sum_costs_jit
+else:
+    sum_costs = _sum_costs_numpy
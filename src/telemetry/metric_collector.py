@@ -8,17 +8,20 @@ This collector:
 4. Non-blocking metric recording
 """
 
+import asyncio
 import time
 import logging
-from typing import Optional
+from typing import List, Optional, Set
 from dataclasses import dataclass
 
+from src.database.models import CallMetrics
+
 from .telemetry_service import TelemetryService, TurnMetrics
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnContext:
     """Context for tracking a single conversation turn."""
     turn_number: int
@@ -26,20 +29,62 @@ class TurnContext:
     content: str
     state_id: Optional[str] = None
     
-    # Timing markers
-    turn_start: Optional[float] = None
-    stt_start: Optional[float] = None
-    stt_first_byte: Optional[float] = None
-    llm_start: Optional[float] = None
-    llm_complete: Optional[float] = None
-    tts_start: Optional[float] = None
-    tts_first_byte: Optional[float] = None
-    audio_playback_start: Optional[float] = None
+    # Timing markers (perf_counter_ns timestamps)
+    turn_start: Optional[int] = None
+    stt_start: Optional[int] = None
+    llm_start: Optional[int] = None
+    tts_start: Optional[int] = None
+    
+    # Measured latencies (integer nanoseconds; converted to ms in finalize_turn)
+    stt_first_byte: Optional[int] = None
+    llm_complete: Optional[int] = None
+    tts_first_byte: Optional[int] = None
+    audio_playback_start: Optional[int] = None
     
     # Token counts
     llm_input_tokens: int = 0
     llm_output_tokens: int = 0
     tts_characters: int = 0
+    
+    def reset(
+        self,
+        turn_number: int,
+        role: str,
+        content: str,
+        state_id: Optional[str],
+        turn_start: Optional[int]
+    ) -> None:
+        """Reset all fields in place so a pooled context can be reused."""
+        self.turn_number = turn_number
+        self.role = role
+        self.content = content
+        self.state_id = state_id
+        self.turn_start = turn_start
+        self.stt_start = None
+        self.stt_first_byte = None
+        self.llm_start = None
+        self.llm_complete = None
+        self.tts_start = None
+        self.tts_first_byte = None
+        self.audio_playback_start = None
+        self.llm_input_tokens = 0
+        self.llm_output_tokens = 0
+        self.tts_characters = 0
+
+
+def _ns_to_ms(ns: Optional[int]) -> Optional[float]:
+    """Convert an integer nanosecond duration to float milliseconds."""
+    return ns / 1_000_000 if ns is not None else None
+
+
+# Max finished TurnContext objects kept for reuse per collector
+TURN_POOL_SIZE = 4
+
+# Finalized turns are flushed to TelemetryService in batches of up to
+# TURN_BATCH_SIZE, or after TURN_FLUSH_INTERVAL seconds, whichever comes first
+TURN_QUEUE_SIZE = 1024
+TURN_BATCH_SIZE = 8
+TURN_FLUSH_INTERVAL = 0.5
 
 
 class MetricCollector:
@@ -62,7 +107,16 @@ class MetricCollector:
         self.telemetry = telemetry
         self._current_turn: Optional[TurnContext] = None
         self._turn_counter = 0
-        logger.debug(f"MetricCollector initialized for call {call_id}")
+        self._turn_pool: List[TurnContext] = []
+        self._pending: Set[asyncio.Task] = set()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=TURN_QUEUE_SIZE)
+        self._consumer: Optional[asyncio.Task] = None
+        
+        # Static log context, built once; dynamic fields are attached
+        # only when the record is actually going to be emitted
+        self._log_extra = {"call_id": call_id}
+        self._log = logging.LoggerAdapter(logger, self._log_extra)
+        self._log.debug("MetricCollector initialized for call %s", call_id)
     
     def start_turn(
         self, 
@@ -79,17 +133,23 @@ class MetricCollector:
             state_id: Optional state identifier
         """
         self._turn_counter += 1
-        self._current_turn = TurnContext(
-            turn_number=self._turn_counter,
-            role=role,
-            content=content,
-            state_id=state_id,
-            turn_start=time.perf_counter()
-        )
-        logger.debug(
-            f"Started turn {self._turn_counter} for call {self.call_id}",
-            extra={"call_id": self.call_id, "turn_number": self._turn_counter, "role": role}
-        )
+        if self._turn_pool:
+            ctx = self._turn_pool.pop()
+            ctx.reset(self._turn_counter, role, content, state_id, time.perf_counter_ns())
+            self._current_turn = ctx
+        else:
+            self._current_turn = TurnContext(
+                turn_number=self._turn_counter,
+                role=role,
+                content=content,
+                state_id=state_id,
+                turn_start=time.perf_counter_ns()
+            )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Started turn %d for call %s", self._turn_counter, self.call_id,
+                extra={**self._log_extra, "turn_number": self._turn_counter, "role": role}
+            )
     
     def update_turn_content(self, content: str) -> None:
         """
@@ -104,14 +164,14 @@ class MetricCollector:
     def on_user_speech_start(self) -> None:
         """Called when user starts speaking."""
         if self._current_turn:
-            self._current_turn.turn_start = time.perf_counter()
-            logger.debug(f"User speech started for call {self.call_id}")
+            self._current_turn.turn_start = time.perf_counter_ns()
+            self._log.debug("User speech started for call %s", self.call_id)
     
     def on_stt_start(self) -> None:
         """Called when STT processing starts."""
         if self._current_turn:
-            self._current_turn.stt_start = time.perf_counter()
-            logger.debug(f"STT started for call {self.call_id}")
+            self._current_turn.stt_start = time.perf_counter_ns()
+            self._log.debug("STT started for call %s", self.call_id)
     
     def on_stt_first_byte(self) -> Optional[float]:
         """
@@ -120,21 +180,23 @@ class MetricCollector:
         Returns:
             TTFB in milliseconds, or None if timing not available
         """
-        if self._current_turn and self._current_turn.stt_start:
-            ttfb = (time.perf_counter() - self._current_turn.stt_start) * 1000
-            self._current_turn.stt_first_byte = ttfb
-            logger.debug(
-                f"STT first byte for call {self.call_id}: {ttfb:.2f}ms",
-                extra={"call_id": self.call_id, "ttfb_stt": ttfb}
-            )
+        if self._current_turn and self._current_turn.stt_start is not None:
+            elapsed = time.perf_counter_ns() - self._current_turn.stt_start
+            self._current_turn.stt_first_byte = elapsed
+            ttfb = elapsed / 1_000_000
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "STT first byte for call %s: %.2fms", self.call_id, ttfb,
+                    extra={**self._log_extra, "ttfb_stt": ttfb}
+                )
             return ttfb
         return None
     
     def on_llm_start(self) -> None:
         """Called when LLM request starts."""
         if self._current_turn:
-            self._current_turn.llm_start = time.perf_counter()
-            logger.debug(f"LLM started for call {self.call_id}")
+            self._current_turn.llm_start = time.perf_counter_ns()
+            self._log.debug("LLM started for call %s", self.call_id)
     
     def on_llm_complete(
         self, 
@@ -151,20 +213,22 @@ class MetricCollector:
         Returns:
             Latency in milliseconds, or None if timing not available
         """
-        if self._current_turn and self._current_turn.llm_start:
-            latency = (time.perf_counter() - self._current_turn.llm_start) * 1000
-            self._current_turn.llm_complete = latency
+        if self._current_turn and self._current_turn.llm_start is not None:
+            elapsed = time.perf_counter_ns() - self._current_turn.llm_start
+            self._current_turn.llm_complete = elapsed
+            latency = elapsed / 1_000_000
             self._current_turn.llm_input_tokens = input_tokens
             self._current_turn.llm_output_tokens = output_tokens
-            logger.debug(
-                f"LLM complete for call {self.call_id}: {latency:.2f}ms",
-                extra={
-                    "call_id": self.call_id,
-                    "latency_llm": latency,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens
-                }
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "LLM complete for call %s: %.2fms", self.call_id, latency,
+                    extra={
+                        **self._log_extra,
+                        "latency_llm": latency,
+                        "input_tokens": input_tokens,
+                        "output_tokens": output_tokens
+                    }
+                )
             return latency
         return None
     
@@ -176,12 +240,13 @@ class MetricCollector:
             text: Text being synthesized
         """
         if self._current_turn:
-            self._current_turn.tts_start = time.perf_counter()
+            self._current_turn.tts_start = time.perf_counter_ns()
             self._current_turn.tts_characters = len(text)
-            logger.debug(
-                f"TTS started for call {self.call_id}: {len(text)} chars",
-                extra={"call_id": self.call_id, "tts_characters": len(text)}
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "TTS started for call %s: %d chars", self.call_id, len(text),
+                    extra={**self._log_extra, "tts_characters": len(text)}
+                )
     
     def on_tts_first_byte(self) -> Optional[float]:
         """
@@ -190,13 +255,15 @@ class MetricCollector:
         Returns:
             TTFB in milliseconds, or None if timing not available
         """
-        if self._current_turn and self._current_turn.tts_start:
-            ttfb = (time.perf_counter() - self._current_turn.tts_start) * 1000
-            self._current_turn.tts_first_byte = ttfb
-            logger.debug(
-                f"TTS first byte for call {self.call_id}: {ttfb:.2f}ms",
-                extra={"call_id": self.call_id, "ttfb_tts": ttfb}
-            )
+        if self._current_turn and self._current_turn.tts_start is not None:
+            elapsed = time.perf_counter_ns() - self._current_turn.tts_start
+            self._current_turn.tts_first_byte = elapsed
+            ttfb = elapsed / 1_000_000
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "TTS first byte for call %s: %.2fms", self.call_id, ttfb,
+                    extra={**self._log_extra, "ttfb_tts": ttfb}
+                )
             return ttfb
         return None
     
@@ -207,13 +274,15 @@ class MetricCollector:
         Returns:
             EOU latency in milliseconds, or None if timing not available
         """
-        if self._current_turn and self._current_turn.turn_start:
-            eou_latency = (time.perf_counter() - self._current_turn.turn_start) * 1000
-            self._current_turn.audio_playback_start = eou_latency
-            logger.debug(
-                f"Audio playback started for call {self.call_id}: {eou_latency:.2f}ms EOU",
-                extra={"call_id": self.call_id, "eou_latency": eou_latency}
-            )
+        if self._current_turn and self._current_turn.turn_start is not None:
+            elapsed = time.perf_counter_ns() - self._current_turn.turn_start
+            self._current_turn.audio_playback_start = elapsed
+            eou_latency = elapsed / 1_000_000
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Audio playback started for call %s: %.2fms EOU", self.call_id, eou_latency,
+                    extra={**self._log_extra, "eou_latency": eou_latency}
+                )
             return eou_latency
         return None
     
@@ -223,47 +292,130 @@ class MetricCollector:
         
         This method is non-blocking and safe to call from async context.
         """
-        if not self._current_turn:
-            logger.warning(f"No active turn to finalize for call {self.call_id}")
+        ctx = self._current_turn
+        if not ctx:
+            self._log.warning("No active turn to finalize for call %s", self.call_id)
             return
         
         try:
             # Create TurnMetrics from context
-            metrics = TurnMetrics(
-                turn_number=self._current_turn.turn_number,
-                role=self._current_turn.role,
-                content=self._current_turn.content,
-                state_id=self._current_turn.state_id,
-                ttfb_stt=self._current_turn.stt_first_byte,
-                latency_llm=self._current_turn.llm_complete,
-                ttfb_tts=self._current_turn.tts_first_byte,
-                eou_latency=self._current_turn.audio_playback_start,
-                llm_input_tokens=self._current_turn.llm_input_tokens,
-                llm_output_tokens=self._current_turn.llm_output_tokens,
-                tts_characters=self._current_turn.tts_characters
+            metrics = TurnMetrics.acquire(
+                turn_number=ctx.turn_number,
+                role=ctx.role,
+                content=ctx.content,
+                state_id=ctx.state_id,
+                ttfb_stt=_ns_to_ms(ctx.stt_first_byte),
+                latency_llm=_ns_to_ms(ctx.llm_complete),
+                ttfb_tts=_ns_to_ms(ctx.tts_first_byte),
+                eou_latency=_ns_to_ms(ctx.audio_playback_start),
+                llm_input_tokens=ctx.llm_input_tokens,
+                llm_output_tokens=ctx.llm_output_tokens,
+                tts_characters=ctx.tts_characters
             )
             
-            # Record to telemetry (non-blocking)
-            await self.telemetry.record_turn(self.call_id, metrics)
+            # Hand off to the batching consumer (non-blocking)
+            self._ensure_consumer()
+            try:
+                self._queue.put_nowait(metrics)
+            except asyncio.QueueFull:
+                # Queue backed up: record this turn directly; keep a
+                # reference so the task isn't garbage-collected early
+                task = asyncio.create_task(
+                    self.telemetry.record_turn(self.call_id, metrics)
+                )
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
             
-            logger.info(
-                f"Finalized turn {self._current_turn.turn_number} for call {self.call_id}",
-                extra={
-                    "call_id": self.call_id,
-                    "turn_number": self._current_turn.turn_number,
-                    "role": self._current_turn.role
-                }
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Finalized turn %d for call %s", ctx.turn_number, self.call_id,
+                    extra={
+                        **self._log_extra,
+                        "turn_number": ctx.turn_number,
+                        "role": ctx.role
+                    }
+                )
             
-            # Clear current turn
+            # Return context to the pool and clear current turn
+            if len(self._turn_pool) < TURN_POOL_SIZE:
+                self._turn_pool.append(ctx)
             self._current_turn = None
             
         except Exception as e:
-            logger.error(
-                f"Failed to finalize turn: {e}",
-                extra={"call_id": self.call_id},
-                exc_info=True
-            )
+            self._log.error("Failed to finalize turn: %s", e, exc_info=True)
+    
+    def _ensure_consumer(self) -> None:
+        """Start the background batching consumer if it isn't running."""
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.create_task(self._consume())
+    
+    async def _consume(self) -> None:
+        """
+        Drain queued turns and record them in batches.
+        
+        Exits once the queue is empty so no task outlives the call;
+        finalize_turn() starts a new consumer for the next turn.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + TURN_FLUSH_INTERVAL
+            
+            while len(batch) < TURN_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self.telemetry.record_turns_batch(self.call_id, batch)
+            except Exception as e:
+                self._log.error("Failed to record turn batch: %s", e, exc_info=True)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if self._queue.empty():
+                return
+    
+    async def close(self) -> None:
+        """
+        Flush queued turns and wait for in-flight recordings to complete.
+        
+        Call before TelemetryService.finalize_call so no turns are missed.
+        """
+        if self._consumer is not None:
+            await self._queue.join()
+            self._consumer.cancel()
+            await asyncio.gather(self._consumer, return_exceptions=True)
+            self._consumer = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+    
+    async def finalize_call(
+        self,
+        outcome: str,
+        outcome_confidence: float,
+        **kwargs
+    ) -> Optional[CallMetrics]:
+        """
+        Flush queued turns, then finalize the call in TelemetryService.
+        
+        Args:
+            outcome: Call outcome (success, fail, voicemail, no_answer, busy)
+            outcome_confidence: Confidence score for outcome (0.0-1.0)
+            **kwargs: Other TelemetryService.finalize_call arguments
+        
+        Returns:
+            CallMetrics object if successful, None otherwise
+        """
+        await self.close()
+        return await self.telemetry.finalize_call(
+            self.call_id, outcome, outcome_confidence, **kwargs
+        )
     
     def get_turn_count(self) -> int:
         """
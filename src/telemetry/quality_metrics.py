@@ -3,18 +3,111 @@ Quality Metrics - Tracks call quality indicators.
 
 This module provides:
 1. Interruption tracking (user interrupting bot)
-2. Sentiment analysis interface
+2. Sentiment analysis (placeholder or int8-quantized local model)
 3. Outcome classification
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional, List
+import re
+from typing import Dict, FrozenSet, Optional, List, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
 
+# Outcome keywords (lowercase); matched as substrings via _KEYWORD_MATCHER
+SUCCESS_KEYWORDS: FrozenSet[str] = frozenset({
+    "спасибо", "отлично", "хорошо", "договорились",
+    "записал", "записала", "подтверждаю", "согласен"
+})
+FAILURE_KEYWORDS: FrozenSet[str] = frozenset({
+    "не интересно", "не нужно", "не хочу", "откажусь",
+    "не звоните", "удалите", "отстаньте"
+})
+VOICEMAIL_KEYWORDS: FrozenSet[str] = frozenset({
+    "оставьте сообщение", "после сигнала", "голосовая почта"
+})
+
+# Token limits for sentiment inference (full transcript / single turn)
+SENTIMENT_MAX_LENGTH = 512
+SENTIMENT_TURN_MAX_LENGTH = 128
+
+# Max cached sentiment scores per analyzer (oldest evicted first)
+SENTIMENT_CACHE_SIZE = 10_000
+
+# Max cached transcript classifications per classifier (oldest evicted first)
+OUTCOME_CACHE_SIZE = 10_000
+
+# Keyword-count confidence: min(0.6 + count * 0.1, 0.95), saturating
+_KEYWORD_CONFIDENCE_MAX = 15
+_KEYWORD_CONFIDENCE = tuple(
+    min(0.6 + (i * 0.1), 0.95) for i in range(_KEYWORD_CONFIDENCE_MAX + 1)
+)
+
+# State-name indicators for classify_from_state
+_STATE_RE = re.compile(r"(?P<ok>success|complete)|(?P<fail>fail|error)|(?P<vm>voicemail)")
+
+_KEYWORD_CATEGORY: Dict[str, str] = {
+    **{kw: "success" for kw in SUCCESS_KEYWORDS},
+    **{kw: "failure" for kw in FAILURE_KEYWORDS},
+    **{kw: "voicemail" for kw in VOICEMAIL_KEYWORDS},
+}
+
+
+def _build_keyword_matcher():
+    """Build a one-pass multi-keyword matcher (Aho-Corasick or regex fallback)."""
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for kw in _KEYWORD_CATEGORY:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return automaton
+    # Zero-width lookahead tries every position; longest-first alternation
+    # picks the longest keyword starting there (shorter ones sharing that
+    # start are covered via _CONTAINED below)
+    alternation = "|".join(
+        re.escape(kw) for kw in sorted(_KEYWORD_CATEGORY, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))")
+
+
+_KEYWORD_MATCHER = _build_keyword_matcher()
+
+# Keywords that are substrings of another keyword (e.g. "записал" in "записала")
+_CONTAINED: Dict[str, FrozenSet[str]] = {
+    kw: frozenset(other for other in _KEYWORD_CATEGORY if other in kw)
+    for kw in _KEYWORD_CATEGORY
+}
+
+
+def _find_keywords(text_lower: str) -> Set[str]:
+    """
+    Find distinct outcome keywords present in text with a single scan.
+    
+    Args:
+        text_lower: Lowercased transcript text
+    
+    Returns:
+        Set of matched keywords
+    """
+    if AHOCORASICK_AVAILABLE:
+        return {kw for _, kw in _KEYWORD_MATCHER.iter(text_lower)}
+    found: Set[str] = set()
+    for m in _KEYWORD_MATCHER.finditer(text_lower):
+        found |= _CONTAINED[m.group(1)]
+    return found
+
+
 class CallOutcome(str, Enum):
     """Call outcome classification."""
     SUCCESS = "success"
@@ -25,7 +118,7 @@ class CallOutcome(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OutcomeResult:
     """Result of outcome classification."""
     outcome: CallOutcome
@@ -41,6 +134,8 @@ class InterruptionTracker:
     while the bot is still speaking.
     """
     
+    __slots__ = ("_interruption_count", "_bot_speaking", "_total_turns")
+    
     def __init__(self):
         """Initialize InterruptionTracker."""
         self._interruption_count = 0
@@ -69,10 +164,11 @@ class InterruptionTracker:
         
         if self._bot_speaking:
             self._interruption_count += 1
-            logger.info(
-                f"Interruption detected (count: {self._interruption_count})",
-                extra={"interruption_count": self._interruption_count}
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Interruption detected (count: %d)", self._interruption_count,
+                    extra={"interruption_count": self._interruption_count}
+                )
             # Bot was interrupted, stop speaking
             self._bot_speaking = False
             return True
@@ -95,18 +191,20 @@ class InterruptionTracker:
         Returns:
             Interruption rate (interruptions / total_turns)
         """
-        if self._total_turns == 0:
+        total_turns = self._total_turns
+        if not total_turns:
             return 0.0
         
-        rate = self._interruption_count / self._total_turns
-        logger.debug(
-            f"Interruption rate: {rate:.2%}",
-            extra={
-                "interruption_count": self._interruption_count,
-                "total_turns": self._total_turns,
-                "interruption_rate": rate
-            }
-        )
+        rate = self._interruption_count / total_turns
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Interruption rate: %.2f%%", rate * 100,
+                extra={
+                    "interruption_count": self._interruption_count,
+                    "total_turns": total_turns,
+                    "interruption_rate": rate
+                }
+            )
         return rate
     
     def reset(self) -> None:
@@ -119,18 +217,82 @@ class InterruptionTracker:
 
 class SentimentAnalyzer:
     """
-    Interface for sentiment analysis.
+    Sentiment analysis for call transcripts.
     
-    This is a placeholder for future sentiment analysis integration.
-    Can be implemented with external services like:
-    - OpenAI GPT-4 for sentiment
-    - Hugging Face sentiment models
-    - Custom sentiment models
+    Without a model this is a placeholder that always returns 0.0.
+    Given a Hugging Face sequence-classification checkpoint, the model is
+    loaded once, dynamically quantized to int8 (Linear layers) for CPU
+    inference, and run in a worker thread so the event loop is never blocked.
+    Scores are cached by a fingerprint of the exact input text.
     """
     
-    def __init__(self):
-        """Initialize SentimentAnalyzer."""
-        logger.info("SentimentAnalyzer initialized (placeholder)")
+    __slots__ = ("_model", "_tokenizer", "_cache")
+    
+    def __init__(self, model_path: Optional[str] = None):
+        """
+        Initialize SentimentAnalyzer.
+        
+        Args:
+            model_path: Optional path or hub id of a sequence-classification
+                model whose first label is negative and last is positive
+        
+        Raises:
+            ImportError: If model_path is given but torch/transformers are missing
+        """
+        self._model = None
+        self._tokenizer = None
+        # (max_length, blake2b digest of text) -> score; insertion-ordered
+        self._cache: Dict[Tuple[int, bytes], float] = {}
+        
+        if model_path is None:
+            logger.info("SentimentAnalyzer initialized (placeholder)")
+            return
+        
+        # Imported only when a model is requested: torch/transformers take
+        # seconds and hundreds of MB to import
+        try:
+            import torch
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "torch and transformers are required for sentiment models. "
+                "Run: pip install torch transformers"
+            ) from e
+        
+        model = AutoModelForSequenceClassification.from_pretrained(model_path)
+        # int8 dynamic quantization: ~4x smaller Linear weights, faster on CPU
+        model = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        self._model = model.eval()
+        self._tokenizer = AutoTokenizer.from_pretrained(model_path)
+        logger.info("SentimentAnalyzer initialized with int8 model %s", model_path)
+    
+    @property
+    def is_noop(self) -> bool:
+        """True while no model is loaded; callers may skip the await entirely."""
+        return self._model is None
+    
+    def _score(self, text: str, max_length: int) -> float:
+        """
+        Run the model on one text (blocking; call via asyncio.to_thread).
+        
+        Args:
+            text: Text to score
+            max_length: Token limit; input is truncated, never padded
+        
+        Returns:
+            Sentiment score from -1.0 (negative) to 1.0 (positive)
+        """
+        import torch  # already loaded by __init__
+        
+        inputs = self._tokenizer(
+            text, padding=False, truncation=True, max_length=max_length,
+            return_tensors="pt"
+        )
+        with torch.inference_mode():
+            probs = torch.softmax(self._model(**inputs).logits[0], dim=-1)
+        return float(probs[-1] - probs[0])
     
     async def analyze(self, transcript: str) -> float:
         """
@@ -142,10 +304,10 @@ class SentimentAnalyzer:
         Returns:
             Sentiment score from -1.0 (negative) to 1.0 (positive)
         """
-        # Placeholder implementation
-        # TODO: Integrate with actual sentiment analysis service
-        logger.debug("Sentiment analysis requested (not implemented)")
-        return 0.0
+        if self._model is None:
+            logger.debug("Sentiment analysis requested (no model loaded)")
+            return 0.0
+        return await self._cached_score(transcript, SENTIMENT_MAX_LENGTH)
     
     async def analyze_turn(self, text: str, role: str) -> float:
         """
@@ -158,9 +320,32 @@ class SentimentAnalyzer:
         Returns:
             Sentiment score from -1.0 (negative) to 1.0 (positive)
         """
-        # Placeholder implementation
-        logger.debug(f"Turn sentiment analysis requested for {role} (not implemented)")
-        return 0.0
+        if self._model is None:
+            logger.debug("Turn sentiment analysis requested for %s (no model loaded)", role)
+            return 0.0
+        return await self._cached_score(text, SENTIMENT_TURN_MAX_LENGTH)
+    
+    async def _cached_score(self, text: str, max_length: int) -> float:
+        """
+        Score text, reusing the result for identical input.
+        
+        Args:
+            text: Text to score
+            max_length: Token limit passed to the model
+        
+        Returns:
+            Sentiment score from -1.0 (negative) to 1.0 (positive)
+        """
+        key = (max_length, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        score = self._cache.get(key)
+        if score is not None:
+            return score
+        
+        score = await asyncio.to_thread(self._score, text, max_length)
+        if len(self._cache) >= SENTIMENT_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = score
+        return score
 
 
 class OutcomeClassifier:
@@ -173,10 +358,17 @@ class OutcomeClassifier:
     - voicemail: Reached voicemail
     - no_answer: No one answered
     - busy: Line was busy
+    
+    Transcript classifications are cached by final state and a
+    fingerprint of the turns.
     """
     
+    __slots__ = ("_cache",)
+    
     def __init__(self):
         """Initialize OutcomeClassifier."""
+        # (final_state, blake2b digest of turns) -> result; insertion-ordered
+        self._cache: Dict[Tuple[str, bytes], OutcomeResult] = {}
         logger.info("OutcomeClassifier initialized")
     
     def classify_from_state(
@@ -199,24 +391,25 @@ class OutcomeClassifier:
         # Simple heuristic-based classification
         # TODO: Implement ML-based classification
         
-        # Check for success indicators
-        if "success" in final_state.lower() or "complete" in final_state.lower():
+        # One scan over the lowercased state; success wins over failure,
+        # failure over voicemail, as before
+        found = {m.lastgroup for m in _STATE_RE.finditer(final_state.lower())}
+        
+        if "ok" in found:
             return OutcomeResult(
                 outcome=CallOutcome.SUCCESS,
                 confidence=0.9,
                 reason=f"Reached success state: {final_state}"
             )
         
-        # Check for failure indicators
-        if "fail" in final_state.lower() or "error" in final_state.lower():
+        if "fail" in found:
             return OutcomeResult(
                 outcome=CallOutcome.FAIL,
                 confidence=0.85,
                 reason=f"Reached failure state: {final_state}"
             )
         
-        # Check for voicemail indicators
-        if "voicemail" in final_state.lower():
+        if "vm" in found:
             return OutcomeResult(
                 outcome=CallOutcome.VOICEMAIL,
                 confidence=0.95,
@@ -253,6 +446,17 @@ class OutcomeClassifier:
         Returns:
             OutcomeResult with classification
         """
+        digest = hashlib.blake2b(digest_size=16)
+        for turn in transcript:
+            digest.update(str(turn.get("role", "")).encode())
+            digest.update(b"\0")
+            digest.update(str(turn.get("content", "")).encode())
+            digest.update(b"\0")
+        key = (final_state, digest.digest())
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+        
         # Placeholder for LLM-based classification
         # TODO: Implement LLM-based outcome classification
         
@@ -262,7 +466,11 @@ class OutcomeClassifier:
         turn_count = len(transcript)
         duration_sec = turn_count * 10  # Rough estimate
         
-        return self.classify_from_state(final_state, turn_count, duration_sec)
+        result = self.classify_from_state(final_state, turn_count, duration_sec)
+        if len(self._cache) >= OUTCOME_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = result
+        return result
     
     def classify_from_keywords(
         self, 
@@ -279,27 +487,13 @@ class OutcomeClassifier:
         """
         text_lower = transcript_text.lower()
         
-        # Success keywords
-        success_keywords = [
-            "спасибо", "отлично", "хорошо", "договорились",
-            "записал", "записала", "подтверждаю", "согласен"
-        ]
-        
-        # Failure keywords
-        failure_keywords = [
-            "не интересно", "не нужно", "не хочу", "откажусь",
-            "не звоните", "удалите", "отстаньте"
-        ]
-        
-        # Voicemail keywords
-        voicemail_keywords = [
-            "оставьте сообщение", "после сигнала", "голосовая почта"
-        ]
-        
-        # Count keyword matches
-        success_count = sum(1 for kw in success_keywords if kw in text_lower)
-        failure_count = sum(1 for kw in failure_keywords if kw in text_lower)
-        voicemail_count = sum(1 for kw in voicemail_keywords if kw in text_lower)
+        # Count distinct keyword matches per category in one pass
+        counts = {"success": 0, "failure": 0, "voicemail": 0}
+        for kw in _find_keywords(text_lower):
+            counts[_KEYWORD_CATEGORY[kw]] += 1
+        success_count = counts["success"]
+        failure_count = counts["failure"]
+        voicemail_count = counts["voicemail"]
         
         # Classify based on highest count
         if voicemail_count > 0:
@@ -310,7 +504,7 @@ class OutcomeClassifier:
             )
         
         if success_count > failure_count and success_count > 0:
-            confidence = min(0.6 + (success_count * 0.1), 0.95)
+            confidence = _KEYWORD_CONFIDENCE[min(success_count, _KEYWORD_CONFIDENCE_MAX)]
             return OutcomeResult(
                 outcome=CallOutcome.SUCCESS,
                 confidence=confidence,
@@ -318,7 +512,7 @@ class OutcomeClassifier:
             )
         
         if failure_count > success_count and failure_count > 0:
-            confidence = min(0.6 + (failure_count * 0.1), 0.95)
+            confidence = _KEYWORD_CONFIDENCE[min(failure_count, _KEYWORD_CONFIDENCE_MAX)]
             return OutcomeResult(
                 outcome=CallOutcome.FAIL,
                 confidence=confidence,
@@ -343,29 +537,24 @@ class QualityMetricsCollector:
     - Outcome classification
     """
     
+    __slots__ = (
+        "interruption_tracker", "sentiment_analyzer", "outcome_classifier",
+        "on_bot_speech_start", "on_bot_speech_end", "on_user_speech_start"
+    )
+    
     def __init__(self):
         """Initialize QualityMetricsCollector."""
         self.interruption_tracker = InterruptionTracker()
         self.sentiment_analyzer = SentimentAnalyzer()
         self.outcome_classifier = OutcomeClassifier()
-        logger.info("QualityMetricsCollector initialized")
-    
-    def on_bot_speech_start(self) -> None:
-        """Called when bot starts speaking."""
-        self.interruption_tracker.on_bot_speech_start()
-    
-    def on_bot_speech_end(self) -> None:
-        """Called when bot finishes speaking."""
-        self.interruption_tracker.on_bot_speech_end()
-    
-    def on_user_speech_start(self) -> bool:
-        """
-        Called when user starts speaking.
         
-        Returns:
-            True if this is an interruption
-        """
-        return self.interruption_tracker.on_user_speech_start()
+        # Speech boundary hooks are the tracker's bound methods, so each
+        # VAD event is a single call (on_user_speech_start returns True
+        # if the user interrupted the bot)
+        self.on_bot_speech_start = self.interruption_tracker.on_bot_speech_start
+        self.on_bot_speech_end = self.interruption_tracker.on_bot_speech_end
+        self.on_user_speech_start = self.interruption_tracker.on_user_speech_start
+        logger.info("QualityMetricsCollector initialized")
     
     def get_interruption_metrics(self) -> dict:
         """
@@ -389,6 +578,9 @@ class QualityMetricsCollector:
         Returns:
             Sentiment score (-1.0 to 1.0)
         """
+        # Placeholder analyzer: skip the coroutine and event-loop hop
+        if self.sentiment_analyzer.is_noop:
+            return 0.0
         return await self.sentiment_analyzer.analyze(transcript)
     
     def classify_outcome(
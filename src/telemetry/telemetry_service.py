@@ -2,28 +2,34 @@
 TelemetryService - Collects and aggregates call metrics.
 
 This service:
-1. Buffers per-turn metrics in memory during a call
-2. Aggregates metrics when call ends
+1. Keeps running per-call aggregates as turns are recorded
+2. Bulk-inserts per-turn logs in small batches
 3. Persists to call_metrics and call_logs tables
 4. Thread-safe for concurrent calls
 """
 
 import asyncio
 import logging
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
-from uuid import UUID
-from datetime import datetime
+import math
+import time
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Deque, Dict, List, Optional, Union
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta, timezone
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.database.models import CallMetrics, CallLog
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TurnMetrics:
     """Metrics for a single conversation turn."""
     turn_number: int
@@ -44,14 +50,344 @@ class TurnMetrics:
     
     # Timestamp
     timestamp: Optional[datetime] = None
+    
+    # time.monotonic_ns() when recorded without a timestamp; converted to
+    # wall-clock time only when the CallLog row is built
+    mono_ns: Optional[int] = None
+    
+    # Set only for instances handed out by acquire(); release() pools nothing
+    # else, so objects a caller built and still references are never reused
+    _pooled: bool = field(default=False, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def acquire(
+        cls,
+        turn_number: int,
+        role: str,
+        content: str,
+        **fields
+    ) -> "TurnMetrics":
+        """
+        Get a TurnMetrics from the free-list pool, or allocate one.
+        
+        Ownership passes to TelemetryService once recorded; it is released
+        back to the pool after its CallLog row has been built.
+        
+        Args:
+            turn_number: Turn number
+            role: Role for this turn (user, assistant, system)
+            content: Turn content
+            **fields: Any other TurnMetrics fields
+        
+        Returns:
+            Initialized TurnMetrics
+        """
+        try:
+            obj = _TURN_METRICS_POOL.pop()
+        except IndexError:
+            obj = cls(turn_number, role, content, **fields)
+        else:
+            obj.reset(turn_number, role, content, **fields)
+        obj._pooled = True
+        return obj
+    
+    def reset(
+        self,
+        turn_number: int,
+        role: str,
+        content: str,
+        state_id: Optional[str] = None,
+        ttfb_stt: Optional[float] = None,
+        latency_llm: Optional[float] = None,
+        ttfb_tts: Optional[float] = None,
+        eou_latency: Optional[float] = None,
+        llm_input_tokens: int = 0,
+        llm_output_tokens: int = 0,
+        tts_characters: int = 0,
+        timestamp: Optional[datetime] = None,
+        mono_ns: Optional[int] = None
+    ) -> None:
+        """Reset all fields in place so a pooled instance can be reused."""
+        self.turn_number = turn_number
+        self.role = role
+        self.content = content
+        self.state_id = state_id
+        self.ttfb_stt = ttfb_stt
+        self.latency_llm = latency_llm
+        self.ttfb_tts = ttfb_tts
+        self.eou_latency = eou_latency
+        self.llm_input_tokens = llm_input_tokens
+        self.llm_output_tokens = llm_output_tokens
+        self.tts_characters = tts_characters
+        self.timestamp = timestamp
+        self.mono_ns = mono_ns
+    
+    def release(self) -> None:
+        """
+        Return this instance to the pool; it must not be used afterwards.
+        
+        No-op for instances not obtained from acquire().
+        """
+        if not self._pooled:
+            return
+        # Drop references to per-turn strings while pooled
+        self.content = ""
+        self.state_id = None
+        _TURN_METRICS_POOL.append(self)
+
+
+# Free-list of TurnMetrics for reuse; bounded so idle memory stays small.
+# deque append/pop are atomic, so no lock is needed within one event loop.
+TURN_METRICS_POOL_SIZE = 1024
+_TURN_METRICS_POOL: Deque[TurnMetrics] = deque(maxlen=TURN_METRICS_POOL_SIZE)
+
+
+# Turns are recorded by a background writer task; the queue is bounded so a
+# stalled writer can't grow memory without limit (callers then store inline)
+TELEMETRY_QUEUE_SIZE = 10000
+TELEMETRY_WRITER_BATCH = 32
+
+# Finalized calls are written together every FINALIZE_BATCH_SIZE calls or
+# FINALIZE_FLUSH_INTERVAL seconds, whichever comes first
+FINALIZE_BATCH_SIZE = 16
+FINALIZE_FLUSH_INTERVAL = 0.1
+
+# Unflushed turns kept per call before their CallLog rows are bulk-inserted
+CALL_LOG_FLUSH_SIZE = 64
+
+# Plain Core INSERT on the CallLog table: executemany without ORM bulk
+# machinery (no mapper/identity-map bookkeeping per row). Turns already
+# written (e.g. on a retried flush) are skipped via uq_call_logs_call_turn.
+_CALL_LOG_INSERT = pg_insert(CallLog.__table__).on_conflict_do_nothing(
+    index_elements=["call_id", "turn_index"]
+)
+
+# Latency metric order used by CallAggState lists
+LATENCY_METRICS = ("ttfb_stt", "latency_llm", "ttfb_tts", "eou_latency")
+
+# C-level field extractors for aggregation loops (one call per turn)
+_LATENCY_FIELDS = attrgetter(*LATENCY_METRICS)
+_COUNTER_FIELDS = attrgetter("llm_input_tokens", "llm_output_tokens", "tts_characters")
+
+# Log-scale histogram bucket upper bounds in ms: 2^(k/4) from 1ms to ~65s
+# (~19% relative width); values above the last bound go to an overflow bucket
+LATENCY_BUCKET_BOUNDS = tuple(2 ** (k / 4) for k in range(65))
+
+
+@dataclass(slots=True)
+class CallAggState:
+    """
+    Running aggregates for one in-flight call.
+    
+    Latency lists are indexed as LATENCY_METRICS. Besides count/sum/min/max,
+    each latency keeps a fixed log-scale histogram so percentiles can be
+    estimated without storing individual samples.
+    """
+    turn_count: int = 0
+    cnt: List[int] = field(default_factory=lambda: [0] * 4)
+    tot: List[float] = field(default_factory=lambda: [0.0] * 4)
+    mn: List[float] = field(default_factory=lambda: [math.inf] * 4)
+    mx: List[float] = field(default_factory=lambda: [-math.inf] * 4)
+    hist: List[List[int]] = field(
+        default_factory=lambda: [[0] * (len(LATENCY_BUCKET_BOUNDS) + 1) for _ in range(4)]
+    )
+    llm_input_tokens: int = 0
+    llm_output_tokens: int = 0
+    tts_characters: int = 0
+    
+    def update(self, t: TurnMetrics) -> None:
+        """Fold one turn into the running statistics."""
+        cnt, tot, mn, mx, hist = self.cnt, self.tot, self.mn, self.mx, self.hist
+        for i, v in enumerate(_LATENCY_FIELDS(t)):
+            if v is not None:
+                cnt[i] += 1
+                tot[i] += v
+                hist[i][bisect_left(LATENCY_BUCKET_BOUNDS, v)] += 1
+                if v < mn[i]:
+                    mn[i] = v
+                if v > mx[i]:
+                    mx[i] = v
+        llm_input_tokens, llm_output_tokens, tts_characters = _COUNTER_FIELDS(t)
+        self.turn_count += 1
+        self.llm_input_tokens += llm_input_tokens
+        self.llm_output_tokens += llm_output_tokens
+        self.tts_characters += tts_characters
+    
+    def to_dict(self) -> dict:
+        """
+        Build the aggregate dictionary used for CallMetrics.
+        
+        Returns:
+            Dictionary with aggregated metrics, keyed by CallMetrics column
+        """
+        cnt = self.cnt
+        avg = [self.tot[i] / cnt[i] if cnt[i] else None for i in range(4)]
+        lo = [self.mn[i] if cnt[i] else None for i in range(4)]
+        hi = [self.mx[i] if cnt[i] else None for i in range(4)]
+        
+        return {
+            # Latency averages (field names match database model)
+            "ttfb_stt_avg": avg[0],
+            "latency_llm_avg": avg[1],
+            "ttfb_tts_avg": avg[2],
+            "eou_latency_avg": avg[3],
+            
+            # Latency min/max (field names match database model)
+            "ttfb_stt_min": lo[0],
+            "ttfb_stt_max": hi[0],
+            "latency_llm_min": lo[1],
+            "latency_llm_max": hi[1],
+            "ttfb_tts_min": lo[2],
+            "ttfb_tts_max": hi[2],
+            "eou_latency_min": lo[3],
+            "eou_latency_max": hi[3],
+            
+            # Token/character totals
+            "llm_input_tokens": self.llm_input_tokens,
+            "llm_output_tokens": self.llm_output_tokens,
+            "tts_characters": self.tts_characters,
+        }
+    
+    def quantile(self, metric: int, q: float) -> Optional[float]:
+        """
+        Estimate a latency quantile from the histogram.
+        
+        Args:
+            metric: Index into LATENCY_METRICS
+            q: Quantile in [0, 1]
+        
+        Returns:
+            Upper bound of the bucket holding the quantile, clamped to the
+            observed min/max, or None if the metric has no samples
+        """
+        count = self.cnt[metric]
+        if not count:
+            return None
+        
+        rank = q * count
+        seen = 0
+        for idx, n in enumerate(self.hist[metric]):
+            seen += n
+            if n and seen >= rank:
+                break
+        upper = (
+            LATENCY_BUCKET_BOUNDS[idx] if idx < len(LATENCY_BUCKET_BOUNDS)
+            else self.mx[metric]
+        )
+        return min(max(upper, self.mn[metric]), self.mx[metric])
+    
+    def percentiles(self) -> dict:
+        """
+        Estimate p50/p90/p99 for every latency metric.
+        
+        Returns:
+            Dictionary like {"ttfb_stt_p50": ..., "eou_latency_p99": ...}
+        """
+        return {
+            f"{name}_p{int(q * 100)}": self.quantile(i, q)
+            for i, name in enumerate(LATENCY_METRICS)
+            for q in (0.5, 0.9, 0.99)
+        }
+
+
+def _session_key(call_id: Union[UUID, str]) -> Union[UUID, str]:
+    """
+    Normalize a call id used to key in-flight sessions.
+    
+    Args:
+        call_id: UUID, UUID string, or any other string (e.g. a LiveKit room name)
+    
+    Returns:
+        The parsed UUID, or the string unchanged if it is not a UUID
+    """
+    if isinstance(call_id, UUID):
+        return call_id
+    try:
+        return UUID(call_id)
+    except ValueError:
+        return call_id
+
+
+class CallTelemetrySession:
+    """
+    Telemetry state owned by a single call.
+    
+    Created by TelemetryService.start_call (or implicitly on the first
+    recorded turn). All mutation happens in synchronous sections on the
+    event loop, so no lock is needed.
+    """
+    
+    __slots__ = (
+        "call_id", "agg", "buffer", "start_wall", "start_mono_ns",
+        "queued", "drained", "_service"
+    )
+    
+    def __init__(self, call_id: Union[UUID, str], service: "TelemetryService"):
+        """
+        Initialize CallTelemetrySession.
+        
+        Args:
+            call_id: Unique call identifier; only UUID ids (calls.id) are
+                persisted, other keys keep in-memory aggregates only
+            service: Owning TelemetryService
+        """
+        self.call_id = call_id
+        self.agg = CallAggState()
+        # Turns whose CallLog rows have not been inserted yet
+        self.buffer: Deque[TurnMetrics] = deque()
+        # Clock anchor: turns store monotonic offsets from this point
+        self.start_wall = datetime.now(timezone.utc)
+        self.start_mono_ns = time.monotonic_ns()
+        # Batches of this call still in the writer queue; drained is set
+        # when the writer has applied the last one
+        self.queued = 0
+        self.drained = asyncio.Event()
+        self.drained.set()
+        self._service = service
+    
+    @property
+    def persistent(self) -> bool:
+        """True if call_id is a calls.id, so CallLog/CallMetrics rows can be written."""
+        return isinstance(self.call_id, UUID)
+    
+    async def record_turn(self, metrics: TurnMetrics) -> None:
+        """
+        Record metrics for a single turn of this call (non-blocking).
+        
+        Args:
+            metrics: Turn metrics to record
+        """
+        if metrics.timestamp is None:
+            metrics.mono_ns = time.monotonic_ns()
+        await self._service._enqueue(self, [metrics])
+    
+    def wall_time(self, turn: TurnMetrics) -> datetime:
+        """
+        Get the wall-clock time of a recorded turn.
+        
+        Args:
+            turn: Turn metrics recorded for this call
+        
+        Returns:
+            The turn's own timestamp, or the call start anchor plus the
+            turn's monotonic offset
+        """
+        if turn.timestamp is not None:
+            return turn.timestamp
+        if turn.mono_ns is None:
+            return self.start_wall
+        return self.start_wall + timedelta(
+            microseconds=(turn.mono_ns - self.start_mono_ns) // 1000
+        )
 
 
 class TelemetryService:
     """
     Collects and persists call metrics.
     
-    Thread-safe service for buffering per-turn metrics and aggregating
-    them into call-level statistics.
+    Keeps one CallTelemetrySession per in-flight call with running
+    call-level statistics, and bulk-inserts per-turn CallLog rows in
+    small batches.
     """
     
     def __init__(self, db_session: AsyncSession):
@@ -62,51 +398,226 @@ class TelemetryService:
             db_session: Async database session for persistence
         """
         self.db_session = db_session
-        self._metrics_buffer: Dict[str, List[TurnMetrics]] = {}
-        self._lock = asyncio.Lock()
+        # The writer and flusher tasks share db_session; an AsyncSession
+        # must not be used concurrently, so every DB access holds this lock
+        self._db_lock = asyncio.Lock()
+        # In-flight calls; sessions are removed by finalize_call
+        self._sessions: Dict[UUID, CallTelemetrySession] = {}
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=TELEMETRY_QUEUE_SIZE)
+        self._writer: Optional[asyncio.Task] = None
+        self._finalize_buffer: List[tuple] = []
+        self._finalize_ready = asyncio.Event()
+        self._finalize_full = asyncio.Event()
+        self._flusher: Optional[asyncio.Task] = None
         logger.info("TelemetryService initialized")
     
+    def start_call(self, call_id: Union[UUID, str]) -> CallTelemetrySession:
+        """
+        Get the telemetry session for a call, creating it if needed.
+        
+        Args:
+            call_id: Unique call identifier (UUID strings are parsed; other
+                strings such as a room name are kept as-is)
+        
+        Returns:
+            CallTelemetrySession for this call
+        """
+        call_id = _session_key(call_id)
+        session = self._sessions.get(call_id)
+        if session is None:
+            session = self._sessions[call_id] = CallTelemetrySession(call_id, self)
+        return session
+    
     async def record_turn(
         self, 
-        call_id: str, 
+        call_id: Union[UUID, str], 
         metrics: TurnMetrics
     ) -> None:
         """
         Record metrics for a single turn (non-blocking).
         
+        The turn is queued for the background writer; no lock is taken
+        on the caller's path.
+        
         Args:
-            call_id: Unique call identifier
+            call_id: Unique call identifier (UUID strings are parsed; other
+                strings such as a room name are kept as-is)
             metrics: Turn metrics to record
         """
+        # Stamp a monotonic offset if no timestamp was provided
+        if metrics.timestamp is None:
+            metrics.mono_ns = time.monotonic_ns()
+        await self._enqueue(self.start_call(call_id), [metrics])
+    
+    async def record_turns_batch(
+        self,
+        call_id: Union[UUID, str],
+        batch: List[TurnMetrics]
+    ) -> None:
+        """
+        Record metrics for several turns of one call (non-blocking).
+        
+        Args:
+            call_id: Unique call identifier (UUID strings are parsed; other
+                strings such as a room name are kept as-is)
+            batch: Turn metrics to record, in turn order
+        """
+        now = None
+        for metrics in batch:
+            # Stamp a monotonic offset if no timestamp was provided
+            if metrics.timestamp is None:
+                if now is None:
+                    now = time.monotonic_ns()
+                metrics.mono_ns = now
+        await self._enqueue(self.start_call(call_id), batch)
+    
+    async def shutdown(self) -> None:
+        """
+        Drain queued turns, stop background tasks and persist finalized calls.
+        
+        Call when the service is no longer needed.
+        """
+        if self._writer is not None:
+            await self._queue.join()
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush_finalized()
+    
+    async def _enqueue(
+        self,
+        session: CallTelemetrySession,
+        batch: List[TurnMetrics]
+    ) -> None:
+        """
+        Hand turns to the background writer.
+        
+        Falls back to storing them inline if the queue is full.
+        
+        Args:
+            session: Call telemetry session
+            batch: Turn metrics to record, in turn order
+        """
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._writer_loop())
         try:
-            async with self._lock:
-                if call_id not in self._metrics_buffer:
-                    self._metrics_buffer[call_id] = []
-                
-                # Set timestamp if not provided
-                if metrics.timestamp is None:
-                    metrics.timestamp = datetime.utcnow()
-                
-                self._metrics_buffer[call_id].append(metrics)
-                
+            self._queue.put_nowait((session, batch))
+        except asyncio.QueueFull:
+            await self._store_turns(session, batch)
+        else:
+            session.queued += 1
+            session.drained.clear()
+    
+    async def _writer_loop(self) -> None:
+        """Drain queued turns into per-call aggregates and CallLog batches."""
+        while True:
+            items = [await self._queue.get()]
+            while len(items) < TELEMETRY_WRITER_BATCH and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            
+            # Group by call so each session is updated once per drain
+            grouped: Dict[CallTelemetrySession, List[TurnMetrics]] = {}
+            for session, batch in items:
+                grouped.setdefault(session, []).extend(batch)
+            
+            try:
+                for session, batch in grouped.items():
+                    await self._store_turns(session, batch)
+            finally:
+                for session, _ in items:
+                    session.queued -= 1
+                    if not session.queued:
+                        session.drained.set()
+                    self._queue.task_done()
+    
+    async def _store_turns(
+        self,
+        session: CallTelemetrySession,
+        batch: List[TurnMetrics]
+    ) -> None:
+        """
+        Fold turns into the call's aggregates and flush full CallLog batches.
+        
+        Args:
+            session: Call telemetry session
+            batch: Timestamped turn metrics, in turn order
+        """
+        call_id = session.call_id
+        try:
+            # No await until the rows are taken, so this section cannot
+            # interleave with other updates or with finalize_call
+            agg = session.agg
+            for metrics in batch:
+                agg.update(metrics)
+            
+            buffer = session.buffer
+            if session.persistent:
+                buffer.extend(batch)
+            else:
+                # No calls.id to reference: aggregates only, no CallLog rows
+                for metrics in batch:
+                    metrics.release()
+            rows = (
+                self._take_call_log_rows(session)
+                if len(buffer) >= CALL_LOG_FLUSH_SIZE else None
+            )
+            
+            if logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"Recorded turn {metrics.turn_number} for call {call_id}",
-                    extra={
-                        "call_id": call_id,
-                        "turn_number": metrics.turn_number,
-                        "role": metrics.role
-                    }
+                    "Recorded %d turns for call %s", len(batch), call_id,
+                    extra={"call_id": str(call_id), "turn_count": len(batch)}
                 )
+            
+            # Bulk-insert a full batch of CallLog rows
+            if rows:
+                await self._insert_call_logs(rows)
         except Exception as e:
             logger.error(
                 f"Failed to record turn metrics: {e}",
-                extra={"call_id": call_id},
+                extra={"call_id": str(call_id)},
                 exc_info=True
             )
     
+    async def _insert_call_logs(self, rows: List[dict]) -> None:
+        """
+        Insert CallLog rows of an in-flight call in their own transaction.
+        
+        Committing here keeps the rows out of the flusher's transaction,
+        so a failed flush_finalized() cannot roll them back.
+        
+        Args:
+            rows: Row dictionaries for a bulk insert
+        """
+        async with self._db_lock:
+            try:
+                await self.db_session.execute(_CALL_LOG_INSERT, rows)
+                await self.db_session.commit()
+            except Exception:
+                await self.db_session.rollback()
+                raise
+    
+    def get_latency_percentiles(self, call_id: Union[UUID, str]) -> Optional[dict]:
+        """
+        Estimate latency percentiles for an in-flight call.
+        
+        Turns still queued for the background writer are not included.
+        
+        Args:
+            call_id: Unique call identifier
+        
+        Returns:
+            Dictionary of p50/p90/p99 per latency metric, or None if unknown
+        """
+        session = self._sessions.get(_session_key(call_id))
+        return session.agg.percentiles() if session is not None else None
+    
     async def finalize_call(
         self, 
-        call_id: UUID,
+        call_id: Union[UUID, str, CallTelemetrySession],
         outcome: str,
         outcome_confidence: float,
         outcome_reason: Optional[str] = None,
@@ -119,7 +630,7 @@ class TelemetryService:
         Aggregate buffered metrics and persist to database.
         
         Args:
-            call_id: Unique call identifier
+            call_id: Unique call identifier, or the call's CallTelemetrySession
             outcome: Call outcome (success, fail, voicemail, no_answer, busy)
             outcome_confidence: Confidence score for outcome (0.0-1.0)
             outcome_reason: Optional reason for outcome
@@ -129,105 +640,99 @@ class TelemetryService:
             livekit_duration_sec: Total LiveKit session duration
         
         Returns:
-            CallMetrics object if successful, None otherwise
+            CallMetrics object if successful, None otherwise. The row is
+            written by the background flusher shortly after; call
+            flush_finalized() to persist immediately.
         """
+        if isinstance(call_id, CallTelemetrySession):
+            call_id = call_id.call_id
         try:
+            call_id = _session_key(call_id)
             call_id_str = str(call_id)
             
-            async with self._lock:
-                turns = self._metrics_buffer.get(call_id_str, [])
-                
-                if not turns:
-                    logger.warning(
-                        f"No metrics found for call {call_id}",
-                        extra={"call_id": call_id_str}
-                    )
-                    return None
-                
-                # Calculate aggregates
-                aggregates = self._calculate_aggregates(turns)
-                
-                # Calculate interruption rate
-                turn_count = len(turns)
-                interruption_rate = (
-                    interruption_count / turn_count if turn_count > 0 else 0.0
-                )
-                
-                # Create CallMetrics record
-                call_metrics = CallMetrics(
-                    call_id=call_id,
-                    
-                    # Latency aggregates (field names match database model)
-                    ttfb_stt_avg=aggregates["ttfb_stt_avg"],
-                    latency_llm_avg=aggregates["latency_llm_avg"],
-                    ttfb_tts_avg=aggregates["ttfb_tts_avg"],
-                    eou_latency_avg=aggregates["eou_latency_avg"],
-                    
-                    ttfb_stt_min=aggregates["ttfb_stt_min"],
-                    ttfb_stt_max=aggregates["ttfb_stt_max"],
-                    latency_llm_min=aggregates["latency_llm_min"],
-                    latency_llm_max=aggregates["latency_llm_max"],
-                    ttfb_tts_min=aggregates["ttfb_tts_min"],
-                    ttfb_tts_max=aggregates["ttfb_tts_max"],
-                    eou_latency_min=aggregates["eou_latency_min"],
-                    eou_latency_max=aggregates["eou_latency_max"],
-                    
-                    # Usage metrics
-                    stt_duration_sec=stt_duration_sec,
-                    llm_input_tokens=aggregates["total_llm_input_tokens"],
-                    llm_output_tokens=aggregates["total_llm_output_tokens"],
-                    tts_characters=aggregates["total_tts_characters"],
-                    livekit_duration_sec=livekit_duration_sec,
-                    
-                    # Quality metrics
-                    turn_count=turn_count,
-                    interruption_count=interruption_count,
-                    interruption_rate=interruption_rate,
-                    sentiment_score=sentiment_score,
-                    
-                    # Outcome
-                    outcome=outcome,
-                    outcome_confidence=outcome_confidence,
-                    outcome_reason=outcome_reason
+            # Let the writer apply this call's queued turns first; other
+            # calls keep enqueuing, so don't wait for the whole queue
+            session = self._sessions.get(call_id)
+            if session is not None:
+                await session.drained.wait()
+            
+            # Take ownership of this call's session
+            session = self._sessions.pop(call_id, None)
+            state = session.agg if session is not None else None
+            turns = session.buffer if session is not None else ()
+            
+            if state is None or state.turn_count == 0:
+                logger.warning(
+                    f"No metrics found for call {call_id}",
+                    extra={"call_id": call_id_str}
                 )
+                return None
+            
+            aggregates = state.to_dict()
+            
+            # Calculate interruption rate
+            turn_count = state.turn_count
+            interruption_rate = (
+                interruption_count / turn_count if turn_count > 0 else 0.0
+            )
+            
+            # Build the CallMetrics row; the id is assigned here so the
+            # returned object matches what the flusher inserts
+            row = dict(
+                id=uuid4(),
+                call_id=call_id,
                 
-                self.db_session.add(call_metrics)
-                
-                # Create CallLog records for each turn
-                for turn in turns:
-                    call_log = CallLog(
-                        call_id=call_id,
-                        turn_index=turn.turn_number,
-                        role=turn.role,
-                        content=turn.content,
-                        state_id=turn.state_id,
-                        ttfb_stt=turn.ttfb_stt,
-                        latency_llm=turn.latency_llm,
-                        ttfb_tts=turn.ttfb_tts,
-                        eou_latency=turn.eou_latency,
-                        llm_input_tokens=turn.llm_input_tokens,
-                        llm_output_tokens=turn.llm_output_tokens,
-                        tts_characters=turn.tts_characters,
-                        created_at=turn.timestamp
-                    )
-                    self.db_session.add(call_log)
+                # Usage metrics not tracked per turn
+                stt_duration_sec=stt_duration_sec,
+                livekit_duration_sec=livekit_duration_sec,
                 
-                # Commit to database
-                await self.db_session.commit()
+                # Quality metrics
+                turn_count=turn_count,
+                interruption_count=interruption_count,
+                interruption_rate=interruption_rate,
+                sentiment_score=sentiment_score,
                 
-                # Clear buffer
-                del self._metrics_buffer[call_id_str]
+                # Outcome
+                outcome=outcome,
+                outcome_confidence=outcome_confidence,
+                outcome_reason=outcome_reason,
                 
-                logger.info(
-                    f"Finalized call metrics for {call_id}",
-                    extra={
-                        "call_id": call_id_str,
-                        "turn_count": turn_count,
-                        "outcome": outcome
-                    }
+                # Latency aggregates and token/character totals
+                **aggregates
+            )
+            call_metrics = CallMetrics(**row)
+            
+            if not session.persistent:
+                # Keyed by e.g. a room name, not calls.id: nothing to write
+                logger.warning(
+                    "Call %s has no calls.id; metrics are not persisted", call_id,
+                    extra={"call_id": call_id_str}
                 )
-                
                 return call_metrics
+            
+            # Queue for the coalescing flusher together with the CallLog
+            # rows for turns not yet flushed
+            self._finalize_buffer.append(
+                (row, [self._call_log_row(session, turn) for turn in turns])
+            )
+            for turn in turns:
+                turn.release()
+            if self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.create_task(self._flusher_loop())
+            self._finalize_ready.set()
+            if len(self._finalize_buffer) >= FINALIZE_BATCH_SIZE:
+                self._finalize_full.set()
+            
+            logger.info(
+                f"Finalized call metrics for {call_id}",
+                extra={
+                    "call_id": call_id_str,
+                    "turn_count": turn_count,
+                    "outcome": outcome
+                }
+            )
+            
+            return call_metrics
                 
         except Exception as e:
             logger.error(
@@ -235,58 +740,130 @@ class TelemetryService:
                 extra={"call_id": str(call_id)},
                 exc_info=True
             )
-            await self.db_session.rollback()
             return None
     
-    def _calculate_aggregates(self, turns: List[TurnMetrics]) -> dict:
+    async def flush_finalized(self) -> None:
         """
-        Calculate aggregate statistics from turn metrics.
+        Write all queued finalized calls in one transaction.
         
-        Args:
-            turns: List of turn metrics
+        Inserts CallMetrics and remaining CallLog rows with Core bulk
+        inserts and commits once. If the batch fails, each call is retried
+        in its own transaction so one bad row only loses that call.
+        """
+        batch, self._finalize_buffer = self._finalize_buffer, []
+        self._finalize_ready.clear()
+        self._finalize_full.clear()
+        if not batch:
+            return
         
-        Returns:
-            Dictionary with aggregated metrics
+        async with self._db_lock:
+            try:
+                await self._write_finalized(batch)
+                
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Persisted metrics for %d calls", len(batch))
+                return
+            except Exception as e:
+                await self.db_session.rollback()
+                if len(batch) == 1:
+                    logger.error(
+                        "Failed to persist call metrics for call %s: %s",
+                        batch[0][0]["call_id"], e,
+                        exc_info=True
+                    )
+                    return
+                logger.warning(
+                    "Batch insert of call metrics for %d calls failed, "
+                    "retrying per call: %s", len(batch), e
+                )
+            
+            for item in batch:
+                try:
+                    await self._write_finalized([item])
+                except Exception as e:
+                    await self.db_session.rollback()
+                    logger.error(
+                        "Failed to persist call metrics for call %s: %s",
+                        item[0]["call_id"], e,
+                        extra={"call_id": str(item[0]["call_id"])},
+                        exc_info=True
+                    )
+    
+    async def _write_finalized(self, batch: List[tuple]) -> None:
         """
-        # Collect non-None values for each metric
-        ttfb_stt_values = [t.ttfb_stt for t in turns if t.ttfb_stt is not None]
-        latency_llm_values = [t.latency_llm for t in turns if t.latency_llm is not None]
-        ttfb_tts_values = [t.ttfb_tts for t in turns if t.ttfb_tts is not None]
-        eou_latency_values = [t.eou_latency for t in turns if t.eou_latency is not None]
+        Insert CallMetrics and CallLog rows of finalized calls and commit.
         
-        # Helper function for safe aggregation
-        def safe_avg(values: List[float]) -> Optional[float]:
-            return sum(values) / len(values) if values else None
+        The caller holds _db_lock and rolls back on error.
         
-        def safe_min(values: List[float]) -> Optional[float]:
-            return min(values) if values else None
+        Args:
+            batch: (CallMetrics row, CallLog rows) per call
+        """
+        await self.db_session.execute(
+            insert(CallMetrics), [row for row, _ in batch]
+        )
+        log_rows = [r for _, rows in batch for r in rows]
+        if log_rows:
+            await self.db_session.execute(_CALL_LOG_INSERT, log_rows)
+        await self.db_session.commit()
+    
+    async def _flusher_loop(self) -> None:
+        """Flush finalized calls every FINALIZE_BATCH_SIZE calls or FINALIZE_FLUSH_INTERVAL."""
+        while True:
+            await self._finalize_ready.wait()
+            try:
+                await asyncio.wait_for(
+                    self._finalize_full.wait(), FINALIZE_FLUSH_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+            await self.flush_finalized()
+    
+    def _call_log_row(self, session: CallTelemetrySession, turn: TurnMetrics) -> dict:
+        """
+        Build CallLog column values for a single turn.
         
-        def safe_max(values: List[float]) -> Optional[float]:
-            return max(values) if values else None
+        Args:
+            session: Telemetry session of the call the turn belongs to
+            turn: Turn metrics
         
+        Returns:
+            Dictionary of call_logs column values for a Core insert
+        """
         return {
-            # Latency averages (field names match database model)
-            "ttfb_stt_avg": safe_avg(ttfb_stt_values),
-            "latency_llm_avg": safe_avg(latency_llm_values),
-            "ttfb_tts_avg": safe_avg(ttfb_tts_values),
-            "eou_latency_avg": safe_avg(eou_latency_values),
-            
-            # Latency min/max (field names match database model)
-            "ttfb_stt_min": safe_min(ttfb_stt_values),
-            "ttfb_stt_max": safe_max(ttfb_stt_values),
-            "latency_llm_min": safe_min(latency_llm_values),
-            "latency_llm_max": safe_max(latency_llm_values),
-            "ttfb_tts_min": safe_min(ttfb_tts_values),
-            "ttfb_tts_max": safe_max(ttfb_tts_values),
-            "eou_latency_min": safe_min(eou_latency_values),
-            "eou_latency_max": safe_max(eou_latency_values),
-            
-            # Token/character totals
-            "total_llm_input_tokens": sum(t.llm_input_tokens for t in turns),
-            "total_llm_output_tokens": sum(t.llm_output_tokens for t in turns),
-            "total_tts_characters": sum(t.tts_characters for t in turns),
+            "call_id": session.call_id,
+            "turn_index": turn.turn_number,
+            "role": turn.role,
+            "content": turn.content,
+            "state_id": turn.state_id,
+            "ttfb_stt": turn.ttfb_stt,
+            "latency_llm": turn.latency_llm,
+            "ttfb_tts": turn.ttfb_tts,
+            "eou_latency": turn.eou_latency,
+            "llm_input_tokens": turn.llm_input_tokens,
+            "llm_output_tokens": turn.llm_output_tokens,
+            "tts_characters": turn.tts_characters,
+            "created_at": session.wall_time(turn),
         }
     
+    def _take_call_log_rows(self, session: CallTelemetrySession) -> List[dict]:
+        """
+        Convert a session's buffered turns to CallLog rows and clear the buffer.
+        
+        The caller inserts the returned rows.
+        
+        Args:
+            session: Telemetry session whose buffer is drained in place
+        
+        Returns:
+            List of row dictionaries for a bulk insert
+        """
+        buffer = session.buffer
+        rows = [self._call_log_row(session, turn) for turn in buffer]
+        for turn in buffer:
+            turn.release()
+        buffer.clear()
+        return rows
+    
     async def get_call_metrics(self, call_id: UUID) -> Optional[CallMetrics]:
         """
         Retrieve persisted call metrics.
@@ -298,9 +875,10 @@ class TelemetryService:
             CallMetrics object if found, None otherwise
         """
         try:
-            result = await self.db_session.execute(
-                select(CallMetrics).where(CallMetrics.call_id == call_id)
-            )
+            async with self._db_lock:
+                result = await self.db_session.execute(
+                    select(CallMetrics).where(CallMetrics.call_id == call_id)
+                )
             return result.scalar_one_or_none()
         except Exception as e:
             logger.error(
@@ -321,12 +899,13 @@ class TelemetryService:
             List of CallLog objects ordered by turn_number
         """
         try:
-            result = await self.db_session.execute(
-                select(CallLog)
-                .where(CallLog.call_id == call_id)
-                .order_by(CallLog.turn_index)
-            )
-            return list(result.scalars().all())
+            async with self._db_lock:
+                result = await self.db_session.execute(
+                    select(CallLog)
+                    .where(CallLog.call_id == call_id)
+                    .order_by(CallLog.turn_index)
+                )
+                return list(result.scalars().all())
         except Exception as e:
             logger.error(
                 f"Failed to retrieve call logs: {e}",
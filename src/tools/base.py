@@ -3,7 +3,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, ClassVar, FrozenSet, Optional, List
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -37,8 +37,7 @@ class Tool(ABC):
     Базовый класс для всех tools.
     
     Каждый tool должен:
-    - Иметь уникальное имя
-    - Описывать свои параметры
+    - Объявить атрибуты класса name, description и parameters
     - Реализовать метод execute()
     """
     
@@ -52,27 +51,24 @@ class Tool(ABC):
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{self.name}")
     
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Уникальное имя tool."""
-        pass
+    def __init_subclass__(cls, **kwargs):
+        """Один раз на класс: множество обязательных параметров для validate_params."""
+        super().__init_subclass__(**kwargs)
+        parameters = getattr(cls, "parameters", None)
+        if parameters is not None:
+            cls._required = frozenset(parameters.get("required", ()))
     
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Описание что делает tool."""
-        pass
+    # Уникальное имя tool (атрибут класса: читается без создания экземпляра)
+    name: ClassVar[str]
     
-    @property
-    @abstractmethod
-    def parameters(self) -> Dict[str, Any]:
-        """
-        JSON Schema параметров tool.
-        
-        Используется для function calling в LLM.
-        """
-        pass
+    # Описание что делает tool
+    description: ClassVar[str]
+    
+    # JSON Schema параметров tool (используется для function calling в LLM)
+    parameters: ClassVar[Dict[str, Any]]
+    
+    # Обязательные параметры (из parameters["required"])
+    _required: ClassVar[FrozenSet[str]] = frozenset()
     
     @abstractmethod
     async def execute(self, **kwargs) -> ToolResult:
@@ -97,15 +93,27 @@ class Tool(ABC):
         Returns:
             True если параметры валидны
         """
-        # Базовая валидация - проверяем обязательные поля
-        required = self.parameters.get("required", [])
-        for field in required:
+        # Базовая валидация - проверяем обязательные поля (одной операцией над set)
+        if self._required.issubset(params):
+            return True
+        
+        for field in self.parameters["required"]:
             if field not in params:
-                self.logger.error(f"Missing required parameter: {field}")
-                return False
-        return True
+                self.logger.error("Missing required parameter: %s", field)
+                break
+        return False
     
-    def to_function_schema(self) -> Dict[str, Any]:
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Освободить общие ресурсы tool class (HTTP клиенты и т.п.).
+        
+        По умолчанию ничего не делает.
+        """
+        pass
+    
+    @classmethod
+    def to_function_schema(cls) -> Dict[str, Any]:
         """
         Конвертировать в OpenAI function calling schema.
         
@@ -113,9 +121,9 @@ class Tool(ABC):
             Schema для передачи в LLM
         """
         return {
-            "name": self.name,
-            "description": self.description,
-            "parameters": self.parameters
+            "name": cls.name,
+            "description": cls.description,
+            "parameters": cls.parameters
         }
 
 
@@ -129,6 +137,8 @@ class ToolRegistry:
     def __init__(self):
         """Инициализация пустого реестра."""
         self._tools: Dict[str, type[Tool]] = {}
+        # Schema не зависит от config, поэтому строится один раз при регистрации
+        self._schemas: Dict[str, Dict[str, Any]] = {}
         self.logger = logging.getLogger(__name__)
     
     def register(self, tool_class: type[Tool]) -> None:
@@ -138,14 +148,14 @@ class ToolRegistry:
         Args:
             tool_class: Класс tool для регистрации
         """
-        # Создаём временный экземпляр чтобы получить имя
-        temp_instance = tool_class({})
-        name = temp_instance.name
+        # Имя и schema - атрибуты класса, экземпляр не создаём
+        name = tool_class.name
         
         if name in self._tools:
             self.logger.warning(f"Tool '{name}' already registered, overwriting")
         
         self._tools[name] = tool_class
+        self._schemas[name] = tool_class.to_function_schema()
         self.logger.info(f"Registered tool: {name}")
     
     def get(self, name: str, config: Dict[str, Any]) -> Optional[Tool]:
@@ -161,7 +171,7 @@ class ToolRegistry:
         """
         tool_class = self._tools.get(name)
         if not tool_class:
-            self.logger.error(f"Tool '{name}' not found in registry")
+            self.logger.error("Tool '%s' not found in registry", name)
             return None
         
         try:
@@ -179,6 +189,14 @@ class ToolRegistry:
         """
         return list(self._tools.keys())
     
+    async def aclose(self) -> None:
+        """Освободить общие ресурсы всех зарегистрированных tools."""
+        for name, tool_class in self._tools.items():
+            try:
+                await tool_class.aclose()
+            except Exception as e:
+                self.logger.error(f"Failed to close tool '{name}': {e}")
+    
     def get_all_schemas(self, configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Получить schemas всех tools для LLM.
@@ -187,7 +205,7 @@ class ToolRegistry:
             configs: Список конфигураций tools из Skillbase
             
         Returns:
-            Список function schemas для OpenAI
+            Список function schemas для OpenAI (общие объекты, не изменять)
         """
         schemas = []
         
@@ -196,9 +214,11 @@ class ToolRegistry:
             if not name:
                 continue
             
-            tool = self.get(name, config.get("config", {}))
-            if tool:
-                schemas.append(tool.to_function_schema())
+            schema = self._schemas.get(name)
+            if schema is None:
+                self.logger.error("Tool '%s' not found in registry", name)
+                continue
+            schemas.append(schema)
         
         return schemas
 
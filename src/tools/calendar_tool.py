@@ -4,7 +4,9 @@ Calendar Tool - проверка доступности и бронирован
 Пример интеграции с внешним календарём.
 """
 
-from typing import Dict, Any
+import asyncio
+import weakref
+from typing import Dict, Any, ClassVar
 from datetime import datetime, timedelta
 import httpx
 
@@ -21,51 +23,70 @@ class CalendarTool(Tool):
     - book_appointment: забронировать встречу
     """
     
-    @property
-    def name(self) -> str:
-        return "calendar"
+    name = "calendar"
+    description = "Check calendar availability and book appointments"
     
-    @property
-    def description(self) -> str:
-        return "Check calendar availability and book appointments"
+    # HTTP клиент на event loop (соединения httpx привязаны к loop):
+    # keep-alive соединения переиспользуются между вызовами в рамках loop
+    _clients: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"] = (
+        weakref.WeakKeyDictionary()
+    )
     
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["check_availability", "book_appointment"],
-                    "description": "Action to perform"
-                },
-                "date": {
-                    "type": "string",
-                    "description": "Date in YYYY-MM-DD format"
-                },
-                "time": {
-                    "type": "string",
-                    "description": "Time in HH:MM format"
-                },
-                "duration_minutes": {
-                    "type": "integer",
-                    "description": "Duration in minutes (default: 60)"
-                },
-                "service": {
-                    "type": "string",
-                    "description": "Service name (for booking)"
-                },
-                "client_name": {
-                    "type": "string",
-                    "description": "Client name (for booking)"
-                },
-                "client_phone": {
-                    "type": "string",
-                    "description": "Client phone (for booking)"
-                }
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Получить (или создать) HTTP клиент текущего event loop."""
+        loop = asyncio.get_running_loop()
+        client = cls._clients.get(loop)
+        if client is None or client.is_closed:
+            client = cls._clients[loop] = httpx.AsyncClient(
+                timeout=5.0,
+                limits=httpx.Limits(max_keepalive_connections=20)
+            )
+        return client
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """Закрыть HTTP клиент текущего event loop."""
+        client = cls._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+    
+    # JSON Schema параметров (статична, не пересоздаётся на каждый вызов)
+    parameters: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["check_availability", "book_appointment"],
+                "description": "Action to perform"
+            },
+            "date": {
+                "type": "string",
+                "description": "Date in YYYY-MM-DD format"
+            },
+            "time": {
+                "type": "string",
+                "description": "Time in HH:MM format"
+            },
+            "duration_minutes": {
+                "type": "integer",
+                "description": "Duration in minutes (default: 60)"
             },
-            "required": ["action", "date", "time"]
-        }
+            "service": {
+                "type": "string",
+                "description": "Service name (for booking)"
+            },
+            "client_name": {
+                "type": "string",
+                "description": "Client name (for booking)"
+            },
+            "client_phone": {
+                "type": "string",
+                "description": "Client phone (for booking)"
+            }
+        },
+        "required": ["action", "date", "time"]
+    }
     
     async def execute(self, **kwargs) -> ToolResult:
         """
@@ -112,33 +133,31 @@ class CalendarTool(Tool):
         
         if api_url:
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        f"{api_url}/availability",
-                        params={
-                            "date": date,
-                            "time": time,
-                            "duration": duration
-                        },
-                        headers=self._get_headers(),
-                        timeout=5.0
+                response = await self._get_client().get(
+                    f"{api_url}/availability",
+                    params={
+                        "date": date,
+                        "time": time,
+                        "duration": duration
+                    },
+                    headers=self._get_headers()
+                )
+                
+                if response.status_code == 200:
+                    data = response.json()
+                    return ToolResult(
+                        status=ToolStatus.SUCCESS,
+                        data=data,
+                        message=f"Availability checked for {date} {time}"
+                    )
+                else:
+                    return ToolResult(
+                        status=ToolStatus.ERROR,
+                        error=f"API error: {response.status_code}"
                     )
-                    
-                    if response.status_code == 200:
-                        data = response.json()
-                        return ToolResult(
-                            status=ToolStatus.SUCCESS,
-                            data=data,
-                            message=f"Availability checked for {date} {time}"
-                        )
-                    else:
-                        return ToolResult(
-                            status=ToolStatus.ERROR,
-                            error=f"API error: {response.status_code}"
-                        )
             
             except Exception as e:
-                self.logger.error(f"Calendar API error: {e}")
+                self.logger.error("Calendar API error: %s", e)
                 return ToolResult(
                     status=ToolStatus.ERROR,
                     error=str(e)
@@ -180,36 +199,34 @@ class CalendarTool(Tool):
         
         if api_url:
             try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        f"{api_url}/appointments",
-                        json={
-                            "date": date,
-                            "time": time,
-                            "duration_minutes": duration,
-                            "service": service,
-                            "client_name": client_name,
-                            "client_phone": client_phone
-                        },
-                        headers=self._get_headers(),
-                        timeout=5.0
+                response = await self._get_client().post(
+                    f"{api_url}/appointments",
+                    json={
+                        "date": date,
+                        "time": time,
+                        "duration_minutes": duration,
+                        "service": service,
+                        "client_name": client_name,
+                        "client_phone": client_phone
+                    },
+                    headers=self._get_headers()
+                )
+                
+                if response.status_code in [200, 201]:
+                    data = response.json()
+                    return ToolResult(
+                        status=ToolStatus.SUCCESS,
+                        data=data,
+                        message=f"Appointment booked for {client_name} on {date} {time}"
+                    )
+                else:
+                    return ToolResult(
+                        status=ToolStatus.ERROR,
+                        error=f"API error: {response.status_code}"
                     )
-                    
-                    if response.status_code in [200, 201]:
-                        data = response.json()
-                        return ToolResult(
-                            status=ToolStatus.SUCCESS,
-                            data=data,
-                            message=f"Appointment booked for {client_name} on {date} {time}"
-                        )
-                    else:
-                        return ToolResult(
-                            status=ToolStatus.ERROR,
-                            error=f"API error: {response.status_code}"
-                        )
             
             except Exception as e:
-                self.logger.error(f"Calendar API error: {e}")
+                self.logger.error("Calendar API error: %s", e)
                 return ToolResult(
                     status=ToolStatus.ERROR,
                     error=str(e)
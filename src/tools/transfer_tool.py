@@ -4,7 +4,7 @@ Transfer Tool - перевод звонка на оператора.
 Интеграция с LiveKit для transfer calls.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, ClassVar
 
 from .base import Tool, ToolResult, ToolStatus, register_tool
 
@@ -19,36 +19,30 @@ class TransferTool(Tool):
     - transfer_to_department: перевести в отдел
     """
     
-    @property
-    def name(self) -> str:
-        return "transfer"
+    name = "transfer"
+    description = "Transfer call to operator or department"
     
-    @property
-    def description(self) -> str:
-        return "Transfer call to operator or department"
-    
-    @property
-    def parameters(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "target": {
-                    "type": "string",
-                    "enum": ["operator", "sales", "support", "manager"],
-                    "description": "Transfer target"
-                },
-                "reason": {
-                    "type": "string",
-                    "description": "Reason for transfer"
-                },
-                "priority": {
-                    "type": "string",
-                    "enum": ["low", "normal", "high", "urgent"],
-                    "description": "Transfer priority (default: normal)"
-                }
+    # JSON Schema параметров (статична, не пересоздаётся на каждый вызов)
+    parameters: ClassVar[Dict[str, Any]] = {
+        "type": "object",
+        "properties": {
+            "target": {
+                "type": "string",
+                "enum": ["operator", "sales", "support", "manager"],
+                "description": "Transfer target"
+            },
+            "reason": {
+                "type": "string",
+                "description": "Reason for transfer"
             },
-            "required": ["target"]
-        }
+            "priority": {
+                "type": "string",
+                "enum": ["low", "normal", "high", "urgent"],
+                "description": "Transfer priority (default: normal)"
+            }
+        },
+        "required": ["target"]
+    }
     
     async def execute(self, **kwargs) -> ToolResult:
         """
@@ -75,7 +69,9 @@ class TransferTool(Tool):
         # В реальности здесь была бы интеграция с LiveKit SIP
         # Для MVP возвращаем успешный результат
         
-        self.logger.info(f"Transfer requested: target={target}, reason={reason}, priority={priority}")
+        self.logger.info(
+            "Transfer requested: target=%s, reason=%s, priority=%s", target, reason, priority
+        )
         
         # Получаем номер/SIP URI из конфига
         transfer_config = self.config.get("targets", {})
@@ -0,0 +1,482 @@
+"""
+Общая сборка AgentSession для голосовых агентов.
+
+STT (Deepgram) → LLM → TTS (Cartesia) + Silero VAD.
+Модель VAD создаётся один раз на процесс и переиспользуется всеми
+сессиями. Клиенты STT/TTS/LLM создаются на каждую задачу: плагины берут
+HTTP сессию из контекста задачи, и она закрывается вместе с задачей.
+Аудио статичных приветствий кэшируется в памяти (LRU) и на диске (PCM):
+повторный звонок, в том числе после рестарта воркера, не ждёт TTS.
+Приветствия, которые LLM генерирует на каждый звонок, передаются с
+cache=False и не кэшируются.
+prefetch_greeting() начинает синтез до session.start — TTS идёт
+параллельно с подключением сессии к комнате.
+
+Плагины LiveKit (ONNX runtime, HTTP клиенты) импортируются лениво —
+при первой сборке сессии, а не при импорте модуля агента.
+prewarm() подключается в WorkerOptions(prewarm_fnc=...): всё это
+(включая первый прогон VAD) делается при старте воркера, до звонка.
+
+install_uvloop() включает event loop policy uvloop (если он установлен);
+вызывается явно из блока __main__ агента, импорт модуля политику не меняет.
+"""
+
+import asyncio
+import hashlib
+import os
+import struct
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Tuple
+
+from livekit import rtc
+from livekit.agents import llm as lk_llm
+from livekit.agents import JobProcess
+from livekit.agents.voice import AgentSession
+
+from src.voice_agent.agent_env import AGENT_ENV
+from src.voice_agent.logging_setup import get_logger
+
+if TYPE_CHECKING:
+    from livekit.plugins import deepgram, cartesia, silero, openai
+
+# Optional: uvloop (event loop на libuv)
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
+logger = get_logger("session_factory")
+
+# Голос по умолчанию — русский
+DEFAULT_VOICE_ID = "064b17af-d36b-4bfb-b003-be07dba1b649"
+
+# Инструкции простых агентов (simple_agent, traced_agent)
+DEFAULT_INSTRUCTIONS = """Ты голосовой ассистент компании AI Prosto.
+Отвечай коротко и дружелюбно, 1-2 предложения.
+Говори на русском языке."""
+
+GROQ_MODEL = "llama-3.1-8b-instant"
+OLLAMA_MODEL = "qwen2:1.5b"
+
+# Синтезированные приветствия: (voice_id, текст) -> аудио фреймы.
+# LRU на GREETING_CACHE_SIZE записей; кэшируются только статичные тексты
+GREETING_CACHE_SIZE = 32
+_GREETING_AUDIO: "OrderedDict[Tuple[str, str], List[rtc.AudioFrame]]" = OrderedDict()
+
+# Каталог кэша приветствий на диске
+GREETING_CACHE_DIR = Path(
+    os.getenv("GREETING_CACHE_DIR", Path.home() / ".cache" / "voice_agent" / "greetings")
+)
+
+# Максимум файлов в кэше на диске; лишние удаляются по давности использования
+GREETING_CACHE_MAX_FILES = int(os.getenv("GREETING_CACHE_MAX_FILES", "256"))
+
+# Приветствия, синтез которых уже идёт (prefetch_greeting)
+_GREETING_PENDING: Dict[Tuple[str, str], "asyncio.Task[Optional[List[rtc.AudioFrame]]]"] = {}
+
+# Некэшируемые приветствия (cache=False): фоновый синтез привязан к сессии
+# и освобождается вместе с ней
+_SESSION_GREETING: "weakref.WeakKeyDictionary[AgentSession, Tuple[Tuple[str, str], asyncio.Task]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@lru_cache(maxsize=4)
+def _shared_vad(**params) -> "silero.VAD":
+    """Silero VAD (ONNX модель) — один экземпляр на процесс и набор параметров."""
+    from livekit.plugins import silero
+    vad = silero.VAD.load(**params)
+    _warm_vad(vad)
+    return vad
+
+
+def get_vad(**params) -> "silero.VAD":
+    """
+    Общий Silero VAD процесса (модель загружается и прогревается один раз).
+
+    Args:
+        **params: Параметры silero.VAD.load (min_silence_duration и т.д.)
+    """
+    return _shared_vad(**params)
+
+
+def _warm_vad(vad: "silero.VAD") -> None:
+    """
+    Прогнать VAD на тишине.
+
+    Первый вызов ONNX сессии оптимизирует граф и выбирает ядра
+    (50-200 мс) — платим это при старте, а не на первой реплике клиента.
+    """
+    try:
+        import numpy as np
+        from livekit.plugins.silero import onnx_model
+
+        model = onnx_model.OnnxModel(onnx_session=vad._onnx_session, sample_rate=16000)
+        model(np.zeros(model.window_size_samples, dtype=np.float32))
+    except Exception as e:
+        # Прогрев — оптимизация, не ошибка
+        logger.warning("VAD warmup skipped: %s", e)
+
+
+def get_stt(language: str = "ru", model: str = "nova-2") -> "deepgram.STT":
+    """
+    Deepgram STT для текущей задачи.
+
+    Не кэшируется между задачами: HTTP сессия плагина принадлежит задаче.
+    """
+    from livekit.plugins import deepgram
+    return deepgram.STT(model=model, language=language)
+
+
+def get_tts(voice_id: str = DEFAULT_VOICE_ID, language: str = "ru") -> "cartesia.TTS":
+    """
+    Cartesia TTS для текущей задачи.
+
+    Не кэшируется между задачами: HTTP сессия плагина принадлежит задаче.
+    """
+    from livekit.plugins import cartesia
+    return cartesia.TTS(
+        model="sonic-2",
+        voice=voice_id,
+        language=language,
+    )
+
+
+def get_llm(
+    model: str,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    temperature: Optional[float] = None
+) -> "openai.LLM":
+    """
+    OpenAI-совместимый LLM для текущей задачи.
+
+    Args:
+        model: Имя модели
+        base_url: URL API (None — OpenAI)
+        api_key: API ключ
+        temperature: Температура (None — по умолчанию провайдера)
+    """
+    from livekit.plugins import openai
+    kwargs = {}
+    if base_url is not None:
+        kwargs["base_url"] = base_url
+    if temperature is not None:
+        kwargs["temperature"] = temperature
+    return openai.LLM(model=model, api_key=api_key, **kwargs)
+
+
+def install_uvloop() -> bool:
+    """
+    Включить event loop policy uvloop для процесса, если uvloop установлен.
+
+    Вызывать из блока __main__ агента до cli.run_app — импорт модулей
+    не должен менять глобальную политику event loop.
+
+    Returns:
+        True если политика uvloop включена
+    """
+    if not UVLOOP_AVAILABLE:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("uvloop event loop policy installed")
+    return True
+
+
+def prewarm(proc: JobProcess) -> None:
+    """
+    Прогреть процесс воркера: импортировать плагины и загрузить VAD.
+
+    Клиенты STT/TTS/LLM здесь не создаются — они живут в рамках задачи.
+
+    Использование: WorkerOptions(entrypoint_fnc=..., prewarm_fnc=prewarm)
+    """
+    from livekit.plugins import cartesia, deepgram, openai  # noqa: F401
+    _shared_vad()
+
+
+def ollama_llm(model: str = OLLAMA_MODEL) -> "openai.LLM":
+    """LLM через локальный Ollama (OpenAI-совместимый API)."""
+    return get_llm(model, base_url="http://localhost:11434/v1", api_key="ollama")
+
+
+def warm_connections(*components) -> None:
+    """
+    Начать соединения с LLM/STT/TTS до session.start.
+
+    prewarm() плагинов открывает соединения в фоне — DNS/TLS оплачиваются
+    во время подключения к комнате, а не на первой реплике клиента.
+    Вызывать из entrypoint (нужен запущенный event loop).
+    """
+    for component in components:
+        prewarm_fnc = getattr(component, "prewarm", None)
+        if prewarm_fnc is None:
+            continue
+        try:
+            prewarm_fnc()
+        except Exception as e:
+            # Прогрев — оптимизация, не ошибка
+            logger.debug("Prewarm of %s skipped: %s", type(component).__name__, e)
+
+
+def select_llm() -> Tuple["openai.LLM", str]:
+    """
+    Выбрать LLM: Groq (USE_GROQ и есть ключ) — быстро, иначе локальный Ollama.
+
+    Returns:
+        (LLM, описание для логов)
+    """
+    if AGENT_ENV.use_groq and AGENT_ENV.groq_api_key:
+        llm = get_llm(
+            GROQ_MODEL,
+            base_url="https://api.groq.com/openai/v1",
+            api_key=AGENT_ENV.groq_api_key,
+        )
+        return llm, f"Groq ({GROQ_MODEL})"
+    return ollama_llm(), f"Ollama ({OLLAMA_MODEL})"
+
+
+def build_session(llm: lk_llm.LLM, voice_id: str = DEFAULT_VOICE_ID) -> AgentSession:
+    """
+    Создать AgentSession: русские STT/TTS задачи и общий (на процесс) VAD.
+
+    Соединения с провайдерами начинают открываться сразу (warm_connections).
+
+    Args:
+        llm: LLM для сессии
+        voice_id: ID голоса Cartesia
+    """
+    stt = get_stt("ru")
+    tts = get_tts(voice_id, "ru")
+    warm_connections(llm, stt, tts)
+    return AgentSession(
+        llm=llm,
+        stt=stt,
+        tts=tts,
+        vad=_shared_vad(),
+    )
+
+
+def _greeting_path(key: Tuple[str, str]) -> Path:
+    """Путь файла приветствия для (voice_id, текст)."""
+    digest = hashlib.blake2b("\0".join(key).encode(), digest_size=16).hexdigest()
+    return GREETING_CACHE_DIR / f"{digest}.pcm"
+
+
+def _load_greeting(key: Tuple[str, str]) -> Optional[List[rtc.AudioFrame]]:
+    """
+    Прочитать приветствие с диска.
+
+    Формат: <sample_rate, num_channels> и далее фреймы
+    <samples_per_channel> + int16 PCM.
+    """
+    path = _greeting_path(key)
+    try:
+        data = path.read_bytes()
+        # mtime — время последнего использования (для вытеснения)
+        os.utime(path)
+    except OSError:
+        return None
+    try:
+        sample_rate, num_channels = struct.unpack_from("<II", data, 0)
+        offset = 8
+        frames: List[rtc.AudioFrame] = []
+        while offset < len(data):
+            (samples,) = struct.unpack_from("<I", data, offset)
+            offset += 4
+            size = samples * num_channels * 2
+            frames.append(rtc.AudioFrame(
+                data=data[offset:offset + size],
+                sample_rate=sample_rate,
+                num_channels=num_channels,
+                samples_per_channel=samples,
+            ))
+            offset += size
+        return frames
+    except (struct.error, ValueError):
+        # Битый файл — синтезируем заново
+        return None
+
+
+def _store_greeting(key: Tuple[str, str], frames: List[rtc.AudioFrame]) -> None:
+    """Сохранить приветствие на диск (атомарно)."""
+    if not frames:
+        return
+    parts = [struct.pack("<II", frames[0].sample_rate, frames[0].num_channels)]
+    for frame in frames:
+        parts.append(struct.pack("<I", frame.samples_per_channel))
+        parts.append(bytes(frame.data))
+    path = _greeting_path(key)
+    try:
+        GREETING_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(b"".join(parts))
+        os.replace(tmp_path, path)
+        _prune_greeting_cache()
+    except OSError as e:
+        # Кэш на диске — оптимизация, не ошибка
+        logger.debug("Greeting cache write skipped: %s", e)
+
+
+def _prune_greeting_cache() -> None:
+    """Удалить давно не использованные файлы сверх GREETING_CACHE_MAX_FILES."""
+    entries = []
+    for path in GREETING_CACHE_DIR.glob("*.pcm"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    if len(entries) <= GREETING_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - GREETING_CACHE_MAX_FILES]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _cached_greeting(key: Tuple[str, str]) -> Optional[List[rtc.AudioFrame]]:
+    """Приветствие из памяти (отмечается как недавно использованное)."""
+    frames = _GREETING_AUDIO.get(key)
+    if frames is not None:
+        _GREETING_AUDIO.move_to_end(key)
+    return frames
+
+
+def _cache_greeting(key: Tuple[str, str], frames: List[rtc.AudioFrame]) -> None:
+    """Положить приветствие в память, вытеснив самые старые сверх GREETING_CACHE_SIZE."""
+    _GREETING_AUDIO[key] = frames
+    _GREETING_AUDIO.move_to_end(key)
+    while len(_GREETING_AUDIO) > GREETING_CACHE_SIZE:
+        _GREETING_AUDIO.popitem(last=False)
+
+
+async def _remember_greeting(key: Tuple[str, str], frames: List[rtc.AudioFrame]) -> None:
+    """Запомнить приветствие в памяти и на диске."""
+    _cache_greeting(key, frames)
+    await asyncio.to_thread(_store_greeting, key, frames)
+
+
+async def _replay(frames: List[rtc.AudioFrame]) -> AsyncIterator[rtc.AudioFrame]:
+    """Отдать готовые фреймы."""
+    for frame in frames:
+        yield frame
+
+
+async def _synthesize_streaming(
+    session: AgentSession,
+    key: Tuple[str, str],
+    cache: bool = True
+) -> AsyncIterator[rtc.AudioFrame]:
+    """Синтезировать текст, отдавая фреймы сразу; при cache сохранить их после успеха."""
+    frames: List[rtc.AudioFrame] = []
+    async with session.tts.synthesize(key[1]) as stream:
+        async for audio in stream:
+            frames.append(audio.frame)
+            yield audio.frame
+    if cache:
+        await _remember_greeting(key, frames)
+
+
+async def _synthesize_frames(
+    session: AgentSession,
+    key: Tuple[str, str],
+    cache: bool = True
+) -> Optional[List[rtc.AudioFrame]]:
+    """Загрузить с диска или синтезировать приветствие (в кэш при cache; None при ошибке)."""
+    try:
+        if cache:
+            frames = await asyncio.to_thread(_load_greeting, key)
+            if frames is not None:
+                _cache_greeting(key, frames)
+                return frames
+        frames = []
+        async with session.tts.synthesize(key[1]) as stream:
+            async for audio in stream:
+                frames.append(audio.frame)
+        if cache:
+            await _remember_greeting(key, frames)
+        return frames
+    except Exception as e:
+        logger.warning("Greeting prefetch failed: %s", e)
+        return None
+    finally:
+        if cache:
+            _GREETING_PENDING.pop(key, None)
+
+
+def prefetch_greeting(
+    session: AgentSession,
+    text: str,
+    voice_id: str = DEFAULT_VOICE_ID,
+    cache: bool = True
+) -> None:
+    """
+    Начать синтез приветствия в фоне (до session.start).
+
+    say_greeting затем проиграет готовые фреймы; если синтез не удался,
+    он синтезирует приветствие обычным образом.
+
+    Args:
+        session: Созданная (ещё не запущенная) сессия
+        text: Текст приветствия
+        voice_id: ID голоса, которым синтезирует session.tts
+        cache: False для приветствий, меняющихся от звонка к звонку
+            (генерируются LLM) — они не попадают в кэш в памяти и на диске
+    """
+    key = (voice_id, text)
+    if not cache:
+        _SESSION_GREETING[session] = (
+            key, asyncio.create_task(_synthesize_frames(session, key, cache=False))
+        )
+        return
+    if key in _GREETING_AUDIO or key in _GREETING_PENDING:
+        return
+    _GREETING_PENDING[key] = asyncio.create_task(_synthesize_frames(session, key))
+
+
+async def say_greeting(
+    session: AgentSession,
+    text: str,
+    voice_id: str = DEFAULT_VOICE_ID,
+    cache: bool = True
+) -> None:
+    """
+    Произнести приветствие, переиспользуя уже синтезированное аудио.
+
+    Первый звонок синтезирует приветствие как обычно (потоково) и
+    запоминает фреймы (в памяти и на диске); следующие звонки
+    проигрывают их без запроса к TTS.
+
+    Args:
+        session: Запущенная сессия
+        text: Текст приветствия
+        voice_id: ID голоса, которым синтезирует session.tts
+        cache: Как в prefetch_greeting; False — аудио не кэшируется
+    """
+    key = (voice_id, text)
+    if not cache:
+        frames = None
+        prefetched = _SESSION_GREETING.pop(session, None)
+        if prefetched is not None and prefetched[0] == key:
+            frames = await prefetched[1]
+    else:
+        frames = _cached_greeting(key)
+        pending = _GREETING_PENDING.get(key)
+        if frames is None and pending is not None:
+            frames = await pending
+        elif frames is None:
+            frames = await asyncio.to_thread(_load_greeting, key)
+            if frames is not None:
+                _cache_greeting(key, frames)
+    audio = (
+        _replay(frames) if frames is not None
+        else _synthesize_streaming(session, key, cache=cache)
+    )
+    await session.say(text, audio=audio, allow_interruptions=True)
@@ -11,11 +11,21 @@ VoiceAgent — голосовой AI-агент на базе LiveKit Agents.
 
 import os
 import asyncio
+from functools import cached_property
 from dotenv import load_dotenv
 
 from livekit import agents
 from livekit.agents import AgentSession, Agent, RoomInputOptions
-from livekit.plugins import deepgram, cartesia, silero
+
+from src.voice_agent._session_factory import (
+    get_stt,
+    get_tts,
+    get_vad,
+    install_uvloop,
+    prefetch_greeting,
+    say_greeting,
+    warm_connections,
+)
 
 # Загружаем переменные окружения
 load_dotenv()
@@ -47,8 +57,13 @@ class VoiceAgent:
         self.language = language
         self.voice_id = voice_id or self._get_default_voice(language)
         
-        # Системный промпт
-        self.system_prompt = system_prompt or self._build_default_prompt()
+        # Системный промпт (явный или строится при первом обращении)
+        self._explicit_prompt = system_prompt
+    
+    @cached_property
+    def system_prompt(self) -> str:
+        """Системный промпт: явный или по умолчанию (строится один раз)."""
+        return self._explicit_prompt or self._build_default_prompt()
     
     def _get_default_voice(self, language: str) -> str:
         """Получить голос по умолчанию для языка."""
@@ -76,24 +91,20 @@ class VoiceAgent:
         """Создать сессию агента."""
         
         # STT — Deepgram
-        stt = deepgram.STT(
-            model="nova-3",
-            language=self.language,
-        )
+        stt = get_stt(self.language, model="nova-3")
         
         # TTS — Cartesia
-        tts = cartesia.TTS(
-            model="sonic-2",
-            voice=self.voice_id,
-            language=self.language,
-        )
+        tts = get_tts(self.voice_id, self.language)
         
         # VAD — Voice Activity Detection (Silero)
-        vad = silero.VAD.load(
+        vad = get_vad(
             min_speech_duration=0.1,
             min_silence_duration=0.5,
         )
         
+        # Открываем соединения заранее
+        warm_connections(stt, tts)
+        
         # Создаём сессию
         session = AgentSession(
             stt=stt,
@@ -125,6 +136,10 @@ async def entrypoint(ctx: agents.JobContext):
     # Создаём сессию
     session = await voice_agent.create_session()
     
+    # Приветствие синтезируется, пока подключаемся и запускаем сессию
+    greeting = "Здравствуйте! Чем могу помочь?"
+    prefetch_greeting(session, greeting, voice_id=voice_agent.voice_id)
+    
     # Подключаемся к комнате
     await ctx.connect()
     
@@ -135,7 +150,7 @@ async def entrypoint(ctx: agents.JobContext):
     )
     
     # Приветствие
-    await session.say("Здравствуйте! Чем могу помочь?")
+    await say_greeting(session, greeting, voice_id=voice_agent.voice_id)
     
     # Ждём завершения
     await session.wait()
@@ -151,4 +166,5 @@ def run_agent():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     run_agent()
@@ -0,0 +1,34 @@
+"""
+Снимок переменных окружения голосовых агентов.
+
+.env и os.environ читаются один раз при импорте; entrypoint на каждом
+звонке берёт значения из AGENT_ENV, а не вызывает os.getenv заново.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@dataclass(frozen=True, slots=True)
+class AgentEnv:
+    """Настройки агента из окружения (неизменяемые)."""
+    use_groq: bool
+    groq_api_key: Optional[str]
+    openai_api_key: Optional[str]
+
+    @classmethod
+    def from_environ(cls) -> "AgentEnv":
+        """Прочитать настройки из os.environ."""
+        return cls(
+            use_groq=os.getenv("USE_GROQ", "true").lower() == "true",
+            groq_api_key=os.getenv("GROQ_API_KEY"),
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+        )
+
+
+AGENT_ENV = AgentEnv.from_environ()
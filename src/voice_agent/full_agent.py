@@ -16,18 +16,27 @@ Full Voice Agent — полная интеграция с ScenarioEngine.
 """
 
 import os
+import re
+import json
 import asyncio
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Iterator, Optional
+
+import httpx
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from livekit.agents import cli, WorkerOptions, JobContext
 from livekit.agents.voice import Agent, AgentSession
-from livekit.plugins import deepgram, cartesia, silero, openai
 
 # Импортируем ScenarioEngine
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-
 from src.scenario_engine import (
     ScenarioEngine,
     load_config,
@@ -36,31 +45,152 @@ from src.scenario_engine import (
     TurnResult,
 )
 from src.prompts.system_prompt import SYSTEM_PROMPT_BASE
+from src.voice_agent._session_factory import (
+    build_session,
+    install_uvloop,
+    ollama_llm,
+    prefetch_greeting,
+    prewarm,
+    say_greeting,
+)
+from src.voice_agent.logging_setup import get_logger
 
 load_dotenv()
 
+logger = get_logger("full_agent")
+
 
 # =============================================================================
 # LLM Provider для ScenarioEngine
 # =============================================================================
 
+# Общий HTTP клиент Ollama на процесс: keep-alive соединения переиспользуются
+# между ходами и звонками (без нового TCP handshake на каждый запрос)
+_OLLAMA_CLIENTS: dict[str, httpx.Client] = {}
+_OLLAMA_CLIENTS_LOCK = threading.Lock()
+
+
+def _get_ollama_client(base_url: str) -> httpx.Client:
+    """Получить (или создать) общий клиент для base_url."""
+    client = _OLLAMA_CLIENTS.get(base_url)
+    if client is None or client.is_closed:
+        with _OLLAMA_CLIENTS_LOCK:
+            client = _OLLAMA_CLIENTS.get(base_url)
+            if client is None or client.is_closed:
+                client = httpx.Client(
+                    base_url=base_url,
+                    timeout=httpx.Timeout(30.0, connect=2.0),
+                    limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+                )
+                _OLLAMA_CLIENTS[base_url] = client
+    return client
+
+
+# JSON для запросов/ответов Ollama: orjson (Rust) если установлен
+if ORJSON_AVAILABLE:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    _json_loads = json.loads
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _log_json(obj) -> str:
+    """Сериализовать структуру для лога одной JSON строкой."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, default=str)
+
+# Граница предложения для потоковой отдачи в TTS
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?…])\s+")
+
+
 class OllamaLLMProvider:
     """
     Ollama LLM провайдер для ScenarioEngine.
     Реализует интерфейс LLMProvider.
+    
+    ScenarioEngine синхронный, поэтому агент вызывает его через
+    asyncio.to_thread — запрос к Ollama не блокирует event loop.
     """
     
     def __init__(self, model: str = "qwen2:1.5b", base_url: str = "http://localhost:11434"):
         self.model = model
         self.base_url = base_url
-        self._client = None
     
-    def _get_client(self):
-        """Ленивая инициализация клиента."""
-        if self._client is None:
-            import httpx
-            self._client = httpx.Client(base_url=self.base_url, timeout=30.0)
-        return self._client
+    def _get_client(self) -> httpx.Client:
+        """Общий клиент с keep-alive."""
+        return _get_ollama_client(self.base_url)
+    
+    def stream(
+        self,
+        system_prompt: str,
+        messages: list[dict],
+        max_tokens: int = 150
+    ) -> Iterator[str]:
+        """
+        Потоковая генерация через Ollama: токены по мере готовности.
+        
+        Ошибки HTTP/сети пробрасываются вызывающему.
+        """
+        client = self._get_client()
+        
+        # Формируем запрос
+        ollama_messages = [{"role": "system", "content": system_prompt}]
+        ollama_messages.extend(messages)
+        
+        with client.stream(
+            "POST",
+            "/api/chat",
+            content=_json_dumps({
+                "model": self.model,
+                "messages": ollama_messages,
+                "stream": True,
+                "options": {
+                    "num_predict": max_tokens,
+                }
+            }),
+            headers=_JSON_HEADERS
+        ) as response:
+            if response.status_code != 200:
+                raise RuntimeError(f"Ошибка Ollama: {response.status_code}")
+            
+            # Ollama отдаёт NDJSON: один JSON объект на строку
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = _json_loads(line)
+                token = chunk.get("message", {}).get("content", "")
+                if token:
+                    yield token
+                if chunk.get("done"):
+                    break
+    
+    def stream_sentences(
+        self,
+        system_prompt: str,
+        messages: list[dict],
+        max_tokens: int = 150
+    ) -> Iterator[str]:
+        """
+        Потоковая генерация по предложениям.
+        
+        Каждое законченное предложение отдаётся сразу, не дожидаясь
+        конца ответа — TTS может начинать синтез параллельно с LLM.
+        """
+        try:
+            buffer = ""
+            for token in self.stream(system_prompt, messages, max_tokens):
+                buffer += token
+                *sentences, buffer = _SENTENCE_END_RE.split(buffer)
+                yield from sentences
+            if buffer.strip():
+                yield buffer
+        except Exception as e:
+            logger.error("Ошибка LLM: %s", e)
     
     def generate(
         self,
@@ -70,33 +200,9 @@ class OllamaLLMProvider:
     ) -> str:
         """Сгенерировать ответ через Ollama."""
         try:
-            client = self._get_client()
-            
-            # Формируем запрос
-            ollama_messages = [{"role": "system", "content": system_prompt}]
-            ollama_messages.extend(messages)
-            
-            response = client.post(
-                "/api/chat",
-                json={
-                    "model": self.model,
-                    "messages": ollama_messages,
-                    "stream": False,
-                    "options": {
-                        "num_predict": max_tokens,
-                    }
-                }
-            )
-            
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("message", {}).get("content", "")
-            else:
-                print(f"[LLM] Ошибка Ollama: {response.status_code}")
-                return ""
-                
+            return "".join(self.stream(system_prompt, messages, max_tokens))
         except Exception as e:
-            print(f"[LLM] Ошибка: {e}")
+            logger.error("Ошибка LLM: %s", e)
             return ""
 
 
@@ -109,38 +215,58 @@ class PromptBuilder:
     
     def __init__(self, config: ScenarioConfig):
         self.config = config
-    
-    def build_full_prompt(self, context: CallContext, current_state_goal: str = "") -> str:
-        """Собрать полный промпт."""
-        
-        prompt = SYSTEM_PROMPT_BASE
-        
-        # Добавляем информацию о компании
-        personality = self.config.personality
-        prompt += f"\n\n# ТВОЯ РОЛЬ\n"
-        prompt += f"Ты — {personality.name}, {personality.role} в компании \"{personality.company}\".\n"
         
+        # Статичная часть промпта не меняется в течение звонка —
+        # собираем её один раз (и префикс остаётся байт-в-байт одинаковым)
+        personality = config.personality
+        parts = [
+            SYSTEM_PROMPT_BASE,
+            "\n\n# ТВОЯ РОЛЬ\n",
+            f"Ты — {personality.name}, {personality.role} в компании \"{personality.company}\".\n",
+        ]
         if personality.language_style:
-            prompt += f"\nСтиль общения:\n{personality.language_style}\n"
-        
+            parts.append(f"\nСтиль общения:\n{personality.language_style}\n")
         if personality.base_system_prompt:
-            prompt += f"\n{personality.base_system_prompt}\n"
+            parts.append(f"\n{personality.base_system_prompt}\n")
+        self._static_prefix = "".join(parts)
+        
+        # Кэш готовых промптов по (этап, собранные данные, язык)
+        self._render_cached = lru_cache(maxsize=64)(self._render)
+    
+    def build_full_prompt(self, context: CallContext, current_state_goal: str = "") -> str:
+        """Собрать полный промпт."""
+        # Служебные поля (с "_") в промпт не попадают — public_data их не содержит
+        collected = tuple(context.public_data.items())
+        key = (current_state_goal, bool(context.collected_data), collected, context.language)
+        try:
+            return self._render_cached(*key)
+        except TypeError:
+            # Нехэшируемые значения — собираем без кэша
+            return self._render(*key)
+    
+    def _render(
+        self,
+        current_state_goal: str,
+        has_data: bool,
+        collected: tuple,
+        language: str
+    ) -> str:
+        """Собрать промпт: статичный префикс + динамические блоки."""
+        parts = [self._static_prefix]
         
         # Текущий этап
         if current_state_goal:
-            prompt += f"\n# ТЕКУЩАЯ ЗАДАЧА\n{current_state_goal}\n"
+            parts.append(f"\n# ТЕКУЩАЯ ЗАДАЧА\n{current_state_goal}\n")
         
         # Собранные данные
-        if context.collected_data:
-            prompt += "\n# УЖЕ ИЗВЕСТНО О КЛИЕНТЕ\n"
-            for key, value in context.collected_data.items():
-                if not key.startswith("_"):  # Пропускаем служебные поля
-                    prompt += f"- {key}: {value}\n"
+        if has_data:
+            parts.append("\n# УЖЕ ИЗВЕСТНО О КЛИЕНТЕ\n")
+            parts.extend(f"- {key}: {value}\n" for key, value in collected)
         
         # Язык
-        prompt += f"\n# ЯЗЫК\nГовори на {'русском' if context.language == 'ru' else 'английском'} языке.\n"
+        parts.append(f"\n# ЯЗЫК\nГовори на {'русском' if language == 'ru' else 'английском'} языке.\n")
         
-        return prompt
+        return "".join(parts)
 
 
 # =============================================================================
@@ -155,9 +281,9 @@ class ScenarioVoiceAgent:
     def __init__(self, config_path: str):
         # Загружаем конфигурацию
         self.config = load_config(config_path)
-        print(f"[Agent] Загружен конфиг: {self.config.bot_id}")
-        print(f"[Agent] Компания: {self.config.personality.company}")
-        print(f"[Agent] Бот: {self.config.personality.name}")
+        logger.info("Загружен конфиг: %s", self.config.bot_id)
+        logger.info("Компания: %s", self.config.personality.company)
+        logger.info("Бот: %s", self.config.personality.name)
         
         # Создаём ScenarioEngine
         self.engine = ScenarioEngine(self.config)
@@ -169,6 +295,9 @@ class ScenarioVoiceAgent:
         # Построитель промптов
         self.prompt_builder = PromptBuilder(self.config)
         
+        # Индекс этапов по id (поиск за O(1) на каждом ходе)
+        self._states_by_id = {state.id: state for state in self.config.states}
+        
         # Состояние
         self.call_id: Optional[str] = None
         self.session: Optional[AgentSession] = None
@@ -181,11 +310,7 @@ class ScenarioVoiceAgent:
         context = self.engine.get_context()
         
         # Получаем текущий этап
-        current_state = None
-        for state in self.config.states:
-            if state.id == context.current_state_id:
-                current_state = state
-                break
+        current_state = self._states_by_id.get(context.current_state_id)
         
         goal = current_state.goal if current_state else ""
         
@@ -194,9 +319,10 @@ class ScenarioVoiceAgent:
     async def start_call(self, call_id: str) -> str:
         """Начать звонок."""
         self.call_id = call_id
-        greeting = self.engine.start_call(call_id)
-        print(f"[Agent] Звонок начат: {call_id}")
-        print(f"[Agent] Приветствие: {greeting}")
+        # Движок синхронный (LLM запрос) — выполняем вне event loop
+        greeting = await asyncio.to_thread(self.engine.start_call, call_id)
+        logger.info("Звонок начат: %s", call_id)
+        logger.info("Приветствие: %s", greeting)
         return greeting
     
     async def process_user_input(self, user_text: str) -> str:
@@ -204,19 +330,19 @@ class ScenarioVoiceAgent:
         if not self.engine.is_call_active():
             return "Звонок не активен."
         
-        print(f"[Agent] Пользователь: {user_text}")
+        logger.info("Пользователь: %s", user_text)
         
         # Обрабатываем через ScenarioEngine
-        result: TurnResult = self.engine.process_turn(user_text)
+        result: TurnResult = await asyncio.to_thread(self.engine.process_turn, user_text)
         
-        print(f"[Agent] Этап: {result.current_state_id}")
-        print(f"[Agent] Ответ: {result.response}")
+        logger.info("Этап: %s", result.current_state_id)
+        logger.info("Ответ: %s", result.response)
         
         if result.collected_in_turn:
-            print(f"[Agent] Собрано: {result.collected_in_turn}")
+            logger.info("Собрано: %s", _log_json(result.collected_in_turn))
         
         if result.should_end:
-            print(f"[Agent] Завершение: {result.outcome}")
+            logger.info("Завершение: %s", result.outcome)
             await self.end_call(result.outcome or "completed")
         
         return result.response
@@ -225,10 +351,10 @@ class ScenarioVoiceAgent:
         """Завершить звонок."""
         if self.engine.is_call_active():
             result = self.engine.end_call(reason)
-            print(f"[Agent] Звонок завершён")
-            print(f"[Agent] Outcome: {result.outcome}")
-            print(f"[Agent] Собранные данные: {result.collected_data}")
-            print(f"[Agent] Длительность: {result.duration_sec} сек")
+            logger.info("Звонок завершён")
+            logger.info("Outcome: %s", result.outcome)
+            logger.info("Собранные данные: %s", _log_json(result.collected_data))
+            logger.info("Длительность: %s сек", result.duration_sec)
             return result
         return None
 
@@ -250,14 +376,14 @@ async def entrypoint(ctx: JobContext):
     global AGENT
     
     await ctx.connect()
-    print(f"[Agent] Подключен к комнате: {ctx.room.name}")
+    logger.info("Подключен к комнате: %s", ctx.room.name)
     
     # Создаём агента со сценарием
     try:
         AGENT = ScenarioVoiceAgent(CONFIG_PATH)
     except Exception as e:
-        print(f"[Agent] Ошибка загрузки конфига: {e}")
-        print(f"[Agent] Использую базовый режим")
+        logger.error("Ошибка загрузки конфига: %s", e)
+        logger.warning("Использую базовый режим")
         AGENT = None
     
     # Получаем промпт
@@ -269,37 +395,29 @@ async def entrypoint(ctx: JobContext):
     # Создаём LiveKit агента
     agent = Agent(instructions=initial_prompt)
     
-    # Ollama LLM для LiveKit
-    llm = openai.LLM(
-        model="qwen2:1.5b",
-        base_url="http://localhost:11434/v1",
-        api_key="ollama",
-    )
+    # Создаём сессию (Ollama LLM)
+    session = build_session(ollama_llm())
     
-    # Создаём сессию
-    session = AgentSession(
-        llm=llm,
-        stt=deepgram.STT(model="nova-2", language="ru"),
-        tts=cartesia.TTS(
-            model="sonic-2",
-            voice="064b17af-d36b-4bfb-b003-be07dba1b649",
-            language="ru",
-        ),
-        vad=silero.VAD.load(),
-    )
+    # Начинаем звонок в ScenarioEngine; приветствие синтезируется,
+    # пока сессия подключается к комнате
+    # Приветствие ScenarioEngine генерирует LLM заново на каждый звонок —
+    # его аудио не кэшируем
+    if AGENT:
+        greeting = await AGENT.start_call(ctx.room.name)
+        cache_greeting = False
+    else:
+        greeting = "Здравствуйте! Чем могу помочь?"
+        cache_greeting = True
+    prefetch_greeting(session, greeting, cache=cache_greeting)
     
     # Запускаем
     await session.start(agent, room=ctx.room)
     
-    # Начинаем звонок в ScenarioEngine
-    if AGENT:
-        greeting = await AGENT.start_call(ctx.room.name)
-        await session.say(greeting)
-    else:
-        await session.say("Здравствуйте! Чем могу помочь?")
+    await say_greeting(session, greeting, cache=cache_greeting)
     
-    print("[Agent] Агент запущен, ожидаю голос...")
+    logger.info("Агент запущен, ожидаю голос...")
 
 
 if __name__ == "__main__":
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
+    install_uvloop()
+    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
@@ -0,0 +1,55 @@
+"""
+Неблокирующее логирование для голосовых агентов.
+
+Записи кладутся в очередь (QueueHandler), а вывод в stderr делает
+фоновый поток QueueListener — event loop не ждёт write(2) на каждом ходе.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+# Корневой логгер агентов (не пропагирует в root, чтобы не дублировать вывод)
+AGENT_LOGGER_NAME = "voice_agent"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_queue_logging(level: int = logging.INFO) -> None:
+    """Подключить QueueHandler → QueueListener (один раз на процесс)."""
+    global _listener
+    if _listener is not None:
+        return
+
+    agent_logger = logging.getLogger(AGENT_LOGGER_NAME)
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in agent_logger.handlers):
+        # Уже настроено (модуль импортирован и как src.voice_agent, и как voice_agent)
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    agent_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    agent_logger.setLevel(level)
+    agent_logger.propagate = False
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Получить логгер агента с неблокирующим выводом.
+
+    Args:
+        name: Короткое имя модуля (например "full_agent")
+    """
+    setup_queue_logging()
+    return logging.getLogger(f"{AGENT_LOGGER_NAME}.{name}")
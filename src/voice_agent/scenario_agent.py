@@ -10,37 +10,44 @@ Voice Agent с поддержкой сценариев.
 """
 
 import os
-import yaml
 from dotenv import load_dotenv
 
 from livekit.agents import cli, WorkerOptions, JobContext
-from livekit.agents.voice import Agent, AgentSession
-from livekit.plugins import deepgram, cartesia, silero, openai
+from livekit.agents.voice import Agent
 
 # Импортируем систему промптов
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from src.prompts import build_full_prompt
+from src.voice_agent.scenario_loader import load_yaml_cached
+from src.voice_agent._session_factory import (
+    build_session,
+    install_uvloop,
+    ollama_llm,
+    prefetch_greeting,
+    prewarm,
+    say_greeting,
+)
+from src.voice_agent.logging_setup import get_logger
 
 load_dotenv()
 
+logger = get_logger("scenario_agent")
+
 
 def load_scenario(scenario_path: str) -> dict:
-    """Загружает сценарий из YAML файла."""
-    with open(scenario_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    """Загружает сценарий из YAML файла (с кэшем)."""
+    return load_yaml_cached(scenario_path)
 
 
 # Загружаем сценарий
 SCENARIO_PATH = os.getenv("SCENARIO", "examples/scenarios/salon_scenario.yaml")
-print(f"[Agent] Загружаю сценарий: {SCENARIO_PATH}")
+logger.info("Загружаю сценарий: %s", SCENARIO_PATH)
 
 try:
     SCENARIO = load_scenario(SCENARIO_PATH)
     FULL_PROMPT = build_full_prompt(SCENARIO)
-    print(f"[Agent] Сценарий загружен: {SCENARIO.get('company_name', 'Unknown')}")
+    logger.info("Сценарий загружен: %s", SCENARIO.get('company_name', 'Unknown'))
 except FileNotFoundError:
-    print(f"[Agent] Сценарий не найден: {SCENARIO_PATH}, использую базовый")
+    logger.warning("Сценарий не найден: %s, использую базовый", SCENARIO_PATH)
     SCENARIO = {
         "company_name": "AI Prosto",
         "bot_name": "Ассистент",
@@ -54,41 +61,28 @@ async def entrypoint(ctx: JobContext):
     """Точка входа агента."""
     
     await ctx.connect()
-    print(f"[Agent] Подключен к комнате: {ctx.room.name}")
-    print(f"[Agent] Компания: {SCENARIO.get('company_name')}")
-    print(f"[Agent] Бот: {SCENARIO.get('bot_name')}")
+    logger.info("Подключен к комнате: %s", ctx.room.name)
+    logger.info("Компания: %s", SCENARIO.get('company_name'))
+    logger.info("Бот: %s", SCENARIO.get('bot_name'))
     
     # Создаём агента с полным промптом
     agent = Agent(instructions=FULL_PROMPT)
     
-    # Ollama LLM
-    llm = openai.LLM(
-        model="qwen2:1.5b",
-        base_url="http://localhost:11434/v1",
-        api_key="ollama",
-    )
+    # Создаём сессию (Ollama LLM)
+    session = build_session(ollama_llm())
     
-    # Создаём сессию
-    session = AgentSession(
-        llm=llm,
-        stt=deepgram.STT(model="nova-2", language="ru"),
-        tts=cartesia.TTS(
-            model="sonic-2",
-            voice="064b17af-d36b-4bfb-b003-be07dba1b649",
-            language="ru",
-        ),
-        vad=silero.VAD.load(),
-    )
+    # Приветствие из сценария (синтез параллельно с запуском сессии)
+    greeting = SCENARIO.get("greeting", "Здравствуйте!")
+    prefetch_greeting(session, greeting)
     
     # Запускаем
     await session.start(agent, room=ctx.room)
     
-    # Приветствие из сценария
-    greeting = SCENARIO.get("greeting", "Здравствуйте!")
-    await session.say(greeting)
+    await say_greeting(session, greeting)
     
-    print("[Agent] Агент запущен, ожидаю голос...")
+    logger.info("Агент запущен, ожидаю голос...")
 
 
 if __name__ == "__main__":
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
+    install_uvloop()
+    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
@@ -0,0 +1,70 @@
+"""
+Загрузка YAML сценариев с кэшированием.
+
+- Парсинг через libyaml (CSafeLoader), если PyYAML собран с ним
+- Кэш в памяти процесса по (путь, mtime)
+- Кэш на диске (pickle) — воркеры LiveKit при старте не парсят YAML заново
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Каталог кэша разобранных сценариев
+SCENARIO_CACHE_DIR = Path(
+    os.getenv("SCENARIO_CACHE_DIR", Path.home() / ".cache" / "voice_agent")
+)
+
+# Кэш в памяти: (абсолютный путь, mtime_ns) -> сценарий
+_MEMORY_CACHE: Dict[Tuple[str, int], dict] = {}
+
+
+def load_yaml_cached(path: str) -> dict:
+    """
+    Загрузить YAML файл с кэшированием.
+
+    Кэш инвалидируется при изменении файла (mtime). Возвращаемый
+    словарь общий для всех вызовов — не изменять.
+
+    Raises:
+        FileNotFoundError: Если файл не найден
+    """
+    path = os.path.abspath(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    key = (path, mtime_ns)
+
+    data = _MEMORY_CACHE.get(key)
+    if data is not None:
+        return data
+
+    digest = hashlib.blake2b(f"{path}:{mtime_ns}".encode(), digest_size=16).hexdigest()
+    cache_file = SCENARIO_CACHE_DIR / f"{digest}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            data = pickle.load(f)
+    except Exception:
+        # Нет кэша (или он битый) — парсим YAML
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.load(f, Loader=SafeLoader)
+        try:
+            SCENARIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # Кэш на диске — оптимизация, не ошибка
+            pass
+
+    _MEMORY_CACHE[key] = data
+    return data
@@ -15,18 +15,30 @@ Voice Agent с интеграцией Scenario Engine.
 """
 
 import os
-import yaml
 from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 
 from livekit.agents import cli, WorkerOptions, JobContext
-from livekit.agents.voice import Agent, AgentSession
-from livekit.plugins import deepgram, cartesia, silero, openai
+from livekit.agents.voice import Agent
+
+from src.voice_agent.scenario_loader import load_yaml_cached
+from src.voice_agent._session_factory import (
+    DEFAULT_VOICE_ID,
+    build_session,
+    install_uvloop,
+    ollama_llm,
+    prefetch_greeting,
+    prewarm,
+    say_greeting,
+)
+from src.voice_agent.logging_setup import get_logger
 
 # Загружаем переменные окружения
 load_dotenv()
 
+logger = get_logger("scenario_voice_agent")
+
 # Путь к сценарию (по умолчанию — салон)
 SCENARIO_PATH = os.getenv("SCENARIO_PATH", "examples/scenarios/salon_scenario.yaml")
 
@@ -36,11 +48,10 @@ def load_scenario(path: str) -> dict:
     scenario_file = Path(path)
     
     if not scenario_file.exists():
-        print(f"[Warning] Сценарий не найден: {path}, использую дефолтный")
+        logger.warning("Сценарий не найден: %s, использую дефолтный", path)
         return get_default_scenario()
     
-    with open(scenario_file, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return load_yaml_cached(path)
 
 
 def get_default_scenario() -> dict:
@@ -54,14 +65,8 @@ def get_default_scenario() -> dict:
     }
 
 
-def build_instructions(scenario: dict) -> str:
-    """
-    Построить инструкции для агента из сценария.
-    
-    Это главный промпт, который определяет поведение бота.
-    """
-    
-    instructions = """# КТО ТЫ
+# Статичные части инструкций — константы модуля, не собираются на каждый вызов
+_INSTRUCTIONS_HEADER = """# КТО ТЫ
 Ты — голосовой ассистент, который отвечает на звонки.
 Говори как живой человек, а не как робот.
 
@@ -79,58 +84,54 @@ def build_instructions(scenario: dict) -> str:
 - Извиняться слишком часто
 
 """
+
+_INSTRUCTIONS_FOOTER = """# ЯЗЫК
+- Говори на русском языке
+- Используй "вы" по умолчанию
+"""
+
+
+def build_instructions(scenario: dict) -> str:
+    """
+    Построить инструкции для агента из сценария.
+    
+    Это главный промпт, который определяет поведение бота.
+    """
+    parts = [_INSTRUCTIONS_HEADER]
     
     # Компания и имя
     company = scenario.get("company_name", "Компания")
     bot_name = scenario.get("bot_name", "Ассистент")
-    
-    instructions += f"""# ТВОЯ РОЛЬ
-Ты работаешь в компании "{company}".
-Тебя зовут {bot_name}.
-
-"""
+    parts.append(
+        f"# ТВОЯ РОЛЬ\nТы работаешь в компании \"{company}\".\nТебя зовут {bot_name}.\n\n"
+    )
     
     # Описание компании
     if "company_description" in scenario:
-        instructions += f"""# О КОМПАНИИ
-{scenario['company_description']}
-
-"""
+        parts.append(f"# О КОМПАНИИ\n{scenario['company_description']}\n\n")
     
     # Цель
     if "goal" in scenario:
-        instructions += f"""# ТВОЯ ЗАДАЧА
-{scenario['goal']}
-
-"""
+        parts.append(f"# ТВОЯ ЗАДАЧА\n{scenario['goal']}\n\n")
     
     # Что собирать
     if scenario.get("fields_to_collect"):
-        instructions += "# ЧТО НУЖНО УЗНАТЬ\n"
-        instructions += "Постепенно узнай у клиента:\n"
+        parts.append("# ЧТО НУЖНО УЗНАТЬ\nПостепенно узнай у клиента:\n")
         for field in scenario["fields_to_collect"]:
             if isinstance(field, dict):
-                name = field.get("name", "")
-                desc = field.get("description", "")
-                instructions += f"- {name}: {desc}\n"
+                parts.append(f"- {field.get('name', '')}: {field.get('description', '')}\n")
             else:
-                instructions += f"- {field}\n"
-        instructions += "\nСпрашивай по одному пункту за раз!\n\n"
+                parts.append(f"- {field}\n")
+        parts.append("\nСпрашивай по одному пункту за раз!\n\n")
     
     # Дополнительные инструкции
     if "additional_instructions" in scenario:
-        instructions += f"""# ДОПОЛНИТЕЛЬНО
-{scenario['additional_instructions']}
-
-"""
+        parts.append(f"# ДОПОЛНИТЕЛЬНО\n{scenario['additional_instructions']}\n\n")
     
     # Язык
-    instructions += """# ЯЗЫК
-- Говори на русском языке
-- Используй "вы" по умолчанию
-"""
+    parts.append(_INSTRUCTIONS_FOOTER)
     
-    return instructions
+    return "".join(parts)
 
 
 async def entrypoint(ctx: JobContext):
@@ -139,11 +140,11 @@ async def entrypoint(ctx: JobContext):
     # Подключаемся к комнате
     await ctx.connect()
     
-    print(f"[Agent] Подключен к комнате: {ctx.room.name}")
+    logger.info("Подключен к комнате: %s", ctx.room.name)
     
     # Загружаем сценарий
     scenario = load_scenario(SCENARIO_PATH)
-    print(f"[Agent] Загружен сценарий: {scenario.get('company_name', 'Unknown')}")
+    logger.info("Загружен сценарий: %s", scenario.get('company_name', 'Unknown'))
     
     # Строим инструкции
     instructions = build_instructions(scenario)
@@ -151,41 +152,25 @@ async def entrypoint(ctx: JobContext):
     # Создаём агента
     agent = Agent(instructions=instructions)
     
-    # LLM через Ollama
-    llm = openai.LLM(
-        model="qwen2:1.5b",
-        base_url="http://localhost:11434/v1",
-        api_key="ollama",
-    )
-    
     # Голос — русский
-    voice_id = scenario.get("voice_id", "064b17af-d36b-4bfb-b003-be07dba1b649")
-    
-    # Создаём сессию
-    session = AgentSession(
-        llm=llm,
-        stt=deepgram.STT(
-            model="nova-2",
-            language="ru",
-        ),
-        tts=cartesia.TTS(
-            model="sonic-2",
-            voice=voice_id,
-            language="ru",
-        ),
-        vad=silero.VAD.load(),
-    )
+    voice_id = scenario.get("voice_id", DEFAULT_VOICE_ID)
+    
+    # Создаём сессию (LLM через Ollama)
+    session = build_session(ollama_llm(), voice_id=voice_id)
+    
+    # Приветствие из сценария (синтез параллельно с запуском сессии)
+    greeting = scenario.get("greeting", "Здравствуйте! Чем могу помочь?")
+    prefetch_greeting(session, greeting, voice_id=voice_id)
     
     # Запускаем
     await session.start(agent, room=ctx.room)
     
-    # Приветствие из сценария
-    greeting = scenario.get("greeting", "Здравствуйте! Чем могу помочь?")
-    await session.say(greeting)
+    await say_greeting(session, greeting, voice_id=voice_id)
     
-    print(f"[Agent] Приветствие: {greeting}")
-    print("[Agent] Агент запущен, ожидаю голос...")
+    logger.info("Приветствие: %s", greeting)
+    logger.info("Агент запущен, ожидаю голос...")
 
 
 if __name__ == "__main__":
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
+    install_uvloop()
+    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
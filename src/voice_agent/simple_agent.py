@@ -5,14 +5,21 @@
     python -m src.voice_agent.simple_agent dev
 """
 
-import os
-from dotenv import load_dotenv
-
 from livekit.agents import cli, WorkerOptions, JobContext
-from livekit.agents.voice import Agent, AgentSession
-from livekit.plugins import deepgram, cartesia, silero, openai
+from livekit.agents.voice import Agent
+
+from src.voice_agent._session_factory import (
+    DEFAULT_INSTRUCTIONS,
+    build_session,
+    install_uvloop,
+    prefetch_greeting,
+    prewarm,
+    say_greeting,
+    select_llm,
+)
+from src.voice_agent.logging_setup import get_logger
 
-load_dotenv()
+logger = get_logger("simple_agent")
 
 
 async def entrypoint(ctx: JobContext):
@@ -21,61 +28,34 @@ async def entrypoint(ctx: JobContext):
     # Подключаемся к комнате
     await ctx.connect()
     
-    print(f"[Agent] Подключен к комнате: {ctx.room.name}")
+    logger.info("Подключен к комнате: %s", ctx.room.name)
     
     # Создаём агента с инструкциями
-    agent = Agent(
-        instructions="""Ты голосовой ассистент компании AI Prosto.
-Отвечай коротко и дружелюбно, 1-2 предложения.
-Говори на русском языке.""",
-    )
+    agent = Agent(instructions=DEFAULT_INSTRUCTIONS)
     
     # Выбор LLM: Groq (быстро) или Ollama (локально)
-    use_groq = os.getenv("USE_GROQ", "true").lower() == "true"
-    
-    if use_groq and os.getenv("GROQ_API_KEY"):
-        # Groq — очень быстрый, ~300ms latency
-        llm = openai.LLM(
-            model="llama-3.1-8b-instant",  # Быстрая модель
-            base_url="https://api.groq.com/openai/v1",
-            api_key=os.getenv("GROQ_API_KEY"),
-        )
-        print("[Agent] Используем Groq LLM (fast)")
-    else:
-        # Ollama — локально, медленнее
-        llm = openai.LLM(
-            model="qwen2:1.5b",
-            base_url="http://localhost:11434/v1",
-            api_key="ollama",
-        )
-        print("[Agent] Используем Ollama LLM (local)")
+    llm, llm_name = select_llm()
+    logger.info("Используем LLM: %s", llm_name)
     
     # Создаём сессию
-    session = AgentSession(
-        llm=llm,
-        stt=deepgram.STT(
-            model="nova-2",
-            language="ru",
-        ),
-        tts=cartesia.TTS(
-            model="sonic-2",
-            voice="064b17af-d36b-4bfb-b003-be07dba1b649",
-            language="ru",
-        ),
-        vad=silero.VAD.load(),
-    )
+    session = build_session(llm)
+    
+    # Приветствие синтезируется, пока сессия подключается
+    greeting = "Здравствуйте! Чем могу помочь?"
+    prefetch_greeting(session, greeting)
     
     # Запускаем сессию
     await session.start(agent, room=ctx.room)
     
-    # Приветствие
-    await session.say("Здравствуйте! Чем могу помочь?")
+    await say_greeting(session, greeting)
     
-    print("[Agent] Агент запущен, ожидаю голос...")
+    logger.info("Агент запущен, ожидаю голос...")
 
 
 if __name__ == "__main__":
+    install_uvloop()
     cli.run_app(WorkerOptions(
         entrypoint_fnc=entrypoint,
+        prewarm_fnc=prewarm,
         agent_name="voice-agent"  # Имя агента для LiveKit Dispatch Rule
     ))
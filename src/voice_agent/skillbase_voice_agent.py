@@ -17,13 +17,13 @@ Voice Agent с загрузкой конфигурации из Skillbase (БД)
 
 import os
 import asyncio
+import logging
 from uuid import UUID
-from typing import Optional
+from typing import NamedTuple, Optional
 from dotenv import load_dotenv
 
 from livekit.agents import cli, WorkerOptions, JobContext
 from livekit.agents.voice import Agent, AgentSession
-from livekit.plugins import deepgram, cartesia, silero, openai
 
 # Наши модули
 import sys
@@ -35,24 +35,60 @@ from services.skillbase_service import SkillbaseService
 from schemas.skillbase_schemas import SkillbaseConfig
 from prompts.skillbase_prompt_builder import build_prompt_from_skillbase
 from adapters.skillbase_to_scenario import convert_skillbase_to_scenario
+from tools.base import get_registry
 from scenario_engine.engine import ScenarioEngine
+from scenario_engine.models import ScenarioConfig
+from voice_agent.agent_env import AGENT_ENV
+from voice_agent._session_factory import (
+    get_llm,
+    get_stt,
+    get_tts,
+    get_vad,
+    install_uvloop,
+    prefetch_greeting,
+    say_greeting,
+    warm_connections,
+)
+from voice_agent.logging_setup import get_logger
 
 # Загружаем переменные окружения
 load_dotenv()
 
+logger = get_logger("skillbase_voice_agent")
+
 # Skillbase ID из переменной окружения
 SKILLBASE_ID = os.getenv("SKILLBASE_ID")
 
 
-async def load_skillbase_config(skillbase_id: UUID) -> tuple[SkillbaseConfig, str, ScenarioEngine, list]:
+class _CachedSkillbase(NamedTuple):
+    """Разобранный Skillbase (всё, что не зависит от конкретного звонка)."""
+    version: int
+    config: SkillbaseConfig
+    company_name: str
+    scenario_config: ScenarioConfig
+    tools: list
+    instructions: str
+
+
+# Кэш Skillbase по id; инвалидируется при смене версии
+_SKILLBASE_CACHE: dict[UUID, _CachedSkillbase] = {}
+
+
+async def load_skillbase_config(
+    skillbase_id: UUID
+) -> tuple[SkillbaseConfig, str, ScenarioEngine, list, str]:
     """
     Загрузить Skillbase из БД и создать ScenarioEngine + Tools.
     
+    Разобранный конфиг кэшируется по (id, version): на повторных звонках
+    читается только версия, без валидации, конвертации и сборки промпта.
+    ScenarioEngine создаётся на каждый звонок (он хранит состояние звонка).
+    
     Args:
         skillbase_id: UUID Skillbase
         
     Returns:
-        Tuple (SkillbaseConfig, company_name, ScenarioEngine, tools)
+        Tuple (SkillbaseConfig, company_name, ScenarioEngine, tools, instructions)
         
     Raises:
         ValueError: Если Skillbase не найден
@@ -60,40 +96,91 @@ async def load_skillbase_config(skillbase_id: UUID) -> tuple[SkillbaseConfig, st
     async with get_async_db() as db:
         service = SkillbaseService(db)
         
-        # Загружаем Skillbase с eager loading (company, knowledge_base)
-        skillbase = await service.get_by_id(skillbase_id, eager_load=True)
-        
-        if not skillbase:
+        version = await service.get_version(skillbase_id)
+        if version is None:
             raise ValueError(f"Skillbase {skillbase_id} не найден")
         
-        # Валидируем и парсим config
-        config = SkillbaseConfig(**skillbase.config)
-        
-        # Получаем название компании
-        company_name = skillbase.company.name if skillbase.company else "Компания"
-        
-        # Конвертируем Skillbase config → ScenarioEngine config + Tools
-        scenario_config, tools = convert_skillbase_to_scenario(
-            config,
-            str(skillbase.id),
-            company_name
+        cached = _SKILLBASE_CACHE.get(skillbase_id)
+        if cached is None or cached.version != version:
+            cached = await _load_skillbase(service, skillbase_id)
+            _SKILLBASE_CACHE[skillbase_id] = cached
+        else:
+            logger.debug("Skillbase из кэша: v%s", cached.version)
+    
+    engine = ScenarioEngine(cached.scenario_config)
+    return cached.config, cached.company_name, engine, cached.tools, cached.instructions
+
+
+async def _load_skillbase(service: SkillbaseService, skillbase_id: UUID) -> _CachedSkillbase:
+    """Полная загрузка: запрос с relations, валидация, конвертация, промпт."""
+    # Загружаем Skillbase с eager loading (company, knowledge_base)
+    skillbase = await service.get_by_id(skillbase_id, load_relations=True)
+    
+    if not skillbase:
+        raise ValueError(f"Skillbase {skillbase_id} не найден")
+    
+    # Валидируем и парсим config
+    config = SkillbaseConfig.model_validate(skillbase.config)
+    
+    # Получаем название компании
+    company_name = skillbase.company.name if skillbase.company else "Компания"
+    
+    # Конвертируем Skillbase config → ScenarioEngine config + Tools
+    scenario_config, tools = convert_skillbase_to_scenario(
+        config,
+        str(skillbase.id),
+        company_name
+    )
+    
+    # Системный промпт кэшируется вместе с конфигом (строится один раз на версию)
+    instructions = build_prompt_from_skillbase(config, company_name)
+    
+    logger.info("Skillbase загружен: %s (v%s), компания: %s", skillbase.name, skillbase.version, company_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("LLM: %s/%s", config.llm.provider, config.llm.model)
+        logger.debug("TTS: %s, STT: %s", config.voice.tts_provider, config.voice.stt_provider)
+        logger.debug(
+            "ScenarioEngine: %d states, %d transitions",
+            len(scenario_config.states),
+            len(scenario_config.transitions)
         )
-        
-        # Создаём ScenarioEngine
-        engine = ScenarioEngine(scenario_config)
-        
-        print(f"[Skillbase] Загружен: {skillbase.name} (v{skillbase.version})")
-        print(f"[Skillbase] Компания: {company_name}")
-        print(f"[Skillbase] LLM: {config.llm.provider}/{config.llm.model}")
-        print(f"[Skillbase] TTS: {config.voice.tts_provider}")
-        print(f"[Skillbase] STT: {config.voice.stt_provider}")
-        print(f"[ScenarioEngine] States: {len(scenario_config.states)}")
-        print(f"[ScenarioEngine] Transitions: {len(scenario_config.transitions)}")
-        print(f"[Tools] Loaded: {len(tools)} tools")
+        logger.debug("Tools: %d", len(tools))
         for tool in tools:
-            print(f"  - {tool.name}: {tool.description}")
-        
-        return config, company_name, engine, tools
+            logger.debug("  - %s: %s", tool.name, tool.description)
+    
+    return _CachedSkillbase(
+        version=skillbase.version,
+        config=config,
+        company_name=company_name,
+        scenario_config=scenario_config,
+        tools=tools,
+        instructions=instructions,
+    )
+
+
+# Фабрики провайдеров по имени (одна проверка словаря вместо цепочки if)
+_LLM_FACTORIES = {
+    # Groq через OpenAI-совместимый API
+    "groq": lambda config: get_llm(
+        config.llm.model,
+        base_url="https://api.groq.com/openai/v1",
+        api_key=AGENT_ENV.groq_api_key,
+        temperature=config.llm.temperature,
+    ),
+    "openai": lambda config: get_llm(
+        config.llm.model,
+        api_key=AGENT_ENV.openai_api_key,
+        temperature=config.llm.temperature,
+    ),
+}
+
+_STT_FACTORIES = {
+    "deepgram": lambda config: get_stt(config.voice.stt_language or "ru"),
+}
+
+_TTS_FACTORIES = {
+    "cartesia": lambda config: get_tts(config.voice.tts_voice_id, config.voice.stt_language or "ru"),
+}
 
 
 def create_llm_from_config(config: SkillbaseConfig):
@@ -106,22 +193,10 @@ def create_llm_from_config(config: SkillbaseConfig):
     Returns:
         LLM instance
     """
-    if config.llm.provider == "groq":
-        # Groq через OpenAI-совместимый API
-        return openai.LLM(
-            model=config.llm.model,
-            base_url="https://api.groq.com/openai/v1",
-            api_key=os.getenv("GROQ_API_KEY"),
-            temperature=config.llm.temperature,
-        )
-    elif config.llm.provider == "openai":
-        return openai.LLM(
-            model=config.llm.model,
-            api_key=os.getenv("OPENAI_API_KEY"),
-            temperature=config.llm.temperature,
-        )
-    else:
+    factory = _LLM_FACTORIES.get(config.llm.provider)
+    if factory is None:
         raise ValueError(f"Неподдерживаемый LLM провайдер: {config.llm.provider}")
+    return factory(config)
 
 
 def create_stt_from_config(config: SkillbaseConfig):
@@ -134,13 +209,10 @@ def create_stt_from_config(config: SkillbaseConfig):
     Returns:
         STT instance
     """
-    if config.voice.stt_provider == "deepgram":
-        return deepgram.STT(
-            model="nova-2",
-            language=config.voice.stt_language or "ru",
-        )
-    else:
+    factory = _STT_FACTORIES.get(config.voice.stt_provider)
+    if factory is None:
         raise ValueError(f"Неподдерживаемый STT провайдер: {config.voice.stt_provider}")
+    return factory(config)
 
 
 def create_tts_from_config(config: SkillbaseConfig):
@@ -153,14 +225,10 @@ def create_tts_from_config(config: SkillbaseConfig):
     Returns:
         TTS instance
     """
-    if config.voice.tts_provider == "cartesia":
-        return cartesia.TTS(
-            model="sonic-2",
-            voice=config.voice.tts_voice_id,
-            language=config.voice.stt_language or "ru",
-        )
-    else:
+    factory = _TTS_FACTORIES.get(config.voice.tts_provider)
+    if factory is None:
         raise ValueError(f"Неподдерживаемый TTS провайдер: {config.voice.tts_provider}")
+    return factory(config)
 
 
 async def entrypoint(ctx: JobContext):
@@ -168,33 +236,41 @@ async def entrypoint(ctx: JobContext):
     
     # Проверяем, что SKILLBASE_ID указан
     if not SKILLBASE_ID:
-        print("[ERROR] SKILLBASE_ID не указан в переменных окружения!")
-        print("Использование: SKILLBASE_ID=<uuid> python -m src.voice_agent.skillbase_voice_agent dev")
+        logger.error(
+            "SKILLBASE_ID не указан в переменных окружения! "
+            "Использование: SKILLBASE_ID=<uuid> python -m src.voice_agent.skillbase_voice_agent dev"
+        )
         return
     
     try:
         skillbase_id = UUID(SKILLBASE_ID)
     except ValueError:
-        print(f"[ERROR] Неверный формат SKILLBASE_ID: {SKILLBASE_ID}")
+        logger.error("Неверный формат SKILLBASE_ID: %s", SKILLBASE_ID)
         return
     
+    # Загружаем Skillbase из БД параллельно с подключением к комнате:
+    # запрос к пулу соединений не ждёт WebRTC handshake
+    load_task = asyncio.create_task(load_skillbase_config(skillbase_id))
+    
     # Подключаемся к комнате
-    await ctx.connect()
-    print(f"[Agent] Подключен к комнате: {ctx.room.name}")
+    try:
+        await ctx.connect()
+    except BaseException:
+        load_task.cancel()
+        raise
+    logger.info("Подключен к комнате: %s", ctx.room.name)
+    
+    # HTTP клиенты tools привязаны к event loop задачи — закрываем их с задачей
+    ctx.add_shutdown_callback(get_registry().aclose)
     
-    # Загружаем Skillbase из БД и создаём ScenarioEngine + Tools
+    # Skillbase, ScenarioEngine + Tools
     try:
-        config, company_name, engine, tools = await load_skillbase_config(skillbase_id)
-    except Exception as e:
-        print(f"[ERROR] Не удалось загрузить Skillbase: {e}")
-        import traceback
-        traceback.print_exc()
+        config, company_name, engine, tools, instructions = await load_task
+    except Exception:
+        logger.exception("Не удалось загрузить Skillbase")
         return
     
-    # Строим system prompt из конфигурации
-    instructions = build_prompt_from_skillbase(config, company_name)
-    
-    print(f"[Agent] System prompt построен ({len(instructions)} символов)")
+    logger.debug("System prompt построен (%d символов)", len(instructions))
     
     # Создаём агента
     agent = Agent(instructions=instructions)
@@ -204,37 +280,44 @@ async def entrypoint(ctx: JobContext):
         llm = create_llm_from_config(config)
         stt = create_stt_from_config(config)
         tts = create_tts_from_config(config)
-    except Exception as e:
-        print(f"[ERROR] Не удалось создать провайдеры: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Не удалось создать провайдеры")
         return
     
+    # Открываем соединения заранее
+    warm_connections(llm, stt, tts)
+    
     # Создаём сессию
     session = AgentSession(
         llm=llm,
         stt=stt,
         tts=tts,
-        vad=silero.VAD.load(),
+        vad=get_vad(),
     )
     
-    # Запускаем
-    await session.start(agent, room=ctx.room)
-    
-    # Начинаем звонок через ScenarioEngine
+    # Начинаем звонок через ScenarioEngine; приветствие синтезируется,
+    # пока сессия подключается к комнате. Его генерирует LLM на каждый
+    # звонок, поэтому аудио не кэшируется
     call_id = ctx.room.name
     greeting = engine.start_call(call_id, direction="inbound")
+    voice_id = config.voice.tts_voice_id
+    prefetch_greeting(session, greeting, voice_id=voice_id, cache=False)
+    
+    # Запускаем
+    await session.start(agent, room=ctx.room)
     
     # Отправляем приветствие
-    await session.say(greeting)
+    await say_greeting(session, greeting, voice_id=voice_id, cache=False)
     
-    print(f"[Agent] Приветствие: {greeting}")
-    print("[Agent] Агент запущен, ожидаю голос...")
-    print(f"[ScenarioEngine] Текущий этап: {engine.get_context().current_state_id}")
+    logger.info("Агент запущен, ожидаю голос...")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Приветствие: %s", greeting)
+        logger.debug("Текущий этап: %s", engine.get_context().current_state_id)
     
     # TODO: Интегрировать обработку реплик через engine.process_turn()
     # Пока работает через стандартный Agent loop
 
 
 if __name__ == "__main__":
+    install_uvloop()
     cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
@@ -9,17 +9,31 @@ Smart Voice Agent — интеграция с системой промптов
 """
 
 import os
-import yaml
-import json
+from collections import deque
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 
 from livekit.agents import cli, WorkerOptions, JobContext
 from livekit.agents.voice import Agent, AgentSession
-from livekit.plugins import deepgram, cartesia, silero, openai
+
+from src.voice_agent._session_factory import (
+    get_stt,
+    get_tts,
+    get_vad,
+    install_uvloop,
+    ollama_llm,
+    prefetch_greeting,
+    say_greeting,
+    warm_connections,
+)
+from src.voice_agent.logging_setup import get_logger
+from src.voice_agent.scenario_loader import load_yaml_cached
 
 load_dotenv()
 
+logger = get_logger("smart_agent")
+
 # =============================================================================
 # Системный промпт
 # =============================================================================
@@ -94,55 +108,67 @@ SYSTEM_PROMPT_BASE = """
 # Сборка промпта
 # =============================================================================
 
-def build_prompt(scenario: dict, collected_data: dict) -> str:
-    """Собирает полный промпт из базового + сценария + собранных данных."""
+def _scenario_parts(scenario: dict) -> list[str]:
+    """Части промпта: базовый + сценарий клиента (без собранных данных)."""
     
-    prompt = SYSTEM_PROMPT_BASE
+    parts = [SYSTEM_PROMPT_BASE]
     
     # Добавляем сценарий клиента
-    prompt += "\n\n# ТВОЙ СЦЕНАРИЙ\n\n"
+    parts.append("\n\n# ТВОЙ СЦЕНАРИЙ\n\n")
     
     # Компания
     if "company_name" in scenario:
-        prompt += f"## Компания\nТы работаешь в компании \"{scenario['company_name']}\".\n"
+        parts.append(f"## Компания\nТы работаешь в компании \"{scenario['company_name']}\".\n")
     
     if "company_description" in scenario:
-        prompt += f"{scenario['company_description']}\n"
+        parts.append(f"{scenario['company_description']}\n")
     
     # Имя бота
     if "bot_name" in scenario:
-        prompt += f"\n## Твоё имя\nТебя зовут {scenario['bot_name']}.\n"
+        parts.append(f"\n## Твоё имя\nТебя зовут {scenario['bot_name']}.\n")
     
     # Цель
     if "goal" in scenario:
-        prompt += f"\n## Цель разговора\n{scenario['goal']}\n"
+        parts.append(f"\n## Цель разговора\n{scenario['goal']}\n")
     
     # Что нужно собрать
     if "fields_to_collect" in scenario:
-        prompt += "\n## Информация для сбора\nТебе нужно узнать у клиента:\n"
+        parts.append("\n## Информация для сбора\nТебе нужно узнать у клиента:\n")
         for field in scenario["fields_to_collect"]:
             if isinstance(field, dict):
                 field_name = field.get("name", "")
                 field_desc = field.get("description", "")
-                prompt += f"- {field_name}"
-                if field_desc:
-                    prompt += f" ({field_desc})"
+                parts.append(f"- {field_name} ({field_desc})\n" if field_desc else f"- {field_name}\n")
             else:
-                prompt += f"- {field}"
-            prompt += "\n"
+                parts.append(f"- {field}\n")
     
     # Дополнительные инструкции
     if "additional_instructions" in scenario:
-        prompt += f"\n## Дополнительно\n{scenario['additional_instructions']}\n"
+        parts.append(f"\n## Дополнительно\n{scenario['additional_instructions']}\n")
+    
+    return parts
+
+
+@lru_cache(maxsize=128)
+def _render_collected(items: tuple) -> str:
+    """Секция собранных данных (items — кортеж пар ключ/значение)."""
+    parts = [
+        "\n## Уже собранные данные\n",
+        "Эту информацию ты уже узнал, не спрашивай повторно:\n",
+    ]
+    parts.extend(f"- {key}: {value}\n" for key, value in items)
+    return "".join(parts)
+
+
+def build_prompt(scenario: dict, collected_data: dict) -> str:
+    """Собирает полный промпт из базового + сценария + собранных данных."""
+    parts = _scenario_parts(scenario)
     
     # Собранные данные
     if collected_data:
-        prompt += "\n## Уже собранные данные\n"
-        prompt += "Эту информацию ты уже узнал, не спрашивай повторно:\n"
-        for key, value in collected_data.items():
-            prompt += f"- {key}: {value}\n"
+        parts.append(_render_collected(tuple(collected_data.items())))
     
-    return prompt
+    return "".join(parts)
 
 
 # =============================================================================
@@ -150,12 +176,11 @@ def build_prompt(scenario: dict, collected_data: dict) -> str:
 # =============================================================================
 
 def load_scenario(path: str) -> dict:
-    """Загружает сценарий из YAML файла."""
+    """Загружает сценарий из YAML файла (libyaml + кэш на диске)."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+        return load_yaml_cached(path)
     except FileNotFoundError:
-        print(f"[Agent] Сценарий не найден: {path}")
+        logger.warning("Сценарий не найден: %s", path)
         return {}
 
 
@@ -163,13 +188,25 @@ def load_scenario(path: str) -> dict:
 # Класс для отслеживания данных
 # =============================================================================
 
+# Сколько последних сообщений хранит трекер
+MAX_TURNS = int(os.getenv("MAX_TURNS", "40"))
+
+
 class ConversationTracker:
     """Отслеживает собранные данные во время разговора."""
     
     def __init__(self, fields_to_collect: list):
         self.fields_to_collect = fields_to_collect
         self.collected_data = {}
-        self.messages = []
+        # Последние MAX_TURNS сообщений: старые вытесняются автоматически
+        self.messages = deque(maxlen=MAX_TURNS)
+        
+        # Имя поля -> описание; несобранные имена ведём живым множеством
+        self._field_index = {
+            (f.get("name") if isinstance(f, dict) else f): f
+            for f in fields_to_collect
+        }
+        self._missing = set(self._field_index)
     
     def add_message(self, role: str, content: str):
         """Добавить сообщение в историю."""
@@ -182,20 +219,16 @@ class ConversationTracker:
     def set_field(self, field: str, value: str):
         """Установить значение поля."""
         self.collected_data[field] = value
+        self._missing.discard(field)
     
     def get_missing_fields(self) -> list:
-        """Получить список несобранных полей."""
-        collected_keys = set(self.collected_data.keys())
-        missing = []
-        for field in self.fields_to_collect:
-            field_name = field.get("name") if isinstance(field, dict) else field
-            if field_name not in collected_keys:
-                missing.append(field)
-        return missing
+        """Получить список несобранных полей (в порядке сценария)."""
+        missing = self._missing
+        return [f for name, f in self._field_index.items() if name in missing]
     
     def is_complete(self) -> bool:
         """Проверить все ли данные собраны."""
-        return len(self.get_missing_fields()) == 0
+        return not self._missing
 
 
 # =============================================================================
@@ -206,7 +239,7 @@ SCENARIO_PATH = os.getenv("SCENARIO", "examples/scenarios/salon_scenario.yaml")
 SCENARIO = load_scenario(SCENARIO_PATH)
 
 if SCENARIO:
-    print(f"[Agent] Загружен сценарий: {SCENARIO.get('company_name', 'Unknown')}")
+    logger.info("Загружен сценарий: %s", SCENARIO.get('company_name', 'Unknown'))
 else:
     SCENARIO = {
         "company_name": "AI Prosto",
@@ -215,7 +248,13 @@ else:
         "greeting": "Здравствуйте! Чем могу помочь?",
         "fields_to_collect": []
     }
-    print("[Agent] Используется базовый сценарий")
+    logger.info("Используется базовый сценарий")
+
+# Промпт без собранных данных — один на процесс, а не на каждый звонок
+_BASE_PROMPT = build_prompt(SCENARIO, {})
+
+# Имена полей для логов (сценарий не меняется — считаем один раз)
+_FIELD_NAMES = [f.get('name') if isinstance(f, dict) else f for f in SCENARIO.get('fields_to_collect', [])]
 
 
 # =============================================================================
@@ -226,49 +265,45 @@ async def entrypoint(ctx: JobContext):
     """Точка входа агента."""
     
     await ctx.connect()
-    print(f"[Agent] Подключен к комнате: {ctx.room.name}")
-    print(f"[Agent] Компания: {SCENARIO.get('company_name')}")
-    print(f"[Agent] Бот: {SCENARIO.get('bot_name')}")
+    logger.info("Подключен к комнате: %s", ctx.room.name)
+    logger.debug("Компания: %s, бот: %s", SCENARIO.get('company_name'), SCENARIO.get('bot_name'))
     
     # Трекер для отслеживания данных
     tracker = ConversationTracker(SCENARIO.get("fields_to_collect", []))
     
-    # Собираем промпт
-    full_prompt = build_prompt(SCENARIO, tracker.get_collected())
+    # Собираем промпт (дописываем только собранные данные)
+    collected = tracker.get_collected()
+    full_prompt = _BASE_PROMPT
+    if collected:
+        full_prompt += _render_collected(tuple(collected.items()))
     
     # Создаём агента
     agent = Agent(instructions=full_prompt)
     
-    # Ollama LLM
-    llm = openai.LLM(
-        model="qwen2:1.5b",
-        base_url="http://localhost:11434/v1",
-        api_key="ollama",
-    )
-    
-    # Создаём сессию
+    # Создаём сессию (Ollama LLM, STT/TTS задачи, общий VAD)
+    llm, stt, tts = ollama_llm("qwen2:1.5b"), get_stt("ru"), get_tts()
+    warm_connections(llm, stt, tts)
     session = AgentSession(
         llm=llm,
-        stt=deepgram.STT(model="nova-2", language="ru"),
-        tts=cartesia.TTS(
-            model="sonic-2",
-            voice="064b17af-d36b-4bfb-b003-be07dba1b649",
-            language="ru",
-        ),
-        vad=silero.VAD.load(),
+        stt=stt,
+        tts=tts,
+        vad=get_vad(),
     )
     
+    # Приветствие (синтез параллельно с запуском сессии)
+    greeting = SCENARIO.get("greeting", "Здравствуйте!")
+    prefetch_greeting(session, greeting)
+    
     # Запускаем
     await session.start(agent, room=ctx.room)
     
-    # Приветствие
-    greeting = SCENARIO.get("greeting", "Здравствуйте!")
-    await session.say(greeting)
+    await say_greeting(session, greeting)
     
-    print("[Agent] Агент запущен, ожидаю голос...")
-    print(f"[Agent] Цель: {SCENARIO.get('goal', 'не указана')}")
-    print(f"[Agent] Нужно собрать: {[f.get('name') if isinstance(f, dict) else f for f in SCENARIO.get('fields_to_collect', [])]}")
+    logger.info("Агент запущен, ожидаю голос...")
+    logger.debug("Цель: %s", SCENARIO.get('goal', 'не указана'))
+    logger.debug("Нужно собрать: %s", _FIELD_NAMES)
 
 
 if __name__ == "__main__":
+    install_uvloop()
     cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
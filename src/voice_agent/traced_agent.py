@@ -11,92 +11,131 @@ Voice Agent с трейсингом времени.
     python -m src.voice_agent.traced_agent dev
 """
 
-import os
 import time
-from datetime import datetime
-from dotenv import load_dotenv
+from collections import deque
+from itertools import islice
+from typing import NamedTuple, Optional
 
 from livekit.agents import cli, WorkerOptions, JobContext
 from livekit.agents.voice import Agent, AgentSession
-from livekit.plugins import deepgram, cartesia, silero, openai
 
-load_dotenv()
+from src.voice_agent._session_factory import (
+    DEFAULT_INSTRUCTIONS,
+    get_stt,
+    get_tts,
+    get_vad,
+    install_uvloop,
+    prefetch_greeting,
+    say_greeting,
+    select_llm,
+    warm_connections,
+)
+
+
+class TimingEvent(NamedTuple):
+    """Событие трейса."""
+    t_ns: int  # wall clock (time.time_ns) — для вывода времени суток
+    event: str
+    duration_ms: Optional[float]
 
 
 class TimingTracker:
-    """Трекер времени для каждого этапа."""
+    """
+    Трекер времени для каждого этапа.
+    
+    На горячем пути события только записываются (time_ns + perf_counter);
+    форматирование и вывод — одной записью в stdout в конце turn.
+    """
+    
+    # Сколько последних событий хранить (трекер живёт весь процесс)
+    MAX_EVENTS = 10_000
     
     def __init__(self):
-        self.events = []
+        self.events: deque[TimingEvent] = deque(maxlen=self.MAX_EVENTS)
+        self._pending = 0
         self.turn_start = None
         self.stt_start = None
         self.llm_start = None
         self.tts_start = None
         
     def log(self, event: str, duration_ms: float = None):
-        """Логировать событие."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        """Логировать событие (вне turn — выводится сразу)."""
+        self.events.append(TimingEvent(time.time_ns(), event, duration_ms))
+        self._pending += 1
+        if self.turn_start is None:
+            self.flush()
+    
+    @staticmethod
+    def _format(entry: TimingEvent) -> str:
+        """Отформатировать событие для вывода."""
+        ts_ns, event, duration_ms = entry
+        sec, ns = divmod(ts_ns, 1_000_000_000)
+        timestamp = f"{time.strftime('%H:%M:%S', time.localtime(sec))}.{ns // 1_000_000:03d}"
         if duration_ms:
-            print(f"[{timestamp}] ⏱️  {event}: {duration_ms:.0f}ms")
-        else:
-            print(f"[{timestamp}] 📍 {event}")
-        self.events.append({
-            "time": timestamp,
-            "event": event,
-            "duration_ms": duration_ms
-        })
+            return f"[{timestamp}] ⏱️  {event}: {duration_ms:.0f}ms"
+        return f"[{timestamp}] 📍 {event}"
+    
+    def flush(self, footer: str = None):
+        """Вывести накопленные события одной записью."""
+        pending = min(self._pending, len(self.events))
+        lines = [self._format(e) for e in islice(self.events, len(self.events) - pending, None)]
+        self._pending = 0
+        if footer:
+            lines.append(footer)
+        if lines:
+            print("\n".join(lines))
     
     def start_turn(self):
         """Начало нового turn (пользователь начал говорить)."""
-        self.turn_start = time.time()
+        self.turn_start = time.perf_counter()
         self.log("USER_SPEECH_START")
     
     def end_user_speech(self):
         """Пользователь закончил говорить."""
         if self.turn_start:
-            duration = (time.time() - self.turn_start) * 1000
+            duration = (time.perf_counter() - self.turn_start) * 1000
             self.log("USER_SPEECH_END", duration)
-            self.stt_start = time.time()
+            self.stt_start = time.perf_counter()
     
     def stt_done(self, text: str):
         """STT завершён."""
         if self.stt_start:
-            duration = (time.time() - self.stt_start) * 1000
+            duration = (time.perf_counter() - self.stt_start) * 1000
             self.log(f"STT_DONE: '{text[:50]}...'", duration)
-            self.llm_start = time.time()
+            self.llm_start = time.perf_counter()
     
     def llm_first_token(self):
         """Первый токен от LLM."""
         if self.llm_start:
-            duration = (time.time() - self.llm_start) * 1000
+            duration = (time.perf_counter() - self.llm_start) * 1000
             self.log("LLM_FIRST_TOKEN (TTFT)", duration)
     
     def llm_done(self, text: str):
         """LLM завершил генерацию."""
         if self.llm_start:
-            duration = (time.time() - self.llm_start) * 1000
+            duration = (time.perf_counter() - self.llm_start) * 1000
             self.log(f"LLM_DONE: '{text[:50]}...'", duration)
-            self.tts_start = time.time()
+            self.tts_start = time.perf_counter()
     
     def tts_first_audio(self):
         """Первый аудио чанк от TTS."""
         if self.tts_start:
-            duration = (time.time() - self.tts_start) * 1000
+            duration = (time.perf_counter() - self.tts_start) * 1000
             self.log("TTS_FIRST_AUDIO", duration)
     
     def tts_done(self):
         """TTS завершён."""
         if self.tts_start:
-            duration = (time.time() - self.tts_start) * 1000
+            duration = (time.perf_counter() - self.tts_start) * 1000
             self.log("TTS_DONE", duration)
     
     def end_turn(self):
         """Конец turn (бот закончил говорить)."""
         if self.turn_start:
-            total = (time.time() - self.turn_start) * 1000
+            total = (time.perf_counter() - self.turn_start) * 1000
             self.log("TURN_COMPLETE (total)", total)
-            print("-" * 60)
             self.turn_start = None
+            self.flush(footer="-" * 60)
 
 
 tracker = TimingTracker()
@@ -107,54 +146,34 @@ async def entrypoint(ctx: JobContext):
     
     await ctx.connect()
     
-    print(f"\n{'='*60}")
-    print(f"[Agent] Подключен к комнате: {ctx.room.name}")
-    print(f"[Agent] Трейсинг времени ВКЛЮЧЁН")
-    print(f"{'='*60}\n")
-    
-    agent = Agent(
-        instructions="""Ты голосовой ассистент компании AI Prosto.
-Отвечай коротко и дружелюбно, 1-2 предложения.
-Говори на русском языке.""",
-    )
+    agent = Agent(instructions=DEFAULT_INSTRUCTIONS)
     
     # Выбор LLM
-    use_groq = os.getenv("USE_GROQ", "true").lower() == "true"
-    
-    if use_groq and os.getenv("GROQ_API_KEY"):
-        llm = openai.LLM(
-            model="llama-3.1-8b-instant",
-            base_url="https://api.groq.com/openai/v1",
-            api_key=os.getenv("GROQ_API_KEY"),
-        )
-        print("[Agent] LLM: Groq (llama-3.1-8b-instant)")
-    else:
-        llm = openai.LLM(
-            model="qwen2:1.5b",
-            base_url="http://localhost:11434/v1",
-            api_key="ollama",
-        )
-        print("[Agent] LLM: Ollama (qwen2:1.5b)")
+    llm, llm_name = select_llm()
     
     # STT
-    stt = deepgram.STT(
-        model="nova-2",
-        language="ru",
-    )
-    print("[Agent] STT: Deepgram (nova-2)")
+    stt = get_stt("ru")
     
     # TTS
-    tts = cartesia.TTS(
-        model="sonic-2",
-        voice="064b17af-d36b-4bfb-b003-be07dba1b649",
-        language="ru",
-    )
-    print("[Agent] TTS: Cartesia (sonic-2)")
+    tts = get_tts()
     
     # VAD
-    vad = silero.VAD.load()
-    print("[Agent] VAD: Silero")
-    print()
+    vad = get_vad()
+    
+    # Баннер — одной записью в stdout
+    print(
+        f"\n{'='*60}\n"
+        f"[Agent] Подключен к комнате: {ctx.room.name}\n"
+        f"[Agent] Трейсинг времени ВКЛЮЧЁН\n"
+        f"{'='*60}\n\n"
+        f"[Agent] LLM: {llm_name}\n"
+        f"[Agent] STT: Deepgram (nova-2)\n"
+        f"[Agent] TTS: Cartesia (sonic-2)\n"
+        f"[Agent] VAD: Silero\n"
+    )
+    
+    # Открываем соединения заранее
+    warm_connections(llm, stt, tts)
     
     session = AgentSession(
         llm=llm,
@@ -181,16 +200,20 @@ async def entrypoint(ctx: JobContext):
         tracker.tts_done()
         tracker.end_turn()
     
+    # Приветствие синтезируется, пока сессия подключается
+    greeting = "Здравствуйте! Чем могу помочь?"
+    prefetch_greeting(session, greeting)
+    
     await session.start(agent, room=ctx.room)
     
     tracker.log("AGENT_READY")
-    await session.say("Здравствуйте! Чем могу помочь?")
+    await say_greeting(session, greeting)
     
-    print("\n[Agent] Ожидаю голос... (смотри тайминги выше)")
-    print("-" * 60)
+    print("\n[Agent] Ожидаю голос... (смотри тайминги выше)\n" + "-" * 60)
 
 
 if __name__ == "__main__":
+    install_uvloop()
     cli.run_app(WorkerOptions(
         entrypoint_fnc=entrypoint,
         agent_name="voice-agent"
@@ -4,7 +4,7 @@ CampaignWorker - Background worker for processing outbound calling campaigns.
 This worker:
 1. Polls active campaigns for pending tasks
 2. Respects rate limits and scheduling windows
-3. Creates LiveKit rooms and dials phone numbers
+3. Dials phone numbers into LiveKit rooms
 4. Runs VoiceAgent for each call
 5. Updates task status (completed/failed/retry)
 6. Handles errors and automatic recovery
@@ -12,17 +12,44 @@ This worker:
 
 import asyncio
 import logging
-from typing import Optional, Callable, Any
-from uuid import UUID, uuid4
+import time
+from contextvars import ContextVar
+from enum import Enum
+from typing import Optional, Callable, Any, Coroutine, Dict, List, Set, Tuple
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession
-from livekit import api
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
 
-from src.database.models import CallTask, Campaign, Call
+from src.database.models import CallTask, Campaign
 from src.services.campaign_service import CampaignService
 
 logger = logging.getLogger(__name__)
 
+# NOTIFY channel fed by the call_tasks insert trigger (migration 005)
+TASKS_READY_CHANNEL = "call_tasks_ready"
+
+# Context of the call task being executed, added to every log record
+_task_ctx: ContextVar[Dict[str, Any]] = ContextVar("task_ctx", default={})
+
+
+class TaskContextFilter(logging.Filter):
+    """Copy the current task context onto log records."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.__dict__.update(_task_ctx.get())
+        return True
+
+
+logger.addFilter(TaskContextFilter())
+
+
+class PollResult(Enum):
+    """Outcome of one polling cycle; only IDLE lets the poll interval back off."""
+    SPAWNED = "spawned"
+    # Work exists but cannot start now (call slots busy or rate-limited)
+    THROTTLED = "throttled"
+    IDLE = "idle"
+
 
 class CampaignWorkerError(Exception):
     """Base exception for CampaignWorker errors."""
@@ -39,30 +66,67 @@ class CampaignWorker:
     
     def __init__(
         self,
-        db_session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession],
         livekit_url: str,
         livekit_api_key: str,
         livekit_api_secret: str,
         sip_trunk_id: Optional[str] = None,
         voice_agent_factory: Optional[Callable] = None,
-        poll_interval: float = 1.0
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        campaigns_ttl: float = 10.0,
+        max_concurrent_calls: int = 50,
+        shutdown_timeout: float = 30.0,
+        completion_batch_size: int = 50,
+        completion_flush_interval: float = 0.02,
+        allow_simulation: bool = False,
+        simulation_duration: float = 0.0
     ):
         """
         Initialize CampaignWorker.
         
         Args:
-            db_session: Async database session
+            session_factory: Async session factory; each call gets its own session.
+                Must be configured with expire_on_commit=False: polled tasks and
+                campaigns are used after the poll session commits
             livekit_url: LiveKit server URL
             livekit_api_key: LiveKit API key
             livekit_api_secret: LiveKit API secret
             sip_trunk_id: SIP trunk ID for outbound calls (optional)
-            voice_agent_factory: Factory function to create VoiceAgent instances (optional)
+            voice_agent_factory: Factory function to create VoiceAgent instances
+                (required unless allow_simulation is set)
             poll_interval: Seconds between polling cycles (default: 1.0)
+            max_poll_interval: Upper bound for the idle backoff (default: 30.0)
+            campaigns_ttl: Seconds to reuse the active campaigns list (default: 10.0)
+            max_concurrent_calls: Max calls executed at once across all campaigns (default: 50)
+            shutdown_timeout: Seconds stop() waits for active calls before cancelling them (default: 30.0)
+            completion_batch_size: Max task completions written per commit (default: 50)
+            completion_flush_interval: Seconds to collect completions into one commit (default: 0.02)
+            allow_simulation: Simulate calls when no voice_agent_factory is given (default: False)
+            simulation_duration: Seconds a simulated call lasts (default: 0.0)
+        
+        Raises:
+            CampaignWorkerError: If voice_agent_factory is missing and simulation is not allowed,
+                or session_factory expires objects on commit
         """
-        self.db_session = db_session
-        self.campaign_service = CampaignService(db_session)
+        if voice_agent_factory is None and not allow_simulation:
+            raise CampaignWorkerError(
+                "voice_agent_factory is not configured (pass allow_simulation=True for tests)"
+            )
+        if getattr(session_factory, "kw", {}).get("expire_on_commit"):
+            raise CampaignWorkerError(
+                "session_factory must be created with expire_on_commit=False"
+            )
+        
+        self.session_factory = session_factory
+        
+        # Polling runs serially on its own session; calls open short-lived ones
+        self._poll_session = session_factory()
+        self.campaign_service = CampaignService(self._poll_session)
         self.voice_agent_factory = voice_agent_factory
+        self.simulation_duration = simulation_duration
         self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
         
         # LiveKit configuration
         self.livekit_url = livekit_url
@@ -70,15 +134,56 @@ class CampaignWorker:
         self.livekit_api_secret = livekit_api_secret
         self.sip_trunk_id = sip_trunk_id
         
-        # Initialize LiveKit API client
+        # LiveKit SDK (protobuf) and aiohttp are imported on first use so that
+        # importing this module stays cheap
+        import aiohttp
+        from livekit import api
+        
+        # Initialize LiveKit API client on our own HTTP session: connections
+        # (and their TLS handshakes) are kept alive between calls of a campaign
+        self._http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                keepalive_timeout=60,
+                ttl_dns_cache=300
+            ),
+            timeout=aiohttp.ClientTimeout(total=60)
+        )
         self.livekit_api = api.LiveKitAPI(
             url=livekit_url,
             api_key=livekit_api_key,
-            api_secret=livekit_api_secret
+            api_secret=livekit_api_secret,
+            session=self._http_session
         )
         
+        self.shutdown_timeout = shutdown_timeout
+        
         self._running = False
-        self._active_tasks = set()
+        self._stopped = asyncio.Event()
+        self._main_task: Optional[asyncio.Task] = None
+        # Spawned call executions and room cleanups; drained on shutdown
+        self._tasks: Set[asyncio.Task] = set()
+        
+        # Caps concurrent calls (LiveKit rooms, SIP trunk, DB pool)
+        self._call_slots = asyncio.Semaphore(max_concurrent_calls)
+        
+        # Finished calls are persisted in batches: (task_id, call_id, outcome),
+        # None stops the flusher
+        self._completions: asyncio.Queue = asyncio.Queue()
+        self.completion_batch_size = completion_batch_size
+        self.completion_flush_interval = completion_flush_interval
+        
+        # Idle polls back off exponentially; notify() wakes the loop early
+        self._wakeup = asyncio.Event()
+        self._idle_backoff = poll_interval
+        
+        # Active campaigns change rarely; reuse the list between polls
+        self._campaigns_ttl = campaigns_ttl
+        self._campaigns_cache: Optional[Tuple[float, List[Campaign]]] = None
+        
+        # LISTEN connection (asyncpg); polling is only a safety net while it is open
+        self._listen_conn: Optional[AsyncConnection] = None
+        self._listen_driver_conn: Any = None
         
         logger.info(
             "CampaignWorker initialized",
@@ -93,30 +198,172 @@ class CampaignWorker:
         Start the campaign worker.
         
         Begins the main processing loop that polls for pending tasks
-        and executes them in the background.
+        and executes them in the background. While there is no work the
+        delay between polls doubles up to max_poll_interval; notify()
+        and NOTIFY on TASKS_READY_CHANNEL wake the loop immediately.
         """
         if self._running:
             logger.warning("CampaignWorker already running")
             return
         
         self._running = True
+        self._stopped.clear()
+        
+        # The loop runs in a task of its own so that a forced stop() cancels
+        # only the worker, not the task that awaits start()
+        main_task = self._main_task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait({main_task})
+        except asyncio.CancelledError:
+            # The caller was cancelled: take the worker down with it
+            main_task.cancel()
+            await asyncio.wait({main_task})
+            raise
+        
+        # Cancelled by stop() after shutdown_timeout; re-raise a crash
+        if not main_task.cancelled():
+            main_task.result()
+    
+    async def _run(self) -> None:
+        """Run the polling loop until stop(), then drain calls and completions."""
         logger.info("CampaignWorker started")
         
+        flusher = asyncio.create_task(self._flush_completions())
+        
         try:
+            await self._start_listener()
+            
             while self._running:
-                await self._process_pending_tasks()
-                await asyncio.sleep(self.poll_interval)
+                result = await self._process_pending_tasks()
+                if result is not PollResult.IDLE:
+                    self._idle_backoff = self.poll_interval
+                delay = self._idle_backoff
+                
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    self._wakeup.clear()
+                    self._idle_backoff = self.poll_interval
+                except asyncio.TimeoutError:
+                    if result is PollResult.IDLE:
+                        self._idle_backoff = min(
+                            self._idle_backoff * 2,
+                            self.max_poll_interval
+                        )
+            
+            # Wait for all spawned calls (and their room cleanups) to finish
+            await self._drain_tasks()
         except Exception as e:
             logger.error(f"CampaignWorker crashed: {e}", exc_info=True)
             raise
         finally:
+            # Forced shutdown or crash: cancel calls still running; room
+            # cleanups they spawn while unwinding are awaited, not cancelled
+            for task in list(self._tasks):
+                task.cancel()
+            await self._drain_tasks()
+            self._running = False
+            await self._stop_listener()
+            
+            # All calls are done - write the remaining completions
+            self._completions.put_nowait(None)
+            await flusher
+            
+            self._stopped.set()
             logger.info("CampaignWorker stopped")
     
+    def notify(self) -> None:
+        """
+        Wake the worker to poll for tasks now.
+        
+        Call after enqueuing tasks or activating a campaign so new work
+        does not wait for the idle backoff to expire.
+        """
+        self._wakeup.set()
+    
+    async def _start_listener(self) -> None:
+        """
+        LISTEN on TASKS_READY_CHANNEL so inserted tasks wake the loop.
+        
+        Requires the asyncpg driver; otherwise (or on error) the worker
+        keeps relying on polling alone.
+        """
+        engine = getattr(self.session_factory, "kw", {}).get("bind")
+        if engine is None or engine.dialect.driver != "asyncpg":
+            logger.info("LISTEN/NOTIFY not available, using polling only")
+            return
+        
+        try:
+            self._listen_conn = await engine.connect()
+            raw_conn = await self._listen_conn.get_raw_connection()
+            self._listen_driver_conn = raw_conn.driver_connection
+            await self._listen_driver_conn.add_listener(
+                TASKS_READY_CHANNEL, self._on_tasks_ready
+            )
+            logger.info(f"Listening for new tasks on {TASKS_READY_CHANNEL}")
+        except Exception as e:
+            logger.warning(f"LISTEN {TASKS_READY_CHANNEL} failed, using polling only: {e}")
+            await self._stop_listener()
+    
+    async def _stop_listener(self) -> None:
+        """Remove the NOTIFY listener and release its connection."""
+        if self._listen_conn is None:
+            return
+        
+        try:
+            if self._listen_driver_conn is not None:
+                # The connection goes back to the pool - do not leave the listener on it
+                await self._listen_driver_conn.remove_listener(
+                    TASKS_READY_CHANNEL, self._on_tasks_ready
+                )
+            await self._listen_conn.close()
+        except Exception as e:
+            logger.warning(f"Error closing LISTEN connection: {e}")
+        finally:
+            self._listen_conn = None
+            self._listen_driver_conn = None
+    
+    def _on_tasks_ready(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        """
+        asyncpg NOTIFY callback: tasks were inserted for campaign `payload`.
+        """
+        # Campaign missing from the cached list - it was (re)started since the last fetch
+        if self._campaigns_cache is not None:
+            if payload not in {str(c.id) for c in self._campaigns_cache[1]}:
+                self._campaigns_cache = None
+        self._wakeup.set()
+    
+    def notify_campaigns_changed(self) -> None:
+        """
+        Drop the cached active campaigns list and wake the worker.
+        
+        Call after a campaign is created, started, paused or resumed.
+        """
+        self._campaigns_cache = None
+        self.notify()
+    
+    async def _get_active_campaigns_cached(self) -> List[Campaign]:
+        """
+        Get active campaigns, reusing the last result for campaigns_ttl seconds.
+        
+        Returns:
+            List of Campaign objects
+        """
+        now = time.monotonic()
+        if self._campaigns_cache is not None:
+            cached_at, campaigns = self._campaigns_cache
+            if now - cached_at < self._campaigns_ttl:
+                return campaigns
+        
+        campaigns = await self.campaign_service.get_active_campaigns()
+        self._campaigns_cache = (now, campaigns)
+        return campaigns
+    
     async def stop(self) -> None:
         """
         Stop the campaign worker gracefully.
         
-        Waits for active tasks to complete before shutting down.
+        Waits up to shutdown_timeout for active tasks to complete,
+        then cancels the remaining ones.
         """
         if not self._running:
             logger.warning("CampaignWorker not running")
@@ -124,163 +371,236 @@ class CampaignWorker:
         
         logger.info("Stopping CampaignWorker...")
         self._running = False
+        self._wakeup.set()
         
-        # Wait for active tasks to complete
-        if self._active_tasks:
-            logger.info(f"Waiting for {len(self._active_tasks)} active tasks to complete...")
-            await asyncio.gather(*self._active_tasks, return_exceptions=True)
+        # Wait for the main loop to drain active tasks
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Active tasks did not finish in {self.shutdown_timeout}s, cancelling"
+            )
+            # Cancelling the main loop makes it cancel all calls
+            self._main_task.cancel()
+            await self._stopped.wait()
+        await self._poll_session.close()
         
-        # Close LiveKit API client
+        # Close LiveKit API client (it does not close a session passed in)
         try:
             await self.livekit_api.aclose()
+            await self._http_session.close()
             logger.debug("LiveKit API client closed")
         except Exception as e:
             logger.warning(f"Error closing LiveKit API client: {e}")
         
         logger.info("CampaignWorker stopped gracefully")
     
-    async def _process_pending_tasks(self) -> None:
+    async def _process_pending_tasks(self) -> PollResult:
         """
         Process pending call tasks from all active campaigns.
         
-        Polls each active campaign for the next available task
-        and spawns a background task to execute it.
+        Fetches the next available task of every active campaign
+        in one query and spawns a background task to execute each.
+        
+        Returns:
+            SPAWNED if at least one task was spawned, THROTTLED if all call
+            slots are busy or campaigns were skipped by rate limits, else IDLE
         """
+        result = PollResult.IDLE
+        
+        if self._call_slots.locked():
+            # All call slots busy - do not claim tasks we cannot run;
+            # a finishing call wakes the loop
+            return PollResult.THROTTLED
+        
         try:
             # Get all active campaigns
-            campaigns = await self.campaign_service.get_active_campaigns()
+            campaigns = await self._get_active_campaigns_cached()
             
             if not campaigns:
-                return
+                return PollResult.IDLE
+            
+            logger.debug("Processing %d active campaigns", len(campaigns))
             
-            logger.debug(f"Processing {len(campaigns)} active campaigns")
+            # Next task per campaign respecting rate limits (single round-trip)
+            tasks = await self.campaign_service.get_next_tasks_bulk(campaigns)
             
-            for campaign in campaigns:
-                # Get next task respecting rate limits
-                task = await self.campaign_service.get_next_task(campaign.id)
+            # Claim in the transaction that locked the rows, so other
+            # workers skip them until the status change is committed
+            await self.campaign_service.mark_in_progress_bulk(tasks)
+            if self.campaign_service.last_rate_limited:
+                result = PollResult.THROTTLED
+            
+            for task in tasks:
+                # Spawn background task for execution
+                self._spawn(self._run_task(task))
+                result = PollResult.SPAWNED
                 
-                if task:
-                    # Spawn background task for execution
-                    bg_task = asyncio.create_task(self._execute_task(task))
-                    self._active_tasks.add(bg_task)
-                    bg_task.add_done_callback(self._active_tasks.discard)
-                    
-                    logger.info(
-                        f"Spawned task execution for task {task.id}",
-                        extra={
-                            "task_id": str(task.id),
-                            "campaign_id": str(campaign.id),
-                            "phone_number": task.phone_number
-                        }
-                    )
+                logger.info(
+                    "Spawned task execution for task %s", task.id,
+                    extra={
+                        "task_id": str(task.id),
+                        "campaign_id": str(task.campaign_id),
+                        "phone_number": task.phone_number
+                    }
+                )
         
         except Exception as e:
             logger.error(f"Error processing pending tasks: {e}", exc_info=True)
+            # A rollback expires cached campaigns - reload them next poll
+            self._campaigns_cache = None
+        
+        return result
+    
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """
+        Start a tracked background task of the worker.
+        
+        On Python 3.12+ the task starts eagerly: it runs until its first
+        real suspension right away instead of on the next loop iteration.
+        Only the worker's own spawns do this; the loop's task factory is
+        left untouched for the rest of the process.
+        
+        Args:
+            coro: Coroutine to run; it must not raise (errors are logged inside)
+        
+        Returns:
+            The created task
+        """
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory"):
+            task = asyncio.eager_task_factory(loop, coro)
+        else:
+            task = loop.create_task(coro)
+        if not task.done():
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return task
+    
+    async def _drain_tasks(self) -> None:
+        """Wait until every spawned task, including ones spawned meanwhile, is done."""
+        while self._tasks:
+            await asyncio.wait(set(self._tasks))
+    
+    async def _run_task(self, task: CallTask) -> None:
+        """
+        Execute a task once a call slot is free.
+        
+        Runs as a background task that nothing awaits for its result, so
+        errors are logged here and never propagate (cancellation still does).
+        
+        Args:
+            task: CallTask to execute
+        """
+        try:
+            async with self._call_slots:
+                async with self.session_factory() as session:
+                    await self._execute_task(task, session)
+        except Exception as e:
+            logger.error(
+                "Unhandled error executing task %s: %s", task.id, e,
+                exc_info=True
+            )
+        finally:
+            # A call slot is free again - poll now, not after the backoff
+            self._wakeup.set()
     
-    async def _execute_task(self, task: CallTask) -> None:
+    async def _execute_task(self, task: CallTask, session: AsyncSession) -> None:
         """
         Execute a single call task.
         
-        Creates LiveKit room, dials phone number, runs VoiceAgent,
-        and updates task status based on result.
+        Creates Call record, dials phone number, runs VoiceAgent,
+        and updates task status based on result. The task must already
+        be claimed (marked in progress) by the polling loop.
         
         Args:
             task: CallTask to execute
+            session: Session used for this task only
         """
+        campaign_service = self.campaign_service.with_session(session)
         task_id = task.id
+        task_id_str = str(task_id)  # UUID formatting allocates; do it once
         phone_number = task.phone_number
         call_id = None
+        call_id_str = None
+        
+        # Tags every log record of this task (and of tasks it spawns)
+        _task_ctx.set({
+            "task_id": task_id_str,
+            "campaign_id": str(task.campaign_id),
+            "phone_number": phone_number
+        })
         
         try:
             logger.info(
-                f"Executing task {task_id}",
-                extra={
-                    "task_id": str(task_id),
-                    "phone_number": phone_number,
-                    "attempt": task.attempt_count + 1
-                }
+                "Executing task %s", task_id_str,
+                extra={"attempt": task.attempt_count}
             )
             
-            # Mark task as in progress
-            await self.campaign_service.mark_in_progress(task_id)
-            
-            # Step 1: Create LiveKit room
-            room_name = f"campaign-{task.campaign_id}-{task_id}"
-            logger.debug(f"Creating LiveKit room: {room_name}")
-            
-            room = await self.livekit_api.room.create_room(
-                api.CreateRoomRequest(name=room_name)
+            # Step 1: Create Call record
+            # (no explicit create_room: LiveKit creates the room when the
+            # SIP participant or the agent joins it by name)
+            room_name = f"campaign-{task.campaign_id}-{task_id_str}"
+            call_id = await campaign_service.start_call(
+                task_id,
+                dict(
+                    id=uuid4(),
+                    company_id=task.campaign.company_id,
+                    skillbase_id=task.campaign.skillbase_id,
+                    campaign_id=task.campaign_id,
+                    callee_number=phone_number,
+                    direction="outbound",
+                    status="initiated",
+                    livekit_room_id=room_name
+                )
             )
             
-            logger.info(
-                f"LiveKit room created: {room.name}",
-                extra={"room_name": room.name, "task_id": str(task_id)}
-            )
-            
-            # Step 2: Create Call record in database
-            call_id = uuid4()
-            call = Call(
-                id=call_id,
-                company_id=task.campaign.company_id,
-                skillbase_id=task.campaign.skillbase_id,
-                phone_number=phone_number,
-                direction="outbound",
-                status="initiated",
-                room_name=room.name
-            )
-            self.db_session.add(call)
-            await self.db_session.commit()
+            call_id_str = str(call_id)
             
             logger.info(
-                f"Call record created: {call_id}",
-                extra={"call_id": str(call_id), "task_id": str(task_id)}
+                "Call record created: %s", call_id_str,
+                extra={"call_id": call_id_str}
             )
             
-            # Step 3: Dial phone number via SIP
+            # Step 2: Dial phone number via SIP
             if self.sip_trunk_id:
-                logger.debug(f"Dialing {phone_number} via SIP trunk {self.sip_trunk_id}")
+                from livekit import api
+                
+                logger.debug("Dialing %s via SIP trunk %s", phone_number, self.sip_trunk_id)
                 
                 try:
                     participant = await self.livekit_api.sip.create_sip_participant(
                         api.CreateSIPParticipantRequest(
                             sip_trunk_id=self.sip_trunk_id,
                             sip_call_to=phone_number,
-                            room_name=room.name,
-                            participant_identity=f"caller-{task_id}",
+                            room_name=room_name,
+                            participant_identity=f"caller-{task_id_str}",
                             participant_name=task.contact_name or "Caller"
                         )
                     )
                     
                     logger.info(
-                        f"SIP participant created: {participant.participant_id}",
-                        extra={
-                            "participant_id": participant.participant_id,
-                            "phone_number": phone_number,
-                            "task_id": str(task_id)
-                        }
+                        "SIP participant created: %s", participant.participant_id,
+                        extra={"participant_id": participant.participant_id}
                     )
                 except Exception as sip_error:
                     logger.error(
                         f"Failed to create SIP participant: {sip_error}",
-                        extra={"task_id": str(task_id)},
                         exc_info=True
                     )
                     raise CampaignWorkerError(f"SIP dial failed: {sip_error}")
             else:
-                logger.warning(
-                    "No SIP trunk configured, skipping dial",
-                    extra={"task_id": str(task_id)}
-                )
+                logger.warning("No SIP trunk configured, skipping dial")
             
-            # Step 4: Run VoiceAgent (if factory provided)
+            # Step 3: Run VoiceAgent (if factory provided)
             if self.voice_agent_factory:
-                logger.debug(f"Running VoiceAgent for task {task_id}")
+                logger.debug("Running VoiceAgent for task %s", task_id_str)
                 
                 try:
                     # Create agent instance with skillbase config
                     agent = await self.voice_agent_factory(
                         skillbase_id=task.campaign.skillbase_id,
-                        room_name=room.name,
+                        room_name=room_name,
                         call_id=call_id
                     )
                     
@@ -288,11 +608,8 @@ class CampaignWorker:
                     result = await agent.run()
                     
                     logger.info(
-                        f"VoiceAgent completed for task {task_id}",
-                        extra={
-                            "task_id": str(task_id),
-                            "outcome": result.get("outcome", "unknown")
-                        }
+                        "VoiceAgent completed for task %s", task_id_str,
+                        extra={"outcome": result.get("outcome", "unknown")}
                     )
                     
                     # Extract outcome from result
@@ -301,41 +618,47 @@ class CampaignWorker:
                 except Exception as agent_error:
                     logger.error(
                         f"VoiceAgent failed: {agent_error}",
-                        extra={"task_id": str(task_id)},
                         exc_info=True
                     )
                     outcome = "agent_error"
             else:
-                logger.warning(
-                    "No VoiceAgent factory configured, simulating call",
-                    extra={"task_id": str(task_id)}
-                )
-                # Simulate call duration
-                await asyncio.sleep(5)
+                logger.warning("No VoiceAgent factory configured, simulating call")
+                if self.simulation_duration > 0:
+                    await asyncio.sleep(self.simulation_duration)
                 outcome = "success"
             
-            # Step 5: Mark task as completed
-            await self.campaign_service.mark_completed(
-                task_id=task_id,
-                call_id=call_id,
-                outcome=outcome
-            )
+            # Step 4: Mark task as completed (written in batches by the flusher)
+            self._completions.put_nowait((task_id, call_id, outcome))
             
             logger.info(
-                f"Task {task_id} completed successfully",
+                "Task %s completed successfully", task_id_str,
                 extra={
-                    "task_id": str(task_id),
-                    "call_id": str(call_id),
+                    "call_id": call_id_str,
                     "outcome": outcome
                 }
             )
         
+        except asyncio.CancelledError:
+            # Forced shutdown: return the task to the queue instead of
+            # leaving it in_progress
+            logger.warning(f"Task {task_id_str} cancelled")
+            try:
+                await campaign_service.mark_failed(
+                    task_id=task_id,
+                    error_message="Cancelled on worker shutdown"
+                )
+            except Exception as mark_error:
+                logger.error(
+                    f"Failed to mark task {task_id_str} as failed: {mark_error}",
+                    exc_info=True
+                )
+            raise
+        
         except Exception as e:
             logger.error(
-                f"Task {task_id} failed: {e}",
+                f"Task {task_id_str} failed: {e}",
                 extra={
-                    "task_id": str(task_id),
-                    "call_id": str(call_id) if call_id else None,
+                    "call_id": call_id_str,
                     "error": str(e)
                 },
                 exc_info=True
@@ -343,25 +666,101 @@ class CampaignWorker:
             
             # Mark task as failed (will retry if attempts remaining)
             try:
-                await self.campaign_service.mark_failed(
+                await campaign_service.mark_failed(
                     task_id=task_id,
                     error_message=str(e)
                 )
             except Exception as mark_error:
                 logger.error(
-                    f"Failed to mark task {task_id} as failed: {mark_error}",
+                    f"Failed to mark task {task_id_str} as failed: {mark_error}",
                     exc_info=True
                 )
         
         finally:
-            # Cleanup: close LiveKit room if created
+            # Cleanup: close LiveKit room (hangs up the SIP leg if still connected).
+            # Not awaited here so the call slot is released right away;
+            # start() still drains it on shutdown.
             if call_id:
+                self._spawn(self._safe_delete_room(room_name))
+    
+    async def _flush_completions(self) -> None:
+        """
+        Persist queued task completions in batches.
+        
+        Waits for a completion, collects more for up to
+        completion_flush_interval (at most completion_batch_size), then
+        writes them with a single commit. Stops at the None sentinel
+        after writing everything queued before it.
+        """
+        loop = asyncio.get_running_loop()
+        stopping = False
+        
+        while not stopping:
+            item = await self._completions.get()
+            if item is None:
+                break
+            
+            batch = [item]
+            deadline = loop.time() + self.completion_flush_interval
+            while len(batch) < self.completion_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
                 try:
-                    await self.livekit_api.room.delete_room(
-                        api.DeleteRoomRequest(room=room_name)
+                    item = await asyncio.wait_for(self._completions.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            await self._write_completions(batch)
+    
+    async def _write_completions(self, batch: List[Tuple[Any, Any, str]]) -> None:
+        """
+        Write a batch of completions, falling back to one task at a time.
+        
+        Args:
+            batch: (task_id, call_id, outcome) tuples
+        """
+        async with self.session_factory() as session:
+            campaign_service = self.campaign_service.with_session(session)
+            try:
+                await campaign_service.mark_completed_bulk(batch)
+                logger.debug("Persisted %d task completions", len(batch))
+                return
+            except Exception:
+                pass  # Logged by the service; retry individually below
+            
+            for task_id, call_id, outcome in batch:
+                try:
+                    await campaign_service.mark_completed(
+                        task_id=task_id,
+                        call_id=call_id,
+                        outcome=outcome
                     )
-                    logger.debug(f"LiveKit room deleted: {room_name}")
-                except Exception as cleanup_error:
-                    logger.warning(
-                        f"Failed to cleanup room {room_name}: {cleanup_error}"
+                except Exception as e:
+                    logger.error(
+                        f"Failed to mark task {task_id} as completed: {e}",
+                        exc_info=True
                     )
+    
+    async def _safe_delete_room(self, room_name: str) -> None:
+        """
+        Delete a LiveKit room, logging instead of raising on failure.
+        
+        Args:
+            room_name: Name of the room to delete
+        """
+        try:
+            from livekit import api
+            
+            await self.livekit_api.room.delete_room(
+                api.DeleteRoomRequest(room=room_name)
+            )
+            logger.debug("LiveKit room deleted: %s", room_name)
+        except Exception as cleanup_error:
+            logger.warning(
+                f"Failed to cleanup room {room_name}: {cleanup_error}"
+            )